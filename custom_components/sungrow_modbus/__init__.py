@@ -44,6 +44,7 @@ from .helpers import (
     get_controller_from_entry,
     get_controller_key,
     get_register_cache,
+    remove_controller,
     set_controller,
 )
 from .modbus_controller import ModbusController
@@ -417,12 +418,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
         # Close only this entry's controller, not all controllers
         controller = get_controller_from_entry(hass, entry)
+        registry_key = None
         controller_key = None
         if controller:
             controller.close_connection()
-            # Remove from controller registry using proper key
-            controller_key = get_controller_key(controller)
-            hass.data[DOMAIN][CONTROLLER].pop(controller_key, None)
+            # Remove from controller registry and (host, slave) index
+            registry_key = get_controller_key(controller)
+            controller_key = controller.controller_key
+            remove_controller(hass, controller)
 
         # Clean up battery controllers
         battery_controllers = hass.data[DOMAIN].get(BATTERY_CONTROLLER, {}).pop(entry.entry_id, None)
@@ -438,8 +441,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
             hass.data[DOMAIN][BATTERY_SENSORS].pop(entry.entry_id, None)
         if SWITCH_ENTITIES in hass.data[DOMAIN]:
             hass.data[DOMAIN][SWITCH_ENTITIES].pop(entry.entry_id, None)
-        if TIME_ENTITIES in hass.data[DOMAIN] and controller_key:
-            hass.data[DOMAIN][TIME_ENTITIES].pop(controller_key, None)
+        if TIME_ENTITIES in hass.data[DOMAIN] and registry_key:
+            hass.data[DOMAIN][TIME_ENTITIES].pop(registry_key, None)
 
         # Clean up cached register values for this controller
         if VALUES in hass.data[DOMAIN] and controller_key:
@@ -254,15 +254,17 @@ class BatteryController:
 
         These are typically read once at startup.
         """
-        # Read serial number (10710-10719)
-        result = await self._read_registers(10710, 10)
-        if result:
-            self.battery.serial_number = self._decode_string(result)
-
-        # Read firmware version (10720-10729)
-        result = await self._read_registers(10720, 10)
-        if result:
-            self.battery.firmware_version = self._decode_string(result)
+        # Serial number (10710-10719) and firmware version (10720-10729) are adjacent,
+        # so fetch both in a single request
+        result = await self._read_registers(10710, 20)
+        if result and len(result) >= 20:
+            self.battery.serial_number = self._decode_string(result[:10])
+            self.battery.firmware_version = self._decode_string(result[10:20])
+        else:
+            # A failed or short combined read must not cost us the serial number
+            result = await self._read_registers(10710, 10)
+            if result:
+                self.battery.serial_number = self._decode_string(result[:10])
 
         return bool(self.battery.serial_number)
 
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import threading
+from dataclasses import dataclass
 
 from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
 
@@ -9,12 +10,24 @@ from custom_components.sungrow_modbus.const import CONN_TYPE_SERIAL, CONN_TYPE_T
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class BusTiming:
+    """Inter-frame timing state shared by every controller on one connection.
+
+    Frame spacing is a property of the bus, not of a slave, so controllers
+    sharing a client (e.g. several inverters on one RS-485 line) must honour
+    a single clock.
+    """
+
+    last_request: float = 0.0  # time.monotonic() of the last request sent on the bus
+
+
 class ModbusClientManager:
     _instance = None
     _instance_lock = threading.Lock()
 
     def __init__(self):
-        # Key: connection_id (str), Value: {'client': AsyncModbusTcpClient|AsyncModbusSerialClient, 'ref_count': int, 'lock': asyncio.Lock, 'type': str}
+        # Key: connection_id (str), Value: {'client': AsyncModbusTcpClient|AsyncModbusSerialClient, 'ref_count': int, 'lock': asyncio.Lock, 'timing': BusTiming, 'type': str}
         self._clients: dict[str, dict] = {}
         # Protect dictionary operations from concurrent access
         self._clients_lock = threading.Lock()
@@ -35,7 +48,13 @@ class ModbusClientManager:
                 client = AsyncModbusTcpClient(host=host, port=port, timeout=5, retries=5)
                 # Lock is None initially; created lazily in get_client_lock() to ensure
                 # it's bound to the correct event loop when first used from async context
-                self._clients[key] = {"client": client, "ref_count": 0, "lock": None, "type": CONN_TYPE_TCP}
+                self._clients[key] = {
+                    "client": client,
+                    "ref_count": 0,
+                    "lock": None,
+                    "timing": BusTiming(),
+                    "type": CONN_TYPE_TCP,
+                }
 
             self._clients[key]["ref_count"] += 1
             _LOGGER.debug(f"TCP client ref count for {host}:{port} is now {self._clients[key]['ref_count']}")
@@ -58,6 +77,7 @@ class ModbusClientManager:
                     "client": client,
                     "ref_count": 0,
                     "lock": None,
+                    "timing": BusTiming(),
                     "type": CONN_TYPE_SERIAL,
                 }
 
@@ -100,6 +120,13 @@ class ModbusClientManager:
                 self._clients[connection_id]["lock"] = asyncio.Lock()
             return self._clients[connection_id]["lock"]
 
+    def get_bus_timing(self, connection_id: str) -> BusTiming | None:
+        """Get the inter-frame timing state shared by all users of a client connection."""
+        with self._clients_lock:
+            if connection_id not in self._clients:
+                return None
+            return self._clients[connection_id]["timing"]
+
     def release_client(self, connection_id: str):
         """Release a client and clean up if no more references."""
         with self._clients_lock:
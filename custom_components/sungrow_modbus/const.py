@@ -1,5 +1,6 @@
 DOMAIN = "sungrow_modbus"
 CONTROLLER = "modbus_controller"
+CONTROLLER_BY_HOST = "modbus_controller_by_host"  # Secondary index: (host, slave) -> [controllers]
 SLAVE = "modbus_controller_slave"
 MANUFACTURER = "Sungrow"
 
@@ -2,6 +2,7 @@ import asyncio
 import contextlib
 import logging
 import time
+from collections import deque
 from datetime import timedelta
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
@@ -43,6 +44,56 @@ SPIKE_FILTERED_REGISTERS = {
     # Add other SOC registers here if needed for different inverter types
 }
 
+# Read coalescing: adjacent or overlapping groups are fetched with one request.
+# Groups separated by a gap are never merged, since the inverter may reject
+# reads that touch undocumented registers.
+MAX_READ_BLOCK_REGISTERS = 125  # Modbus limit for a single read request
+# Polls in a row a merged read must fail while its groups read fine alone before
+# the block is split for good; a single timeout on a flaky link doesn't count
+MERGED_READ_FAILURE_LIMIT = 3
+
+
+def _plan_reads(
+    groups: list[SungrowSensorGroup], read_alone: set[SungrowSensorGroup] | frozenset = frozenset()
+) -> list[tuple[int, int, list[SungrowSensorGroup]]]:
+    """Coalesce sensor groups into as few Modbus reads as possible.
+
+    Groups are merged when they use the same register type and their ranges
+    touch or overlap. Groups with a TTL cache keep their own read so the cached
+    range stays aligned with the group.
+
+    Args:
+        groups: The sensor groups to read.
+        read_alone: Groups that must not be merged with their neighbours.
+
+    Returns:
+        A list of (start_register, count, groups) read blocks.
+    """
+    plan: list[tuple[int, int, list[SungrowSensorGroup]]] = []
+    merging: dict[bool, int] = {}  # holding flag -> index of the open block in plan
+
+    for group in sorted(groups, key=lambda g: g.start_register):
+        start = group.start_register
+        end = start + group.registrar_count
+        if group.cache_ttl is not None or group in read_alone:
+            plan.append((start, end - start, [group]))
+            continue
+
+        holding = group.is_holding or start >= 40000
+        index = merging.get(holding)
+        if index is not None:
+            block_start, block_count, block_groups = plan[index]
+            block_end = block_start + block_count
+            if start <= block_end and max(end, block_end) - block_start <= MAX_READ_BLOCK_REGISTERS:
+                block_groups.append(group)
+                plan[index] = (block_start, max(end, block_end) - block_start, block_groups)
+                continue
+
+        merging[holding] = len(plan)
+        plan.append((start, end - start, [group]))
+
+    return plan
+
 
 class DataRetrieval:
     def __init__(self, hass: HomeAssistant, controller: ModbusController, entry_id: str | None = None):
@@ -51,6 +102,10 @@ class DataRetrieval:
         self.hass = hass
         self.entry_id = entry_id
         self.poll_lock = asyncio.Lock()
+        # Blocks whose coalesced read failed while their own reads worked, with the number of polls in a row
+        # that happened; at MERGED_READ_FAILURE_LIMIT their groups move to _read_alone and are never merged again
+        self._merge_failures: dict[tuple[SungrowSensorGroup, ...], int] = {}
+        self._read_alone: set[SungrowSensorGroup] = set()
         self.connection_check = False
         self.first_poll = True
         self.poll_updating = {
@@ -124,7 +179,7 @@ class DataRetrieval:
                 if remaining:
                     _LOGGER.debug(
                         f"({self.controller.host}.{self.controller.slave}) Circuit breaker open, "
-                        f"skipping connection attempts. Retry in {remaining.total_seconds():.0f}s"
+                        f"skipping connection attempts. Retry in {remaining:.0f}s"
                     )
                 return
 
@@ -321,18 +376,20 @@ class DataRetrieval:
                 ttl_cache = get_register_cache(self.hass)
                 controller_key = self.controller.controller_key
 
-                for sensor_group in groups:
-                    start_register = sensor_group.start_register
-                    count = sensor_group.registrar_count
+                pending = deque(_plan_reads(groups, self._read_alone))
+                split_blocks: dict[SungrowSensorGroup, list[SungrowSensorGroup]] = {}
+                recovered_blocks: set[tuple[SungrowSensorGroup, ...]] = set()
+                while pending:
+                    start_register, count, batch = pending.popleft()
                     total_registrars += count
-                    total_groups += 1
+                    total_groups += len(batch)
 
                     _LOGGER.debug(
                         f"Group {start_register} starting for ({self.controller.host}.{self.controller.slave})"
                     )
 
-                    # Check TTL cache if cache_ttl is configured for this group
-                    cache_ttl = sensor_group.cache_ttl
+                    # Check TTL cache if cache_ttl is configured for this group (such groups are never merged)
+                    cache_ttl = batch[0].cache_ttl
                     if cache_ttl is not None:
                         cached_values = ttl_cache.get_range(controller_key, start_register, count)
                         if cached_values is not None:
@@ -357,13 +414,27 @@ class DataRetrieval:
                             continue  # Skip Modbus read, use cached values
 
                     # Use holding registers if explicitly marked or if register >= 40000
-                    use_holding = sensor_group.is_holding or start_register >= 40000
+                    use_holding = batch[0].is_holding or start_register >= 40000
                     values = await (
                         self.controller.async_read_holding_register(start_register, count)
                         if use_holding
                         else self.controller.async_read_input_register(start_register, count)
                     )
 
+                    if (values is None or len(values) != count) and len(batch) > 1:
+                        # Don't let one bad group take its neighbours down: retry them one by one
+                        _LOGGER.debug(
+                            f"Coalesced read {start_register} - {start_register + count - 1} failed, "
+                            f"falling back to {len(batch)} separate reads"
+                        )
+                        total_registrars -= count
+                        total_groups -= len(batch)
+                        split_blocks.update((group, batch) for group in batch)
+                        pending.extendleft(
+                            (group.start_register, group.registrar_count, [group]) for group in reversed(batch)
+                        )
+                        continue
+
                     if values is None:
                         _LOGGER.debug(
                             f"Received None for register {start_register} - {start_register + count - 1}, from ({self.controller.host}.{self.controller.slave}), skipping."
@@ -376,6 +447,12 @@ class DataRetrieval:
                         )
                         continue
 
+                    failed_block = split_blocks.pop(batch[0], None)
+                    if failed_block is not None:
+                        recovered_blocks.add(tuple(failed_block))
+                    elif len(batch) > 1:
+                        self._merge_failures.pop(tuple(batch), None)
+
                     # Store in TTL cache if cache_ttl is configured
                     if cache_ttl is not None:
                         ttl_cache.set_range(controller_key, start_register, list(values), cache_ttl)
@@ -398,11 +475,24 @@ class DataRetrieval:
                             },
                         )
 
-                    if sensor_group.poll_speed == PollSpeed.ONCE:
-                        marked_for_removal.append(sensor_group)
+                    marked_for_removal.extend(group for group in batch if group.poll_speed == PollSpeed.ONCE)
 
                     self.controller.mark_data_received()
 
+                for block in recovered_blocks:
+                    # The merged read failed but a group read fine alone; if that keeps happening the merge
+                    # itself is the problem (e.g. a register the model rejects), so stop paying for it every poll
+                    failures = self._merge_failures.get(block, 0) + 1
+                    if failures < MERGED_READ_FAILURE_LIMIT:
+                        self._merge_failures[block] = failures
+                        continue
+                    del self._merge_failures[block]
+                    _LOGGER.info(
+                        f"({self.controller.host}.{self.controller.slave}) No longer coalescing reads for "
+                        f"groups starting at {', '.join(str(group.start_register) for group in block)}"
+                    )
+                    self._read_alone.update(block)
+
                 # Remove "ONCE" poll speed groups
                 if marked_for_removal:
                     self.controller.remove_sensor_groups(marked_for_removal)
@@ -469,16 +559,20 @@ class DataRetrieval:
         if not battery_sensors:
             return
 
+        # Bucket the status sensors by stack once per poll (the snapshot also guards against mutation
+        # while awaiting reads). Diagnostic sensors are latched at setup and never stored here.
+        sensors_by_stack: dict[int, list] = {}
+        for sensor in battery_sensors:
+            sensors_by_stack.setdefault(sensor._stack_index, []).append(sensor)
+
         for battery_controller in battery_controllers:
             try:
                 # Read battery status
                 data = await battery_controller.read_status()
 
                 if data:
-                    # Update sensors for this stack (iterate over copy to avoid mutation during iteration)
-                    for sensor in list(battery_sensors):
-                        if sensor._stack_index == battery_controller.stack_index:
-                            sensor.update_from_battery_data(data)
+                    for sensor in sensors_by_stack.get(battery_controller.stack_index, ()):
+                        sensor.update_from_battery_data(data)
 
                     _LOGGER.debug(
                         "Battery stack %d: V=%.1fV, I=%.1fA, SOC=%.1f%%, T=%.1fC",
@@ -1,8 +1,10 @@
+import functools
 import logging
 import struct
 import time
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -16,6 +18,7 @@ from custom_components.sungrow_modbus.const import (
     CONN_TYPE_SERIAL,
     CONN_TYPE_TCP,
     CONTROLLER,
+    CONTROLLER_BY_HOST,
     DRIFT_COUNTER,
     REGISTER_CACHE,
     VALUES,
@@ -27,13 +30,37 @@ _LOGGER = logging.getLogger(__name__)
 CLOCK_CORRECTION_COOLDOWN = 3600  # 1 hour
 LAST_CLOCK_CORRECTION = "last_clock_correction"
 
-
-@dataclass
-class CachedValue:
-    """A cached register value with expiration time."""
-
-    value: Any
-    expires_at: float  # time.monotonic() timestamp
+# Inverter model descriptions keyed by the low byte of the model code
+INVERTER_MODELS: dict[int, str] = {
+    0x00: "No definition",
+    0x10: "1-Phase Grid-Tied Inverter (0.7-8K1P / 7-10K1P)",
+    0x20: "3-Phase Grid-Tied Inverter (3-20K 3P)",
+    0x21: "3-Phase Grid-Tied Inverter (25-50K / 50-70K / 80-110K / 90-136K / 125K / 250K)",
+    0x30: "1-Phase LV Hybrid Inverter",
+    0x31: "1-Phase LV AC Coupled Energy Storage Inverter",
+    0x32: "5-15kWh All-in-One Hybrid",
+    0x40: "1-Phase HV Hybrid Inverter",
+    0x50: "3-Phase LV Hybrid Inverter",
+    0x60: "3-Phase HV Hybrid Inverter (5G)",
+    0x70: "S6 3-Phase HV Hybrid (5-10kW)",
+    0x71: "S6 3-Phase HV Hybrid (12-20kW)",
+    0x72: "S6 3-Phase LV Hybrid (10-15kW)",
+    0x73: "S6 3-Phase HV Hybrid (50kW)",
+    0x80: "1-Phase HV Hybrid Inverter (S6)",
+    0x90: "1-Phase LV Hybrid Inverter (S6)",
+    0x91: "S6 1-Phase LV AC Coupled Hybrid",
+    0xA0: "OGI Off-Grid Inverter",
+    0xA1: "S6 1-Phase LV Off-Grid Hybrid",
+}
+
+# Direct-index lookup table covering every possible model byte
+_MODEL_TABLE: tuple[str, ...] = tuple(INVERTER_MODELS.get(i, "Unknown Model") for i in range(256))
+
+# Minimum interval between RegisterCache expiry sweeps (seconds)
+REGISTER_CACHE_SWEEP_INTERVAL = 60
+
+# Upper bound on RegisterCache entries; least recently written entries are evicted first
+REGISTER_CACHE_MAX_ENTRIES = 4096
 
 
 class RegisterCache:
@@ -51,20 +78,65 @@ class RegisterCache:
         # Retrieve if not expired (returns None if expired or missing)
         value = cache.get("controller_key", 13249)
 
-        # Check if a range of registers is cached
-        if cache.is_range_cached("key", 13249, 10):
-            # All registers 13249-13258 are cached and valid
-            values = cache.get_range("key", 13249, 10)
+        # Fetch a range of registers in a single pass
+        # (None if any of 13249-13258 is missing or expired)
+        values = cache.get_range("key", 13249, 10)
+
+    Entries are stored as plain ``(value, expires_at_ns)`` tuples, where
+    ``expires_at_ns`` is a ``time.monotonic_ns()`` timestamp. This avoids a
+    wrapper object per register and keeps expiry checks as integer compares.
+
+    The cache holds at most ``max_entries`` registers. Writes move an entry to
+    the back of the eviction order; reads don't, so the hot get_range() path
+    stays free of bookkeeping. A per-controller key index lets clear() drop a
+    single controller's entries without scanning the whole cache.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_entries: int = REGISTER_CACHE_MAX_ENTRIES) -> None:
         """Initialize an empty cache."""
-        self._cache: dict[str, CachedValue] = {}
+        self._cache: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._keys_by_controller: dict[str, set[str]] = {}
+        self._max_entries = max_entries
+        self._last_sweep = 0  # time.monotonic_ns() of the last expiry sweep
 
     def _make_key(self, controller_key: str, register: int) -> str:
         """Create a cache key from controller key and register address."""
         return f"{controller_key}:{register}"
 
+    def _forget(self, key: str) -> None:
+        """Drop a removed cache key from the per-controller index."""
+        controller_key = key.rpartition(":")[0]
+        keys = self._keys_by_controller.get(controller_key)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_controller[controller_key]
+
+    def _evict_overflow(self) -> None:
+        """Evict least recently written entries until the size cap is met."""
+        cache = self._cache
+        while len(cache) > self._max_entries:
+            key, _ = cache.popitem(last=False)
+            self._forget(key)
+
+    def _maybe_sweep(self, now: int) -> None:
+        """Purge all expired entries, at most once per sweep interval.
+
+        Range lookups don't delete expired entries they run into; expiry is
+        instead handled here in bulk so it stays off the read path.
+
+        Args:
+            now: Current time.monotonic_ns() timestamp
+        """
+        if now - self._last_sweep < REGISTER_CACHE_SWEEP_INTERVAL * 1_000_000_000:
+            return
+        self._last_sweep = now
+        cache = self._cache
+        expired = [key for key, (_value, expires_at) in cache.items() if now >= expires_at]
+        for key in expired:
+            del cache[key]
+            self._forget(key)
+
     def get(self, controller_key: str, register: int) -> Any | None:
         """Get a cached value if it exists and hasn't expired.
 
@@ -75,17 +147,21 @@ class RegisterCache:
         Returns:
             The cached value, or None if not cached or expired
         """
+        cache = self._cache
         key = self._make_key(controller_key, register)
-        if key not in self._cache:
+        # Single dict probe on the (common) hit path; misses raise KeyError
+        try:
+            value, expires_at = cache[key]
+        except KeyError:
             return None
 
-        cached = self._cache[key]
-        if time.monotonic() >= cached.expires_at:
+        if time.monotonic_ns() >= expires_at:
             # Expired - remove and return None
-            del self._cache[key]
+            del cache[key]
+            self._forget(key)
             return None
 
-        return cached.value
+        return value
 
     def set(self, controller_key: str, register: int, value: Any, ttl_seconds: float) -> None:
         """Store a value in the cache with a TTL.
@@ -96,15 +172,23 @@ class RegisterCache:
             value: Value to cache
             ttl_seconds: Time-to-live in seconds
         """
+        now = time.monotonic_ns()
+        self._maybe_sweep(now)
+        cache = self._cache
         key = self._make_key(controller_key, register)
-        self._cache[key] = CachedValue(
-            value=value,
-            expires_at=time.monotonic() + ttl_seconds,
-        )
+        cache[key] = (value, now + int(ttl_seconds * 1_000_000_000))
+        cache.move_to_end(key)
+        self._keys_by_controller.setdefault(controller_key, set()).add(key)
+        if len(cache) > self._max_entries:
+            self._evict_overflow()
 
     def is_range_cached(self, controller_key: str, start_register: int, count: int) -> bool:
         """Check if an entire range of registers is cached and valid.
 
+        Only use this for pure existence checks. When the values are needed,
+        call get_range() directly instead of checking first, which would walk
+        the range twice.
+
         Args:
             controller_key: Unique identifier for the controller
             start_register: First register address
@@ -113,14 +197,17 @@ class RegisterCache:
         Returns:
             True if ALL registers in the range are cached and not expired
         """
-        now = time.monotonic()
-        for offset in range(count):
-            key = self._make_key(controller_key, start_register + offset)
-            if key not in self._cache:
+        cache = self._cache
+        prefix = f"{controller_key}:"  # Inlined _make_key() to avoid a method call per register
+        now = time.monotonic_ns()
+        for register in range(start_register, start_register + count):
+            key = f"{prefix}{register}"
+            try:
+                expires_at = cache[key][1]
+            except KeyError:
                 return False
-            if now >= self._cache[key].expires_at:
-                # Proactively purge expired entry
-                del self._cache[key]
+            if now >= expires_at:
+                # Expired entries are left for _maybe_sweep()
                 return False
         return True
 
@@ -136,18 +223,20 @@ class RegisterCache:
             List of values if all are cached and valid, None otherwise
         """
         # Single-pass: collect values and check expiration simultaneously
-        now = time.monotonic()
-        values = []
+        cache = self._cache
+        prefix = f"{controller_key}:"  # Inlined _make_key() to avoid a method call per register
+        now = time.monotonic_ns()
+        values = [None] * count
         for offset in range(count):
-            key = self._make_key(controller_key, start_register + offset)
-            if key not in self._cache:
+            key = f"{prefix}{start_register + offset}"
+            try:
+                value, expires_at = cache[key]
+            except KeyError:
                 return None
-            cached = self._cache[key]
-            if now >= cached.expires_at:
-                # Proactively purge expired entry
-                del self._cache[key]
+            if now >= expires_at:
+                # Expired entries are left for _maybe_sweep()
                 return None
-            values.append(cached.value)
+            values[offset] = value
         return values
 
     def set_range(self, controller_key: str, start_register: int, values: list[Any], ttl_seconds: float) -> None:
@@ -159,8 +248,20 @@ class RegisterCache:
             values: List of values to cache
             ttl_seconds: Time-to-live in seconds
         """
-        for offset, value in enumerate(values):
-            self.set(controller_key, start_register + offset, value, ttl_seconds)
+        now = time.monotonic_ns()
+        self._maybe_sweep(now)
+        expires_at = now + int(ttl_seconds * 1_000_000_000)
+        prefix = f"{controller_key}:"
+        cache = self._cache
+        keys = [f"{prefix}{register}" for register in range(start_register, start_register + len(values))]
+        for key in keys:
+            # Re-written keys must move to the back of the eviction order,
+            # which a plain OrderedDict.update() wouldn't do
+            cache.pop(key, None)
+        cache.update((key, (value, expires_at)) for key, value in zip(keys, values, strict=True))
+        self._keys_by_controller.setdefault(controller_key, set()).update(keys)
+        if len(cache) > self._max_entries:
+            self._evict_overflow()
 
     def invalidate(self, controller_key: str, register: int) -> None:
         """Remove a specific register from the cache.
@@ -170,7 +271,8 @@ class RegisterCache:
             register: Register address to invalidate
         """
         key = self._make_key(controller_key, register)
-        self._cache.pop(key, None)
+        if self._cache.pop(key, None) is not None:
+            self._forget(key)
 
     def invalidate_range(self, controller_key: str, start_register: int, count: int) -> None:
         """Remove a range of registers from the cache.
@@ -180,8 +282,15 @@ class RegisterCache:
             start_register: First register address
             count: Number of consecutive registers
         """
-        for offset in range(count):
-            self.invalidate(controller_key, start_register + offset)
+        cache = self._cache
+        prefix = f"{controller_key}:"
+        keys = self._keys_by_controller.get(controller_key)
+        for register in range(start_register, start_register + count):
+            key = f"{prefix}{register}"
+            if cache.pop(key, None) is not None:
+                keys.discard(key)
+        if keys is not None and not keys:
+            del self._keys_by_controller[controller_key]
 
     def clear(self, controller_key: str | None = None) -> None:
         """Clear the cache.
@@ -192,11 +301,12 @@ class RegisterCache:
         """
         if controller_key is None:
             self._cache.clear()
+            self._keys_by_controller.clear()
         else:
-            prefix = f"{controller_key}:"
-            keys_to_remove = [k for k in self._cache if k.startswith(prefix)]
-            for key in keys_to_remove:
-                del self._cache[key]
+            # Only touches this controller's keys, not the whole cache
+            cache = self._cache
+            for key in self._keys_by_controller.pop(controller_key, ()):
+                cache.pop(key, None)
 
     def stats(self) -> dict[str, int]:
         """Return cache statistics.
@@ -204,8 +314,8 @@ class RegisterCache:
         Returns:
             Dict with 'total_entries' and 'expired_entries' counts
         """
-        now = time.monotonic()
-        expired = sum(1 for cached in self._cache.values() if now >= cached.expires_at)
+        now = time.monotonic_ns()
+        expired = sum(1 for _value, expires_at in self._cache.values() if now >= expires_at)
         return {
             "total_entries": len(self._cache),
             "expired_entries": expired,
@@ -231,60 +341,49 @@ def get_register_cache(hass: HomeAssistant) -> RegisterCache:
 
 
 def hex_to_ascii(hex_value):
-    # Convert hexadecimal to decimal
-    decimal_value = hex_value
+    # Two bytes of a 16-bit register, high byte first; latin-1 maps each byte to the same code point as chr()
+    return (hex_value & 0xFFFF).to_bytes(2, "big").decode("latin-1")
 
-    # Split into bytes
-    byte1 = (decimal_value >> 8) & 0xFF
-    byte2 = decimal_value & 0xFF
 
-    # Convert bytes to ASCII characters
-    ascii_chars = "".join([chr(byte) for byte in [byte1, byte2]])
-
-    return ascii_chars
+@functools.lru_cache(maxsize=32)
+def _u16_struct(count: int) -> struct.Struct:
+    """Return a compiled big-endian struct for `count` unsigned 16-bit registers."""
+    return struct.Struct(">" + "H" * count)
 
 
 def extract_serial_number(values):
-    packed = struct.pack(">" + "H" * len(values), *values)
+    packed = _u16_struct(len(values)).pack(*values)
     return packed.decode("ascii", errors="ignore").strip("\x00\r\n ")
 
 
 def clock_drift_test(hass, controller, hours, minutes, seconds):
-    import time
-
     current_time = dt_utils.now()
-    device_time = datetime(
-        current_time.year, current_time.month, current_time.day, hours, minutes, seconds, tzinfo=current_time.tzinfo
-    )
-    total_drift = (current_time - device_time).total_seconds()
 
-    # Handle midnight edge case: if drift exceeds 12 hours, adjust date
+    # Wall-clock difference in seconds-of-day, wrapped into [-12h, +12h) to handle midnight.
     # Example: Device shows 23:59:50, current is 00:00:10 (next day)
     # Raw drift would be -23:59:40, but actual drift is +20 seconds
-    if total_drift > 43200:  # More than 12 hours ahead - device is probably yesterday
-        device_time = device_time - timedelta(days=1)
-        total_drift = (current_time - device_time).total_seconds()
-    elif total_drift < -43200:  # More than 12 hours behind - device is probably tomorrow
-        device_time = device_time + timedelta(days=1)
-        total_drift = (current_time - device_time).total_seconds()
+    current_sod = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+    device_sod = hours * 3600 + minutes * 60 + seconds
+    total_drift = (current_sod - device_sod + 43200) % 86400 - 43200
 
-    # Ensure structure
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {}
+    domain_data = hass.data.setdefault(DOMAIN, {})
 
     # Namespace counters by controller to prevent multi-inverter interference
     controller_key = controller.controller_key
     drift_key = f"{DRIFT_COUNTER}_{controller_key}"
     correction_key = f"{LAST_CLOCK_CORRECTION}_{controller_key}"
 
-    drift_counter = hass.data[DOMAIN].get(drift_key, 0)
-    last_correction = hass.data[DOMAIN].get(correction_key, 0)
+    drift_counter = domain_data.get(drift_key, 0)
+    # time.monotonic() of the last correction; unaffected by NTP/DST wall-clock jumps
+    last_correction = domain_data.get(correction_key)
     clock_adjusted = False
+    new_drift_counter = 0
 
     if abs(total_drift) > 60:
         if drift_counter > 5:
             # Check cooldown to prevent spam if RTC is faulty
-            time_since_correction = time.time() - last_correction
+            now = time.monotonic()
+            time_since_correction = CLOCK_CORRECTION_COOLDOWN if last_correction is None else now - last_correction
             if time_since_correction >= CLOCK_CORRECTION_COOLDOWN:
                 if controller.connected():
                     hass.create_task(
@@ -292,72 +391,50 @@ def clock_drift_test(hass, controller, hours, minutes, seconds):
                             43003, [current_time.hour, current_time.minute, current_time.second]
                         )
                     )
-                    hass.data[DOMAIN][correction_key] = time.time()
-                    hass.data[DOMAIN][drift_key] = 0  # Reset counter after correction
-                    clock_adjusted = True
+                    domain_data[correction_key] = now
+                    clock_adjusted = True  # Counter resets after correction
+                else:
+                    new_drift_counter = drift_counter
             else:
+                new_drift_counter = drift_counter
                 _LOGGER.debug(
                     f"Clock correction skipped: cooldown active ({CLOCK_CORRECTION_COOLDOWN - time_since_correction:.0f}s remaining)"
                 )
         else:
-            hass.data[DOMAIN][drift_key] = drift_counter + 1
-    else:
-        hass.data[DOMAIN][drift_key] = 0
+            new_drift_counter = drift_counter + 1
 
+    domain_data[drift_key] = new_drift_counter
     _LOGGER.debug(f"Drift: {total_drift}s, Counter: {drift_counter}, Adjusted: {clock_adjusted}")
     return clock_adjusted
 
 
-def decode_inverter_model(hex_value):
+def decode_inverter_model(hex_value: int) -> tuple[int, str]:
     """
     Decodes an inverter model code into its protocol version and description.
 
-    :param hex_value: The hexadecimal or decimal inverter model code.
+    :param hex_value: The integer inverter model code (see decode_inverter_model_hexstr for strings).
     :return: A tuple (protocol_version, model_description)
     """
-    # Convert hexadecimal string to integer if necessary
-    if isinstance(hex_value, str):
-        hex_value = int(hex_value, 16)
-
-    # Extract high byte (protocol version) and low byte (inverter model)
-    protocol_version = (hex_value >> 8) & 0xFF
-    inverter_model = hex_value & 0xFF
-
-    inverter_models = {
-        0x00: "No definition",
-        0x10: "1-Phase Grid-Tied Inverter (0.7-8K1P / 7-10K1P)",
-        0x20: "3-Phase Grid-Tied Inverter (3-20K 3P)",
-        0x21: "3-Phase Grid-Tied Inverter (25-50K / 50-70K / 80-110K / 90-136K / 125K / 250K)",
-        0x30: "1-Phase LV Hybrid Inverter",
-        0x31: "1-Phase LV AC Coupled Energy Storage Inverter",
-        0x32: "5-15kWh All-in-One Hybrid",
-        0x40: "1-Phase HV Hybrid Inverter",
-        0x50: "3-Phase LV Hybrid Inverter",
-        0x60: "3-Phase HV Hybrid Inverter (5G)",
-        0x70: "S6 3-Phase HV Hybrid (5-10kW)",
-        0x71: "S6 3-Phase HV Hybrid (12-20kW)",
-        0x72: "S6 3-Phase LV Hybrid (10-15kW)",
-        0x73: "S6 3-Phase HV Hybrid (50kW)",
-        0x80: "1-Phase HV Hybrid Inverter (S6)",
-        0x90: "1-Phase LV Hybrid Inverter (S6)",
-        0x91: "S6 1-Phase LV AC Coupled Hybrid",
-        0xA0: "OGI Off-Grid Inverter",
-        0xA1: "S6 1-Phase LV Off-Grid Hybrid",
-    }
-
-    # Get model description or default to "Unknown Model"
-    model_description = inverter_models.get(inverter_model, "Unknown Model")
-
-    return protocol_version, model_description
-
-
-def get_controller_key(controller) -> str:
-    """Generate a unique key for a controller (includes port for TCP, path for serial)."""
-    return f"{controller.connection_id}_{controller.device_id}"
-
-
-def get_controller_key_from_config(config: dict) -> str:
-    """Generate controller key from config dict."""
+    # High byte is the protocol version, low byte the inverter model
+    return (hex_value >> 8) & 0xFF, _MODEL_TABLE[hex_value & 0xFF]
+
+
+def decode_inverter_model_hexstr(hex_value: str) -> tuple[int, str]:
+    """Decode an inverter model code given as a hexadecimal string (e.g. "0x3010")."""
+    return decode_inverter_model(int(hex_value, 16))
+
+
+def get_controller_key(controller) -> tuple[str, int]:
+    """Generate the controller registry key: (connection_id, slave).
+
+    connection_id is host:port for TCP and the port path for serial. Note this is
+    distinct from ``controller.controller_key``, the string used to namespace cached values.
+    """
+    return controller.connection_id, controller.device_id
+
+
+def get_controller_key_from_config(config: dict) -> tuple[str, int]:
+    """Generate controller registry key from config dict."""
     slave = config.get("slave", 1)
     connection_type = config.get(CONF_CONNECTION_TYPE, CONN_TYPE_TCP if "host" in config else CONN_TYPE_SERIAL)
 
@@ -368,23 +445,40 @@ def get_controller_key_from_config(config: dict) -> str:
     else:  # Serial
         connection_id = config.get(CONF_SERIAL_PORT, "/dev/ttyUSB0")
 
-    return f"{connection_id}_{slave}"
+    return connection_id, slave
 
 
 def cache_save(hass: HomeAssistant, register: str | int, value, controller_key: str = None):
     """Save value to cache, optionally namespaced by controller."""
-    hass.data.setdefault(DOMAIN, {}).setdefault(VALUES, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    values = domain_data.get(VALUES)
+    if values is None:
+        values = domain_data[VALUES] = {}
 
     if controller_key:
         key = f"{controller_key}:{register}"
     else:
         key = str(register)
-    hass.data[DOMAIN][VALUES][key] = value
+    values[key] = value
+
+
+def cache_save_range(hass: HomeAssistant, start_register: int, values, controller_key: str = None):
+    """Save consecutive register values to cache in one pass, optionally namespaced by controller."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get(VALUES)
+    if cache is None:
+        cache = domain_data[VALUES] = {}
+
+    prefix = f"{controller_key}:" if controller_key else ""
+    cache.update((f"{prefix}{register}", value) for register, value in enumerate(values, start_register))
 
 
 def cache_get(hass: HomeAssistant, register: str | int, controller_key: str = None):
     """Get value from cache, optionally namespaced by controller."""
-    values = hass.data.get(DOMAIN, {}).get(VALUES)
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data is None:
+        return None
+    values = domain_data.get(VALUES)
     if values is None:
         return None
 
@@ -395,23 +489,60 @@ def cache_get(hass: HomeAssistant, register: str | int, controller_key: str = No
     return values.get(key, None)
 
 
+def cache_get_many(hass: HomeAssistant, registers, controller_key: str = None) -> list:
+    """Get several values from cache in one pass, optionally namespaced by controller."""
+    domain_data = hass.data.get(DOMAIN)
+    values = domain_data.get(VALUES) if domain_data is not None else None
+    if values is None:
+        return [None] * len(registers)
+
+    prefix = f"{controller_key}:" if controller_key else ""
+    return [values.get(f"{prefix}{register}") for register in registers]
+
+
 def set_controller(hass: HomeAssistant, controller):
-    """Register a controller with proper key (includes port/path + slave)."""
-    key = get_controller_key(controller)
-    hass.data[DOMAIN][CONTROLLER][key] = controller
+    """Register a controller with proper key (includes port/path + slave).
+
+    Also indexes it by (host, slave) so get_controller() can resolve a bare
+    host (any TCP port) without scanning every registered controller. Entries on
+    the same host and slave but different ports share an index slot, in
+    registration order.
+    """
+    domain_data = hass.data[DOMAIN]
+    domain_data[CONTROLLER][get_controller_key(controller)] = controller
+    same_host = domain_data.setdefault(CONTROLLER_BY_HOST, {}).setdefault((controller.host, controller.device_id), [])
+    if controller not in same_host:
+        same_host.append(controller)
+
+
+def remove_controller(hass: HomeAssistant, controller):
+    """Remove a controller from the registry and the (host, slave) index."""
+    domain_data = hass.data[DOMAIN]
+    domain_data[CONTROLLER].pop(get_controller_key(controller), None)
+    by_host = domain_data.get(CONTROLLER_BY_HOST)
+    host_key = (controller.host, controller.device_id)
+    same_host = by_host.get(host_key) if by_host is not None else None
+    if same_host and controller in same_host:
+        same_host.remove(controller)
+        if not same_host:
+            del by_host[host_key]
 
 
 def get_controller_from_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Get controller from config entry (works for both TCP and Serial)."""
     config = {**config_entry.data, **config_entry.options}
     key = get_controller_key_from_config(config)
-    controllers = hass.data.get(DOMAIN, {}).get(CONTROLLER, {})
-    return controllers.get(key)
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data is None:
+        return None
+    controllers = domain_data.get(CONTROLLER)
+    return controllers.get(key) if controllers else None
 
 
 def get_controller(hass: HomeAssistant, controller_host: str, controller_slave: int):
     """Get controller by host/port and slave (legacy function for backwards compatibility)."""
-    controllers = hass.data.get(DOMAIN, {}).get(CONTROLLER, {})
+    domain_data = hass.data.get(DOMAIN)
+    controllers = domain_data.get(CONTROLLER) if domain_data is not None else None
     if not controllers:
         return None
 
@@ -423,22 +554,36 @@ def get_controller(hass: HomeAssistant, controller_host: str, controller_slave:
                 return controller
         return None
 
-    # Try exact match first (for backwards compatibility with host_slave format)
-    controller = controllers.get(f"{controller_host}_{controller_slave}")
+    # Try exact match first (serial path, or TCP host already including the port)
+    controller = controllers.get((controller_host, controller_slave))
     if controller:
         return controller
 
     # Try with default port for TCP
-    controller = controllers.get(f"{controller_host}:502_{controller_slave}")
+    controller = controllers.get((f"{controller_host}:502", controller_slave))
     if controller:
         return controller
 
-    # Search all controllers for matching host and slave
-    for _key, ctrl in controllers.items():
-        if ctrl.host == controller_host and ctrl.device_id == controller_slave:
-            return ctrl
+    # Host without port (e.g. TCP on a non-default port): use the (host, slave) index
+    by_host = domain_data.get(CONTROLLER_BY_HOST)
+    same_host = by_host.get((controller_host, controller_slave)) if by_host else None
+    return same_host[0] if same_host else None
 
-    return None
+
+def freeze_definitions(definitions: Iterable[Mapping[str, Any]]) -> tuple[Mapping[str, Any], ...]:
+    """Return definitions, and any nested "entities", as a tuple of read-only mappings.
+
+    Definition tables are module-level and shared by every config entry, so one
+    entry's entities must not be able to edit them in place.
+    """
+    return tuple(
+        MappingProxyType(
+            {**definition, "entities": freeze_definitions(definition["entities"])}
+            if "entities" in definition
+            else dict(definition)
+        )
+        for definition in definitions
+    )
 
 
 def split_s32(s32_values: list[int]):
@@ -453,21 +598,14 @@ def split_s32(s32_values: list[int]):
     if len(s32_values) < 2:
         return 0
 
-    # High word determines sign, low word is always unsigned
-    high_word = s32_values[0]
-    low_word = s32_values[1]
-
-    # Combine as unsigned 32-bit first
-    unsigned_value = (high_word << 16) | (low_word & 0xFFFF)
-
-    # Convert to signed if high bit is set
-    if unsigned_value >= (1 << 31):
-        return unsigned_value - (1 << 32)
-    return unsigned_value
+    # Combine as unsigned 32-bit, then sign-extend via two's complement
+    unsigned_value = ((s32_values[0] & 0xFFFF) << 16) | (s32_values[1] & 0xFFFF)
+    return (unsigned_value ^ 0x80000000) - 0x80000000
 
 
-def _any_in(target: list[int], collection: set[int]) -> bool:
-    return any(item in collection for item in target)
+def _any_in(target: list[int], collection: set[int] | frozenset[int]) -> bool:
+    # set.isdisjoint() runs in C and short-circuits on the first common item
+    return not collection.isdisjoint(target)
 
 
 def is_correct_controller(controller, connection_id: str, slave: int):
@@ -495,13 +633,10 @@ def get_bit_bool(modbus_value: int, bit_position: int) -> bool:
     Returns:
     - True if the bit is ON, False if the bit is OFF.
     """
-    return (modbus_value >> bit_position) & 1 == 1
+    return bool((modbus_value >> bit_position) & 1)
 
 
 def set_bit(value: int, bit_position: int, new_bit_value: bool) -> int:
     """Set or clear a specific bit in an integer value."""
     mask = 1 << bit_position
-    value &= ~mask  # Clear the bit
-    if new_bit_value:
-        value |= mask  # Set the bit
-    return round(value)
+    return (value | mask) if new_bit_value else (value & ~mask)
@@ -1,12 +1,14 @@
 import asyncio
+import contextlib
 import logging
+import random
 import time
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from enum import Enum
+from functools import cached_property
 
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.template import is_number
 from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
 from pymodbus.exceptions import ConnectionException, ModbusException
 
@@ -26,26 +28,38 @@ from custom_components.sungrow_modbus.const import (
 )
 from custom_components.sungrow_modbus.data.enums import PollSpeed
 from custom_components.sungrow_modbus.data.sungrow_config import InverterConfig
-from custom_components.sungrow_modbus.helpers import cache_save
+from custom_components.sungrow_modbus.helpers import cache_save, cache_save_range
 from custom_components.sungrow_modbus.sensors.sungrow_base_sensor import SungrowSensorGroup
 from custom_components.sungrow_modbus.sensors.sungrow_derived_sensor import SungrowDerivedSensor
 
 _LOGGER = logging.getLogger(__name__)
 
 # Write queue timing configuration
-QUEUE_DISCONNECTED_SLEEP = 5.0  # Seconds to wait between queue checks when disconnected
-QUEUE_EMPTY_SLEEP = 0.2  # Seconds to wait between queue checks when queue is empty
+QUEUE_DISCONNECTED_SLEEP = 5.0  # Max seconds to wait for a connection before re-checking when disconnected
+WRITE_QUEUE_MAX_SIZE = 64  # Writes beyond this are rejected instead of piling up behind a stalled device
+SHUTDOWN_DRAIN_SECONDS = 2.0  # Time allowed for flushing queued writes on shutdown before the rest are rejected
+
+# Upper bound on a single connect attempt, so a peer that black-holes SYNs can't
+# hold up polling and writes for the OS connect timeout (minutes on Linux)
+CONNECT_TIMEOUT_SECONDS = 5.0
 
 # Modbus inter-frame delay configuration (milliseconds)
 # These delays ensure proper spacing between Modbus operations to avoid
 # overwhelming the device. Write operations use longer delays for safety.
 INTER_FRAME_DELAY_READ_MS = 50
 INTER_FRAME_DELAY_WRITE_MS = 100
+_INTER_FRAME_DELAY_READ_S = INTER_FRAME_DELAY_READ_MS / 1000
+_INTER_FRAME_DELAY_WRITE_S = INTER_FRAME_DELAY_WRITE_MS / 1000
+
+# Maximum registers per Write Multiple Registers (FC16) request, per the Modbus spec
+MAX_WRITE_BLOCK_REGISTERS = 123
 
 # Circuit breaker configuration
 # Prevents repeated connection attempts to offline inverters
 CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # Open circuit after this many consecutive failures
-CIRCUIT_BREAKER_RECOVERY_MINUTES = 5  # Wait this long before attempting recovery
+CIRCUIT_BREAKER_BASE_RECOVERY_SECONDS = 5.0  # First recovery wait; doubles each time the circuit re-opens
+CIRCUIT_BREAKER_RECOVERY_SECONDS = 300.0  # Upper bound on the recovery wait
+CIRCUIT_BREAKER_RECOVERY_JITTER = 0.2  # +/- fraction applied to each wait to spread out retries
 
 
 class CircuitState(Enum):
@@ -56,19 +70,26 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service has recovered
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreaker:
     """Circuit breaker to prevent repeated connection attempts to offline devices.
 
     The circuit breaker has three states:
     - CLOSED: Normal operation, all connection attempts are allowed
     - OPEN: Circuit is tripped after too many failures, rejecting attempts
-    - HALF_OPEN: After recovery timeout, allows one attempt to test recovery
+    - HALF_OPEN: After recovery timeout, allows one attempt to test recovery;
+      further attempts are rejected while that probe is in flight
+
+    The recovery timeout backs off exponentially: it starts at base_recovery_s
+    and doubles each time the circuit opens again without an intervening
+    success, capped at recovery_timeout_s. A small random jitter keeps several
+    controllers from retrying in lockstep.
 
     Usage:
         breaker = CircuitBreaker()
 
         if breaker.can_attempt():
+            breaker.record_attempt()
             success = await try_connect()
             if success:
                 breaker.record_success()
@@ -80,13 +101,31 @@ class CircuitBreaker:
     """
 
     failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD
-    recovery_timeout: timedelta = field(default_factory=lambda: timedelta(minutes=CIRCUIT_BREAKER_RECOVERY_MINUTES))
+    recovery_timeout_s: float = CIRCUIT_BREAKER_RECOVERY_SECONDS
+    base_recovery_s: float = CIRCUIT_BREAKER_BASE_RECOVERY_SECONDS
 
     state: CircuitState = field(default=CircuitState.CLOSED)
     failure_count: int = field(default=0)
-    last_failure_time: datetime | None = field(default=None)
+    open_cycles: int = field(default=0)  # Times opened since the last success
+    current_recovery_s: float = field(default=0.0)  # Backoff wait chosen when the circuit last opened
+    # time.monotonic() of the last failure; immune to wall-clock jumps and cheap to compare
+    last_failure_time: float | None = field(default=None)
+    probe_in_flight: bool = field(default=False)  # A HALF_OPEN recovery attempt is awaiting its outcome
     _logger_prefix: str = field(default="")
 
+    def record_attempt(self) -> None:
+        """Record that a connection attempt is starting.
+
+        In HALF_OPEN this claims the single recovery probe, so concurrent
+        callers are turned away until the probe reports its outcome.
+        """
+        if self.state == CircuitState.HALF_OPEN:
+            self.probe_in_flight = True
+
+    def abort_attempt(self) -> None:
+        """Forget an attempt that ended without an outcome (e.g. it was cancelled)."""
+        self.probe_in_flight = False
+
     def record_success(self) -> None:
         """Record a successful connection attempt.
 
@@ -98,8 +137,19 @@ class CircuitBreaker:
                 self._logger_prefix,
             )
         self.failure_count = 0
+        self.open_cycles = 0
         self.state = CircuitState.CLOSED
         self.last_failure_time = None
+        self.probe_in_flight = False
+
+    def _open(self) -> None:
+        """Trip the circuit and pick the next backoff wait."""
+        self.state = CircuitState.OPEN
+        self.open_cycles += 1
+        # Exponent is clamped so long outages can't overflow the float conversion
+        backoff = self.base_recovery_s * 2 ** min(self.open_cycles - 1, 16)
+        jitter = random.uniform(1 - CIRCUIT_BREAKER_RECOVERY_JITTER, 1 + CIRCUIT_BREAKER_RECOVERY_JITTER)
+        self.current_recovery_s = min(self.recovery_timeout_s, backoff * jitter)
 
     def record_failure(self) -> None:
         """Record a failed connection attempt.
@@ -107,23 +157,24 @@ class CircuitBreaker:
         Increments failure count and opens the circuit if threshold is exceeded.
         """
         self.failure_count += 1
-        self.last_failure_time = datetime.now(UTC)
+        self.last_failure_time = time.monotonic()
+        self.probe_in_flight = False
 
         if self.state == CircuitState.HALF_OPEN:
             # Failed during recovery test, go back to OPEN
-            self.state = CircuitState.OPEN
+            self._open()
             _LOGGER.warning(
-                "%sCircuit breaker OPEN (recovery attempt failed). Will retry in %s",
+                "%sCircuit breaker OPEN (recovery attempt failed). Will retry in %.0fs",
                 self._logger_prefix,
-                self.recovery_timeout,
+                self.current_recovery_s,
             )
         elif self.failure_count >= self.failure_threshold and self.state == CircuitState.CLOSED:
-            self.state = CircuitState.OPEN
+            self._open()
             _LOGGER.warning(
-                "%sCircuit breaker OPEN after %d consecutive failures. Will retry in %s",
+                "%sCircuit breaker OPEN after %d consecutive failures. Will retry in %.0fs",
                 self._logger_prefix,
                 self.failure_count,
-                self.recovery_timeout,
+                self.current_recovery_s,
             )
 
     def can_attempt(self) -> bool:
@@ -138,8 +189,8 @@ class CircuitBreaker:
         if self.state == CircuitState.OPEN:
             # Check if recovery timeout has passed
             if self.last_failure_time is not None:
-                elapsed = datetime.now(UTC) - self.last_failure_time
-                if elapsed >= self.recovery_timeout:
+                elapsed = time.monotonic() - self.last_failure_time
+                if elapsed >= self.current_recovery_s:
                     self.state = CircuitState.HALF_OPEN
                     _LOGGER.info(
                         "%sCircuit breaker HALF_OPEN, attempting recovery",
@@ -148,8 +199,8 @@ class CircuitBreaker:
                     return True
             return False
 
-        # HALF_OPEN state allows one attempt
-        return True
+        # HALF_OPEN state allows one attempt at a time
+        return not self.probe_in_flight
 
     @property
     def is_open(self) -> bool:
@@ -157,18 +208,17 @@ class CircuitBreaker:
         return self.state == CircuitState.OPEN and not self.can_attempt()
 
     @property
-    def time_until_retry(self) -> timedelta | None:
+    def time_until_retry(self) -> float | None:
         """Get the time remaining until next retry is allowed.
 
         Returns:
-            timedelta if circuit is open, None otherwise.
+            Seconds remaining if circuit is open, None otherwise.
         """
         if self.state != CircuitState.OPEN or self.last_failure_time is None:
             return None
 
-        elapsed = datetime.now(UTC) - self.last_failure_time
-        remaining = self.recovery_timeout - elapsed
-        return remaining if remaining > timedelta(0) else None
+        remaining = self.current_recovery_s - (time.monotonic() - self.last_failure_time)
+        return remaining if remaining > 0 else None
 
 
 class ModbusController:
@@ -232,6 +282,7 @@ class ModbusController:
             self.connection_id = f"{host}:{port}"
             self.client: AsyncModbusTcpClient | AsyncModbusSerialClient = manager.get_tcp_client(host, port)
             self.poll_lock = manager.get_client_lock(self.connection_id)
+            self._bus_timing = manager.get_bus_timing(self.connection_id)
         else:  # CONN_TYPE_SERIAL
             if not serial_port:
                 raise ValueError("serial_port is required for Serial connection")
@@ -247,6 +298,7 @@ class ModbusController:
                 serial_port, baudrate, bytesize, parity, stopbits
             )
             self.poll_lock = manager.get_client_lock(self.connection_id)
+            self._bus_timing = manager.get_bus_timing(self.connection_id)
 
         self.connect_failures = 0
         self._data_received = False
@@ -263,16 +315,27 @@ class ModbusController:
         # self.poll_lock = asyncio.Lock() # Replaced by shared lock from manager
 
         # Modbus Write Queue
-        self.write_queue = asyncio.Queue()
-        self._last_modbus_request = 0
+        self.write_queue = asyncio.Queue(maxsize=WRITE_QUEUE_MAX_SIZE)
+        # (register, future) of the single-register write at the tail of the queue;
+        # a repeat write to that register (e.g. a dragged slider) replaces its value
+        self._tail_write = None
+        self._write_overrides = {}  # future -> newest value for a still-queued write
+        # Set by connect() on success, cleared on failure/close; wakes the write
+        # queue processor instead of having it poll the connection state
+        self._connected_event = asyncio.Event()
         self._last_modbus_success = datetime.now(UTC)
 
         # Controller key for cache namespacing (includes port/path + slave)
         self.controller_key = f"{self.connection_id}_{self.device_id}"
 
+        # Constant part of register update event payloads; copied per event since
+        # HA keeps a reference to each event's data (copy() beats a 4-key literal)
+        self._event_base = {CONTROLLER: self.connection_id, SLAVE: self.device_id}
+
         # Circuit breaker for connection management
+        self._log_prefix = f"({self.host}.{self.device_id}) "
         self.circuit_breaker = CircuitBreaker(
-            _logger_prefix=f"({self.host}.{self.device_id}) ",
+            _logger_prefix=self._log_prefix,
         )
 
     async def process_write_queue(self):
@@ -282,71 +345,205 @@ class ModbusController:
         It ensures that write operations are executed one at a time, with appropriate
         delays between operations to avoid overwhelming the Modbus device.
 
+        The loop blocks on the queue while it is empty and on the connection
+        event while disconnected, so it only wakes up when there is work to do.
+
+        Requests queued back-to-back that cover contiguous registers (e.g. from
+        a UI slider or a multi-register setting) are coalesced into a single
+        Write Multiple Registers request, paying the inter-frame delay and
+        round-trip once instead of per request. Queue order is preserved;
+        only adjacent requests are merged.
+
         Each queue item is a 4-tuple: (register, value, multiple, future)
         The future is resolved with the write result when the operation completes.
 
+        While the circuit breaker is open and the client is down, queued requests are
+        resolved with None straight away instead of waiting for a connection that is
+        known to be down.
+
         The loop exits gracefully when cancelled, processing any pending writes first.
+        That drain skips the inter-frame delay and is bounded by SHUTDOWN_DRAIN_SECONDS;
+        writes left over after the deadline, or while disconnected, resolve with None.
 
         Returns:
             None
         """
+        pending = []
         try:
             while True:
-                if not self.connected():
-                    await asyncio.sleep(QUEUE_DISCONNECTED_SLEEP)
+                pending.append(self._claim_write_request(await self.write_queue.get()))
+                await self._wait_until_connected()
+                # Pick up anything queued meanwhile so contiguous writes can share a frame
+                while not self.write_queue.empty():
+                    pending.append(self._claim_write_request(self.write_queue.get_nowait()))
+                # The shared client may have been reconnected by another controller meanwhile
+                if self.circuit_breaker.is_open and not self.connected():
+                    self._reject_write_requests(pending, "circuit breaker open")
+                    pending.clear()
                     continue
-
-                if self.write_queue.empty():
-                    await asyncio.sleep(QUEUE_EMPTY_SLEEP)
-                    continue
-
-                write_request = await self.write_queue.get()
-                register, value, multiple, future = write_request
-
-                if multiple:
-                    result = await self._execute_write_holding_registers(register, value)
-                else:
-                    result = await self._execute_write_holding_register(register, value)
-
-                # Resolve the future with the result (success or None on failure)
-                if not future.done():
-                    future.set_result(result)
-
-                self.write_queue.task_done()
+                while pending:
+                    run_length = self._contiguous_write_run_length(pending)
+                    await self._process_write_group(pending[:run_length])
+                    del pending[:run_length]
         except asyncio.CancelledError:
-            _LOGGER.debug(f"({self.host}.{self.device_id}) Write queue processor cancelled, draining pending writes")
-            # Process any remaining items in the queue before exiting
-            while not self.write_queue.empty():
+            _LOGGER.debug("%sWrite queue processor cancelled, draining pending writes", self._log_prefix)
+            # Process already dequeued requests and any remaining items in the queue before exiting.
+            # Home Assistant only waits a few seconds on shutdown, so the drain is time-boxed.
+            deadline = time.monotonic() + SHUTDOWN_DRAIN_SECONDS
+            while pending or not self.write_queue.empty():
                 try:
-                    write_request = self.write_queue.get_nowait()
-                    register, value, multiple, future = write_request
-                    if multiple:
-                        result = await self._execute_write_holding_registers(register, value)
+                    if pending:
+                        write_request = pending.pop(0)
+                    else:
+                        write_request = self._claim_write_request(self.write_queue.get_nowait())
+                    if not self.connected():
+                        self._reject_write_requests([write_request], "not connected during shutdown")
+                    elif time.monotonic() > deadline:
+                        self._reject_write_requests([write_request], "shutdown drain deadline passed")
                     else:
-                        result = await self._execute_write_holding_register(register, value)
-                    # Resolve the future with the result
-                    if not future.done():
-                        future.set_result(result)
-                    self.write_queue.task_done()
+                        await self._process_write_request(write_request, skip_delay=True)
                 except asyncio.QueueEmpty:
                     break
                 except ConnectionException as e:
-                    _LOGGER.warning(f"({self.host}.{self.device_id}) Connection lost during shutdown write: {e}")
+                    _LOGGER.warning("%sConnection lost during shutdown write: %s", self._log_prefix, e)
                 except ModbusException as e:
-                    _LOGGER.warning(f"({self.host}.{self.device_id}) Modbus error during shutdown write: {e}")
+                    _LOGGER.warning("%sModbus error during shutdown write: %s", self._log_prefix, e)
                 except Exception as e:
-                    _LOGGER.error(
-                        f"({self.host}.{self.device_id}) Unexpected error during shutdown write: {e}",
-                        exc_info=True,
-                    )
+                    _LOGGER.error("%sUnexpected error during shutdown write: %s", self._log_prefix, e, exc_info=True)
             raise  # Re-raise CancelledError for proper cleanup
 
-    async def _execute_write_holding_register(self, register, value):
+    async def _wait_until_connected(self):
+        """Wait until the Modbus client is connected.
+
+        Sleeps on the connection event, re-checking the real client state at
+        least every QUEUE_DISCONNECTED_SLEEP seconds since the shared client
+        can also be (re)connected by other controllers. Returns early if the
+        circuit breaker opens so waiting writes can be rejected.
+        """
+        while not self.connected() and not self.circuit_breaker.is_open:
+            self._connected_event.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._connected_event.wait(), timeout=QUEUE_DISCONNECTED_SLEEP)
+
+    def _claim_write_request(self, write_request):
+        """Take a request off the queue, applying any value that replaced it while queued.
+
+        Args:
+            write_request: Queue item (register, value, multiple, future)
+
+        Returns:
+            The queue item with its newest value.
+        """
+        register, value, multiple, future = write_request
+        if self._tail_write is not None and self._tail_write[1] is future:
+            self._tail_write = None
+        if future in self._write_overrides:
+            value = self._write_overrides.pop(future)
+        return register, value, multiple, future
+
+    def _reject_write_requests(self, write_requests, reason):
+        """Resolve dequeued write requests with None without touching the bus.
+
+        Args:
+            write_requests: Queue items (register, value, multiple, future)
+            reason (str): Why the writes are rejected, for the debug log
+        """
+        _LOGGER.debug("%sRejecting %s queued writes: %s", self._log_prefix, len(write_requests), reason)
+        for _register, _value, _multiple, future in write_requests:
+            if not future.done():
+                future.set_result(None)
+            self.write_queue.task_done()
+
+    @staticmethod
+    def _write_request_span(write_request):
+        """Return the number of registers a request writes, or None if it can't be merged."""
+        register, value, multiple, _future = write_request
+        if not isinstance(register, int):
+            return None
+        if multiple:
+            return len(value) or None
+        return 1 if isinstance(value, int) else None
+
+    @classmethod
+    def _contiguous_write_run_length(cls, write_requests):
+        """Count the leading requests that write one contiguous register block.
+
+        Args:
+            write_requests: Non-empty list of queue items, in queue order
+
+        Returns:
+            int: Number of leading requests that can be sent as a single block write
+        """
+        span = cls._write_request_span(write_requests[0])
+        if span is None:
+            return 1
+        end = write_requests[0][0] + span
+        total = span
+        run_length = 1
+        for write_request in write_requests[1:]:
+            span = cls._write_request_span(write_request)
+            if span is None or write_request[0] != end or total + span > MAX_WRITE_BLOCK_REGISTERS:
+                break
+            end += span
+            total += span
+            run_length += 1
+        return run_length
+
+    async def _process_write_group(self, write_requests):
+        """Execute a run of contiguous write requests as one block write.
+
+        Every future in the run is resolved with the shared block write result.
+
+        Args:
+            write_requests: Queue items from _contiguous_write_run_length()
+        """
+        if len(write_requests) == 1:
+            await self._process_write_request(write_requests[0])
+            return
+
+        values = []
+        for _register, value, multiple, _future in write_requests:
+            if multiple:
+                values.extend(value)
+            else:
+                values.append(value)
+        _LOGGER.debug("%sCoalescing %s queued writes into one block write", self._log_prefix, len(write_requests))
+        result = await self._execute_write_holding_registers(write_requests[0][0], values)
+
+        for _register, _value, _multiple, future in write_requests:
+            if not future.done():
+                future.set_result(result)
+            self.write_queue.task_done()
+
+    async def _process_write_request(self, write_request, skip_delay=False):
+        """Execute a dequeued write request and resolve its future.
+
+        Args:
+            write_request: Queue item (register, value, multiple, future)
+            skip_delay (bool): Skip the inter-frame delay (shutdown drain only)
+        """
+        register, value, multiple, future = write_request
+        if multiple:
+            result = await self._execute_write_holding_registers(register, value, skip_delay)
+        else:
+            result = await self._execute_write_holding_register(register, value, skip_delay)
+
+        # Resolve the future with the result (success or None on failure)
+        if not future.done():
+            future.set_result(result)
+
+        self.write_queue.task_done()
+
+    async def _execute_write_holding_register(self, register, value, skip_delay=False):
         """Executes a single register write with interframe delay.
 
         Args:
             register (int): The register address to write to.
             value (int): The value to write to the register.
+            skip_delay (bool): Skip the inter-frame delay (shutdown drain only).
+
+        Both arguments are already coerced to int by async_write_holding_register(),
+        keeping the conversion out of the poll_lock critical section.
 
         Returns:
             result: The result of the write operation, or None if an error occurred.
@@ -356,61 +553,58 @@ class ModbusController:
         """
         try:
             if not await self.connect():
-                _LOGGER.debug(f"({self.host}.{self.device_id}) Skipping write to register {register} - not connected")
+                _LOGGER.debug("%sSkipping write to register %s - not connected", self._log_prefix, register)
                 return None
             async with self.poll_lock:
-                await self.inter_frame_wait(is_write=True)  # Delay before write
-                int_value = int(value)
-                int_register = register if is_number(register) else int(register)
+                if not skip_delay:
+                    await self.inter_frame_wait(is_write=True)  # Delay before write
 
-                result = await self.client.write_register(
-                    address=int_register, value=int_value, device_id=self.device_id
-                )
+                result = await self.client.write_register(address=register, value=value, device_id=self.device_id)
                 _LOGGER.debug(
-                    f"({self.host}.{self.device_id}) Write Holding Register register = {int_register}, value = {value}, int_value = {int_value}: {result}"
+                    "%sWrite Holding Register register = %s, value = %s: %s", self._log_prefix, register, value, result
                 )
 
                 if result.isError():
                     _LOGGER.error(
-                        f"({self.host}.{self.device_id}) Failed to write holding register {register} with value {value}: {result}"
+                        "%sFailed to write holding register %s with value %s: %s",
+                        self._log_prefix,
+                        register,
+                        value,
+                        result,
                     )
                     return None
 
                 # Write response has .value (single) not .registers
-                written_value = getattr(result, "value", int_value)
-                cache_save(self.hass, int_register, written_value, self.controller_key)
-                self.hass.bus.async_fire(
-                    DOMAIN,
-                    {
-                        REGISTER: int_register,
-                        VALUE: written_value,
-                        CONTROLLER: self.connection_id,
-                        SLAVE: self.device_id,
-                    },
-                )
+                written_value = getattr(result, "value", value)
+                cache_save(self.hass, register, written_value, self.controller_key)
+                payload = self._event_base.copy()
+                payload[REGISTER] = register
+                payload[VALUE] = written_value
+                self.hass.bus.async_fire(DOMAIN, payload)
 
                 return result
         except asyncio.CancelledError:
             raise  # Never swallow cancellation
         except ConnectionException as e:
-            _LOGGER.warning(f"({self.host}.{self.device_id}) Connection lost writing register {register}: {e}")
+            _LOGGER.warning("%sConnection lost writing register %s: %s", self._log_prefix, register, e)
             return None
         except ModbusException as e:
-            _LOGGER.error(f"({self.host}.{self.device_id}) Modbus error writing register {register}: {e}")
+            _LOGGER.error("%sModbus error writing register %s: %s", self._log_prefix, register, e)
             return None
         except Exception as e:
-            _LOGGER.error(
-                f"({self.host}.{self.device_id}) Unexpected error writing register {register}: {e}",
-                exc_info=True,
-            )
+            _LOGGER.error("%sUnexpected error writing register %s: %s", self._log_prefix, register, e, exc_info=True)
             return None
 
-    async def _execute_write_holding_registers(self, start_register, values):
+    async def _execute_write_holding_registers(self, start_register, values, skip_delay=False):
         """Executes a multiple register write.
 
+        Blocks longer than MAX_WRITE_BLOCK_REGISTERS are split into consecutive
+        requests; the write stops at the first failed chunk.
+
         Args:
             start_register (int): The starting register address to write to.
             values (list): A list of values to write to consecutive registers.
+            skip_delay (bool): Skip the inter-frame delay (shutdown drain only).
 
         Returns:
             result: The result of the write operation, or None if an error occurred.
@@ -421,50 +615,71 @@ class ModbusController:
         try:
             if not await self.connect():
                 _LOGGER.debug(
-                    f"({self.host}.{self.device_id}) Skipping write to registers {start_register}-{start_register + len(values) - 1} - not connected"
+                    "%sSkipping write to registers %s-%s - not connected",
+                    self._log_prefix,
+                    start_register,
+                    start_register + len(values) - 1,
                 )
                 return None
+            async_fire = self.hass.bus.async_fire
+            event_base = self._event_base
             async with self.poll_lock:
-                await self.inter_frame_wait(is_write=True)  # Delay before write
-
-                result = await self.client.write_registers(
-                    address=start_register, values=values, device_id=self.device_id
-                )
-                _LOGGER.debug(
-                    f"({self.host}.{self.device_id}) Write Holding Register block for {len(values)} registers starting at register = {start_register}"
-                )
-
-                if result.isError():
-                    _LOGGER.error(f"({self.host}.{self.device_id}) Write block failed: {result}")
-                    return None
-
-                for i, value in enumerate(values):
-                    cache_save(self.hass, start_register + i, value, self.controller_key)
-                    self.hass.bus.async_fire(
-                        DOMAIN,
-                        {
-                            REGISTER: start_register + i,
-                            VALUE: value,
-                            CONTROLLER: self.connection_id,
-                            SLAVE: self.device_id,
-                        },
+                # FC16 carries at most MAX_WRITE_BLOCK_REGISTERS, so longer blocks go out as several frames
+                for offset in range(0, len(values), MAX_WRITE_BLOCK_REGISTERS):
+                    chunk_start = start_register + offset
+                    chunk = values[offset : offset + MAX_WRITE_BLOCK_REGISTERS]
+                    if not skip_delay:
+                        await self.inter_frame_wait(is_write=True)  # Delay before write
+
+                    result = await self.client.write_registers(
+                        address=chunk_start, values=chunk, device_id=self.device_id
                     )
+                    _LOGGER.debug(
+                        "%sWrite Holding Register block for %s registers starting at register = %s",
+                        self._log_prefix,
+                        len(chunk),
+                        chunk_start,
+                    )
+
+                    if result.isError():
+                        _LOGGER.error("%sWrite block failed: %s", self._log_prefix, result)
+                        return None
+
+                    cache_save_range(self.hass, chunk_start, chunk, self.controller_key)
+                    # Entity listeners consume one event per register, so the events stay per register
+                    for register, value in enumerate(chunk, chunk_start):
+                        payload = event_base.copy()
+                        payload[REGISTER] = register
+                        payload[VALUE] = value
+                        async_fire(DOMAIN, payload)
                 return result
         except asyncio.CancelledError:
             raise  # Never swallow cancellation
         except ConnectionException as e:
             _LOGGER.warning(
-                f"({self.host}.{self.device_id}) Connection lost writing registers {start_register}-{start_register + len(values) - 1}: {e}"
+                "%sConnection lost writing registers %s-%s: %s",
+                self._log_prefix,
+                start_register,
+                start_register + len(values) - 1,
+                e,
             )
             return None
         except ModbusException as e:
             _LOGGER.error(
-                f"({self.host}.{self.device_id}) Modbus error writing registers {start_register}-{start_register + len(values) - 1}: {e}"
+                "%sModbus error writing registers %s-%s: %s",
+                self._log_prefix,
+                start_register,
+                start_register + len(values) - 1,
+                e,
             )
             return None
         except Exception as e:
             _LOGGER.error(
-                f"({self.host}.{self.device_id}) Unexpected error writing registers {start_register}-{start_register + len(values) - 1}: {e}",
+                "%sUnexpected error writing registers %s-%s: %s",
+                self._log_prefix,
+                start_register,
+                start_register + len(values) - 1,
+                e,
                 exc_info=True,
             )
             return None
@@ -479,9 +694,14 @@ class ModbusController:
         Returns:
             The write result on success, or None on failure.
         """
-        future = asyncio.get_event_loop().create_future()
-        await self.write_queue.put((register, value, False, future))
-        return await future
+        try:
+            register = int(register)
+            value = int(value)
+        except (TypeError, ValueError):
+            _LOGGER.error("%sInvalid write to register %s: value %r", self._log_prefix, register, value)
+            return None
+
+        return await self._enqueue_write(register, value, False)
 
     async def async_write_holding_registers(self, start_register, values):
         """Queues a write request and waits for completion.
@@ -493,15 +713,62 @@ class ModbusController:
         Returns:
             The write result on success, or None on failure.
         """
-        future = asyncio.get_event_loop().create_future()
-        await self.write_queue.put((start_register, values, True, future))
-        return await future
+        try:
+            start_register = int(start_register)
+            values = [int(value) for value in values]
+        except (TypeError, ValueError):
+            _LOGGER.error("%sInvalid write to registers from %s: %r", self._log_prefix, start_register, values)
+            return None
+
+        return await self._enqueue_write(start_register, values, True)
+
+    async def _enqueue_write(self, register, value, multiple):
+        """Queue a write request and wait for its result.
+
+        A single-register write to the same register as the last queued request
+        replaces that request's value instead of adding a frame; both callers get
+        the result of the one write. Only the tail of the queue is merged, so
+        writes are never reordered.
+
+        Args:
+            register (int): The (starting) register address to write to.
+            value: The int value, or list of values if multiple is True.
+            multiple (bool): Whether this is a block write.
+
+        Returns:
+            The write result on success, or None on failure or if the queue is full.
+        """
+        if not multiple and self._tail_write is not None and self._tail_write[0] == register:
+            future = self._tail_write[1]
+            if not future.done():
+                _LOGGER.debug(
+                    "%sReplacing queued write to register %s with value %s", self._log_prefix, register, value
+                )
+                self._write_overrides[future] = value
+                # Shielded so one caller giving up doesn't cancel the write for the other
+                return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.write_queue.put_nowait((register, value, multiple, future))
+        except asyncio.QueueFull:
+            _LOGGER.warning(
+                "%sWrite queue full (%s pending), dropping write to register %s",
+                self._log_prefix,
+                self.write_queue.qsize(),
+                register,
+            )
+            return None
+        self._tail_write = None if multiple else (register, future)
+        return await asyncio.shield(future)
 
     async def inter_frame_wait(self, is_write=False):
         """Implements inter-frame delay to respect Modbus timing requirements.
 
         This method calculates the time since the last Modbus request and adds
         a delay if necessary to ensure proper spacing between operations.
+        The clock is shared by all controllers on the same connection and must
+        be called with poll_lock held.
 
         Args:
             is_write (bool): If True, uses a longer delay for write operations.
@@ -509,16 +776,18 @@ class ModbusController:
         Returns:
             None
         """
-        delay_ms = INTER_FRAME_DELAY_WRITE_MS if is_write else INTER_FRAME_DELAY_READ_MS
-
-        current_time = time.perf_counter()
-        elapsed = (current_time - self._last_modbus_request) * 1000  # Convert to ms
+        delay_s = _INTER_FRAME_DELAY_WRITE_S if is_write else _INTER_FRAME_DELAY_READ_S
 
-        if elapsed < delay_ms:
-            sleep_time = (delay_ms - elapsed) / 1000
-            await asyncio.sleep(sleep_time)
+        # Seconds until this operation's gap after the last request has elapsed
+        bus_timing = self._bus_timing
+        now = time.monotonic()
+        wait = bus_timing.last_request + delay_s - now
+        if wait > 0:
+            await asyncio.sleep(wait)
+            # Re-read after sleeping: the loop may wake late, and the gap is measured from the real send time
+            now = time.monotonic()
 
-        self._last_modbus_request = time.perf_counter()
+        bus_timing.last_request = now
 
     async def _async_read_input_register_raw(self, register, count):
         """Raw read input registers without connection check (internal use)."""
@@ -527,13 +796,11 @@ class ModbusController:
 
             result = await self.client.read_input_registers(address=register, count=count, device_id=self.device_id)
 
-            _LOGGER.debug(
-                f"({self.host}.{self.device_id}) Read Input Registers: register = {register}, count = {count}"
-            )
+            _LOGGER.debug("%sRead Input Registers: register = %s, count = %s", self._log_prefix, register, count)
 
             if result.isError():
                 _LOGGER.error(
-                    f"({self.host}.{self.device_id}) Failed to read input registers starting at {register}: {result}"
+                    "%sFailed to read input registers starting at %s: %s", self._log_prefix, register, result
                 )
                 return None
 
@@ -556,7 +823,10 @@ class ModbusController:
         try:
             if not await self.connect():
                 _LOGGER.debug(
-                    f"({self.host}.{self.device_id}) Skipping read of input registers {register}-{register + count - 1} - not connected"
+                    "%sSkipping read of input registers %s-%s - not connected",
+                    self._log_prefix,
+                    register,
+                    register + count - 1,
                 )
                 return None
             return await self._async_read_input_register_raw(register, count)
@@ -564,17 +834,25 @@ class ModbusController:
             raise  # Never swallow cancellation
         except ConnectionException as e:
             _LOGGER.warning(
-                f"({self.host}.{self.device_id}) Connection lost reading input registers {register}-{register + count - 1}: {e}"
+                "%sConnection lost reading input registers %s-%s: %s",
+                self._log_prefix,
+                register,
+                register + count - 1,
+                e,
             )
             return None
         except ModbusException as e:
             _LOGGER.error(
-                f"({self.host}.{self.device_id}) Modbus error reading input registers {register}-{register + count - 1}: {e}"
+                "%sModbus error reading input registers %s-%s: %s", self._log_prefix, register, register + count - 1, e
             )
             return None
         except Exception as e:
             _LOGGER.error(
-                f"({self.host}.{self.device_id}) Unexpected error reading input registers {register}-{register + count - 1}: {e}",
+                "%sUnexpected error reading input registers %s-%s: %s",
+                self._log_prefix,
+                register,
+                register + count - 1,
+                e,
                 exc_info=True,
             )
             return None
@@ -595,7 +873,10 @@ class ModbusController:
         try:
             if not await self.connect():
                 _LOGGER.debug(
-                    f"({self.host}.{self.device_id}) Skipping read of holding registers {register}-{register + count - 1} - not connected"
+                    "%sSkipping read of holding registers %s-%s - not connected",
+                    self._log_prefix,
+                    register,
+                    register + count - 1,
                 )
                 return None
             async with self.poll_lock:
@@ -605,13 +886,11 @@ class ModbusController:
                     address=register, count=count, device_id=self.device_id
                 )
 
-                _LOGGER.debug(
-                    f"({self.host}.{self.device_id}) Read Holding Registers: register = {register}, count = {count}"
-                )
+                _LOGGER.debug("%sRead Holding Registers: register = %s, count = %s", self._log_prefix, register, count)
 
                 if result.isError():
                     _LOGGER.error(
-                        f"({self.host}.{self.device_id}) Failed to read holding registers starting at {register}: {result}"
+                        "%sFailed to read holding registers starting at %s: %s", self._log_prefix, register, result
                     )
                     return None
 
@@ -621,17 +900,29 @@ class ModbusController:
             raise  # Never swallow cancellation
         except ConnectionException as e:
             _LOGGER.warning(
-                f"({self.host}.{self.device_id}) Connection lost reading holding registers {register}-{register + count - 1}: {e}"
+                "%sConnection lost reading holding registers %s-%s: %s",
+                self._log_prefix,
+                register,
+                register + count - 1,
+                e,
             )
             return None
         except ModbusException as e:
             _LOGGER.error(
-                f"({self.host}.{self.device_id}) Modbus error reading holding registers {register}-{register + count - 1}: {e}"
+                "%sModbus error reading holding registers %s-%s: %s",
+                self._log_prefix,
+                register,
+                register + count - 1,
+                e,
             )
             return None
         except Exception as e:
             _LOGGER.error(
-                f"({self.host}.{self.device_id}) Unexpected error reading holding registers {register}-{register + count - 1}: {e}",
+                "%sUnexpected error reading holding registers %s-%s: %s",
+                self._log_prefix,
+                register,
+                register + count - 1,
+                e,
                 exc_info=True,
             )
             return None
@@ -651,60 +942,87 @@ class ModbusController:
             Exception: If there is an error during the connection attempt.
         """
         if self.connected():
+            # Another controller sharing this client may have reconnected it while our breaker was tripped
+            if self.circuit_breaker.state != CircuitState.CLOSED:
+                self.circuit_breaker.record_success()
             return True
 
         # Check circuit breaker before attempting connection
         if not self.circuit_breaker.can_attempt():
             remaining = self.circuit_breaker.time_until_retry
             if remaining:
-                _LOGGER.debug(
-                    f"({self.host}.{self.device_id}) Connection blocked by circuit breaker. "
-                    f"Retry in {remaining.total_seconds():.0f}s"
-                )
+                _LOGGER.debug("%sConnection blocked by circuit breaker. Retry in %.0fs", self._log_prefix, remaining)
             return False
 
+        self.circuit_breaker.record_attempt()
         try:
-            await self.client.connect()
+            await asyncio.wait_for(self.client.connect(), timeout=CONNECT_TIMEOUT_SECONDS)
             if self.connected():
-                _LOGGER.info(f"({self.host}.{self.device_id}) Connected to Modbus device")
+                _LOGGER.info("%sConnected to Modbus device", self._log_prefix)
                 self.connect_failures = 0
                 self.circuit_breaker.record_success()
+                self._connected_event.set()
 
                 if self.serial_number is None:
-                    _LOGGER.info(f"serial got from device: {self.serial_number}")
+                    _LOGGER.info("serial got from device: %s", self.serial_number)
                 else:
-                    _LOGGER.info(f"serial got from cache: {self.serial_number}")
+                    _LOGGER.info("serial got from cache: %s", self.serial_number)
 
                 return True
             else:
                 self.connect_failures += 1
                 self.circuit_breaker.record_failure()
+                self._connected_event.clear()
                 _LOGGER.debug(
-                    f"({self.connection_id}.{self.device_id}) Connection attempt {self.connect_failures} failed"
+                    "(%s.%s) Connection attempt %s failed", self.connection_id, self.device_id, self.connect_failures
                 )
                 return False
         except asyncio.CancelledError:
+            self.circuit_breaker.abort_attempt()
             raise  # Never swallow cancellation
         except ConnectionException as e:
             self.connect_failures += 1
             self.circuit_breaker.record_failure()
+            self._connected_event.clear()
             _LOGGER.debug(
-                f"({self.connection_id}.{self.device_id}) Connection failed (attempt {self.connect_failures}): {e}"
+                "(%s.%s) Connection failed (attempt %s): %s",
+                self.connection_id,
+                self.device_id,
+                self.connect_failures,
+                e,
+            )
+            return False
+        except TimeoutError:
+            self.connect_failures += 1
+            self.circuit_breaker.record_failure()
+            self._connected_event.clear()
+            _LOGGER.debug(
+                "(%s.%s) Connection timed out after %.0fs (attempt %s)",
+                self.connection_id,
+                self.device_id,
+                CONNECT_TIMEOUT_SECONDS,
+                self.connect_failures,
             )
             return False
         except OSError as e:
             # Network-level errors (connection refused, timeout, etc.)
             self.connect_failures += 1
             self.circuit_breaker.record_failure()
+            self._connected_event.clear()
             _LOGGER.debug(
-                f"({self.connection_id}.{self.device_id}) Network error (attempt {self.connect_failures}): {e}"
+                "(%s.%s) Network error (attempt %s): %s", self.connection_id, self.device_id, self.connect_failures, e
             )
             return False
         except Exception as e:
             self.connect_failures += 1
             self.circuit_breaker.record_failure()
+            self._connected_event.clear()
             _LOGGER.warning(
-                f"({self.connection_id}.{self.device_id}) Unexpected connection error (attempt {self.connect_failures}): {e}",
+                "(%s.%s) Unexpected connection error (attempt %s): %s",
+                self.connection_id,
+                self.device_id,
+                self.connect_failures,
+                e,
                 exc_info=True,
             )
             return False
@@ -727,7 +1045,7 @@ class ModbusController:
             None
         """
         self.enabled = False
-        _LOGGER.info(f"({self.host}.{self.device_id}) Modbus connection disabled")
+        _LOGGER.info("%sModbus connection disabled", self._log_prefix)
 
     def enable_connection(self):
         """Enables the Modbus connection.
@@ -739,7 +1057,7 @@ class ModbusController:
             None
         """
         self.enabled = True
-        _LOGGER.info(f"({self.host}.{self.device_id}) Modbus connection enabled")
+        _LOGGER.info("%sModbus connection enabled", self._log_prefix)
 
     def close_connection(self):
         """Closes the Modbus connection and releases the client from the manager.
@@ -752,14 +1070,15 @@ class ModbusController:
         """
         manager = ModbusClientManager.get_instance()
         manager.release_client(self.connection_id)
-        _LOGGER.info(f"({self.host}.{self.device_id}) Modbus connection closed")
+        self._connected_event.clear()
+        _LOGGER.info("%sModbus connection closed", self._log_prefix)
 
     @property
     def model(self):
         """Returns the inverter model."""
         return self._model
 
-    @property
+    @cached_property
     def poll_speed(self):
         """Returns a dictionary of poll intervals for different speed categories."""
         return {
@@ -776,10 +1095,12 @@ class ModbusController:
     def set_sw_version(self, version: str) -> None:
         """Set the software/protocol version of the inverter."""
         self._sw_version = version
+        self.__dict__.pop("device_info", None)
 
     def set_model(self, model: str) -> None:
         """Set the model description of the inverter."""
         self._model = model
+        self.__dict__.pop("device_info", None)
 
     @property
     def sensor_groups(self):
@@ -801,7 +1122,8 @@ class ModbusController:
         Args:
             groups_to_remove: List of SungrowSensorGroup instances to remove.
         """
-        self._sensor_groups = [g for g in self._sensor_groups if g not in groups_to_remove]
+        removed = set(groups_to_remove)
+        self._sensor_groups = [g for g in self._sensor_groups if g not in removed]
 
     @property
     def derived_sensors(self):
@@ -815,12 +1137,12 @@ class ModbusController:
 
     @property
     def last_modbus_request(self):
-        """Gets the timestamp of the last Modbus request.
+        """Gets the timestamp of the last Modbus request on this controller's connection.
 
         Returns:
             float: The timestamp of the last Modbus request (from time.monotonic()).
         """
-        return self._last_modbus_request
+        return self._bus_timing.last_request
 
     @property
     def last_modbus_success(self):
@@ -832,9 +1154,9 @@ class ModbusController:
         """Gets the device serial number."""
         return self.serial_number
 
-    @property
+    @cached_property
     def device_info(self):
-        """Return device info."""
+        """Return device info, rebuilt after set_model() or set_sw_version()."""
         # Include serial number in device name for unique entity IDs when multiple inverters exist
         name = f"{MANUFACTURER} {self.model} {self.serial_number}"
 
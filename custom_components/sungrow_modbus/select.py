@@ -5,11 +5,68 @@ from homeassistant.core import HomeAssistant
 
 from custom_components.sungrow_modbus import ModbusController
 from custom_components.sungrow_modbus.data.enums import InverterFeature, InverterType
-from custom_components.sungrow_modbus.helpers import get_controller_from_entry
+from custom_components.sungrow_modbus.helpers import freeze_definitions, get_controller_from_entry
 from custom_components.sungrow_modbus.sensors.sungrow_select_entity import SungrowSelectEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sungrow Hybrid Inverter selects
+# Reference: modbus_sungrow.yaml and Sungrow Modbus documentation
+_HYBRID_SELECT_GROUPS = freeze_definitions(
+    [
+        # EMS Mode Selection - Register 13049
+        # 0 = Self-consumption mode (default)
+        # 2 = Forced mode (compulsory mode in modbus spec)
+        # 3 = External EMS
+        # 4 = VPP (used for Amber control)
+        # 8 = MicroGrid
+        {
+            "register": 13049,
+            "name": "EMS Mode",
+            "entities": [
+                {"name": "Self-consumption", "on_value": 0},
+                {"name": "Forced mode", "on_value": 2},
+                {"name": "External EMS", "on_value": 3},
+                {"name": "VPP", "on_value": 4},
+                {"name": "MicroGrid", "on_value": 8},
+            ],
+        },
+        # Battery Forced Charge/Discharge Command - Register 13050
+        # 0xCC (204) = Stop (default)
+        # 0xAA (170) = Forced charge
+        # 0xBB (187) = Forced discharge
+        {
+            "register": 13050,
+            "name": "Battery Forced Charge/Discharge",
+            "entities": [
+                {"name": "Stop", "on_value": 0xCC},
+                {"name": "Force Charge", "on_value": 0xAA},
+                {"name": "Force Discharge", "on_value": 0xBB},
+            ],
+        },
+    ]
+)
+
+# Load Adjustment Mode - Register 13001 (battery models only)
+# 0 = Timing
+# 1 = ON/OFF
+# 2 = Power optimization
+# 3 = Disabled
+_HYBRID_BATTERY_SELECT_GROUPS = freeze_definitions(
+    [
+        {
+            "register": 13001,
+            "name": "Load Adjustment Mode",
+            "entities": [
+                {"name": "Timing", "on_value": 0},
+                {"name": "ON/OFF", "on_value": 1},
+                {"name": "Power optimization", "on_value": 2},
+                {"name": "Disabled", "on_value": 3},
+            ],
+        }
+    ]
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,71 +82,17 @@ async def async_setup_entry(
     if len(config_entry.options) > 0:
         platform_config = config_entry.options
 
-    _LOGGER.info(f"Sungrow platform_config: {platform_config}")
+    _LOGGER.info("Sungrow platform_config: %s", platform_config)
 
     sensor_groups = []
 
     if inverter_type == InverterType.HYBRID:
-        # Sungrow Hybrid Inverter selects
-        # Reference: modbus_sungrow.yaml and Sungrow Modbus documentation
-
-        # EMS Mode Selection - Register 13049
-        # 0 = Self-consumption mode (default)
-        # 2 = Forced mode (compulsory mode in modbus spec)
-        # 3 = External EMS
-        # 4 = VPP (used for Amber control)
-        # 8 = MicroGrid
-        sensor_groups.append(
-            {
-                "register": 13049,
-                "name": "EMS Mode",
-                "entities": [
-                    {"name": "Self-consumption", "on_value": 0},
-                    {"name": "Forced mode", "on_value": 2},
-                    {"name": "External EMS", "on_value": 3},
-                    {"name": "VPP", "on_value": 4},
-                    {"name": "MicroGrid", "on_value": 8},
-                ],
-            }
-        )
-
-        # Battery Forced Charge/Discharge Command - Register 13050
-        # 0xCC (204) = Stop (default)
-        # 0xAA (170) = Forced charge
-        # 0xBB (187) = Forced discharge
-        sensor_groups.append(
-            {
-                "register": 13050,
-                "name": "Battery Forced Charge/Discharge",
-                "entities": [
-                    {"name": "Stop", "on_value": 0xCC},
-                    {"name": "Force Charge", "on_value": 0xAA},
-                    {"name": "Force Discharge", "on_value": 0xBB},
-                ],
-            }
-        )
-
-        # Load Adjustment Mode - Register 13001
-        # 0 = Timing
-        # 1 = ON/OFF
-        # 2 = Power optimization
-        # 3 = Disabled
+        sensor_groups.extend(_HYBRID_SELECT_GROUPS)
         if InverterFeature.BATTERY in controller.inverter_config.features:
-            sensor_groups.append(
-                {
-                    "register": 13001,
-                    "name": "Load Adjustment Mode",
-                    "entities": [
-                        {"name": "Timing", "on_value": 0},
-                        {"name": "ON/OFF", "on_value": 1},
-                        {"name": "Power optimization", "on_value": 2},
-                        {"name": "Disabled", "on_value": 3},
-                    ],
-                }
-            )
+            sensor_groups.extend(_HYBRID_BATTERY_SELECT_GROUPS)
 
-    sensors: list[SungrowSelectEntity] = []
-    for sensor_group in sensor_groups:
-        sensors.append(SungrowSelectEntity(hass, controller, sensor_group))
-    _LOGGER.info(f"Select entities = {len(sensors)}")
+    sensors: list[SungrowSelectEntity] = [
+        SungrowSelectEntity(hass, controller, sensor_group) for sensor_group in sensor_groups
+    ]
+    _LOGGER.info("Select entities = %s", len(sensors))
     async_add_devices(sensors, True)
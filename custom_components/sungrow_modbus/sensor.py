@@ -19,21 +19,24 @@ from custom_components.sungrow_modbus.sensors.sungrow_sensor import SungrowSenso
 
 _LOGGER = logging.getLogger(__name__)
 
+# Placeholder register definitions that don't get an entity
+_SKIP_NAMES = frozenset({"reserve"})
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities):
     """Set up Modbus sensors from a config entry."""
     controller: ModbusController = get_controller_from_entry(hass, config_entry)
-    sensor_entities: list[SungrowSensor] = []
-    sensor_derived_entities: list[SensorEntity] = []
     hass.data[DOMAIN].setdefault(VALUES, {})
 
-    for sensor_group in controller.sensor_groups:
-        for sensor in sensor_group.sensors:
-            if sensor.name != "reserve":
-                sensor_entities.append(SungrowSensor(hass, sensor))
-
-    for sensor in controller.derived_sensors:
-        sensor_derived_entities.append(SungrowDerivedSensor(hass, sensor))
+    sensor_entities: list[SungrowSensor] = [
+        SungrowSensor(hass, sensor)
+        for sensor_group in controller.sensor_groups
+        for sensor in sensor_group.sensors
+        if sensor.name not in _SKIP_NAMES
+    ]
+    sensor_derived_entities: list[SensorEntity] = [
+        SungrowDerivedSensor(hass, sensor) for sensor in controller.derived_sensors
+    ]
 
     # Namespace by entry_id to support multi-inverter setups
     hass.data[DOMAIN].setdefault(SENSOR_ENTITIES, {})
@@ -41,8 +44,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     hass.data[DOMAIN][SENSOR_ENTITIES][config_entry.entry_id] = sensor_entities
     hass.data[DOMAIN][SENSOR_DERIVED_ENTITIES][config_entry.entry_id] = sensor_derived_entities
 
-    async_add_entities(sensor_entities, True)
-    async_add_entities(sensor_derived_entities, True)
+    # Register everything in one batch so the platform runs its add pipeline once
+    new_entities: list[SensorEntity] = [*sensor_entities, *sensor_derived_entities]
 
     # Set up battery stack sensors if multi-battery is enabled
     battery_controllers = hass.data[DOMAIN].get(BATTERY_CONTROLLER, {}).get(config_entry.entry_id)
@@ -55,8 +58,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
         hass.data[DOMAIN].setdefault(BATTERY_SENSORS, {})
         hass.data[DOMAIN][BATTERY_SENSORS][config_entry.entry_id] = status_sensors
 
-        async_add_entities(status_sensors, True)
-        async_add_entities(diagnostic_sensors, True)
+        new_entities.extend(status_sensors)
+        new_entities.extend(diagnostic_sensors)
 
         _LOGGER.info(
             "Added %d battery sensors for %d stack(s)",
@@ -64,4 +67,6 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
             len(battery_controllers),
         )
 
+    async_add_entities(new_entities, True)
+
     return True
@@ -8,6 +8,9 @@ Note: These registers are only accessible via the inverter's direct LAN port,
 not through WiNet-S which only exposes limited battery data on slave ID 2.
 """
 
+from collections.abc import Mapping
+from typing import Any
+
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import (
     PERCENTAGE,
@@ -18,6 +21,7 @@ from homeassistant.const import (
 )
 
 from custom_components.sungrow_modbus.data.enums import Category, PollSpeed
+from custom_components.sungrow_modbus.helpers import freeze_definitions
 
 # Battery stack sensors (read from slave ID 200+)
 # These are separate from inverter sensor groups and polled independently
@@ -156,8 +160,11 @@ battery_stack_diagnostic_sensors = [
     },
 ]
 
+battery_stack_sensors = freeze_definitions(battery_stack_sensors)
+battery_stack_diagnostic_sensors = freeze_definitions(battery_stack_diagnostic_sensors)
+
 
-def get_battery_sensor_unique_id(sensor: dict, stack_index: int, inverter_serial: str) -> str:
+def get_battery_sensor_unique_id(sensor: Mapping[str, Any], stack_index: int, inverter_serial: str) -> str:
     """Generate unique ID for a battery sensor.
 
     Args:
@@ -168,11 +175,14 @@ def get_battery_sensor_unique_id(sensor: dict, stack_index: int, inverter_serial
     Returns:
         Unique ID string for the sensor entity
     """
-    base_unique = sensor.get("unique", sensor.get("name", "unknown").lower().replace(" ", "_"))
+    base_unique = sensor.get("unique")
+    if base_unique is None:
+        # Only derive a slug from the name when the definition has no unique key
+        base_unique = sensor.get("name", "unknown").lower().replace(" ", "_")
     return f"sungrow_modbus_{inverter_serial}_battery_{stack_index}_{base_unique}"
 
 
-def get_battery_sensor_name(sensor: dict, stack_index: int) -> str:
+def get_battery_sensor_name(sensor: Mapping[str, Any], stack_index: int) -> str:
     """Generate display name for a battery sensor.
 
     Args:
@@ -42,7 +42,10 @@ Example:
 """
 
 import copy
+import fnmatch
+import functools
 import logging
+import re
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
@@ -146,6 +149,12 @@ MODEL_OVERRIDES: dict[str, dict[str, Any]] = {
 }
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Translate a wildcard model pattern into a compiled, case-sensitive regex (cached per pattern)."""
+    return re.compile(fnmatch.translate(pattern))
+
+
 def _match_model(model: str, pattern: str) -> bool:
     """
     Check if a model name matches a pattern.
@@ -158,17 +167,7 @@ def _match_model(model: str, pattern: str) -> bool:
     if "*" not in pattern:
         return model == pattern
 
-    # Simple wildcard matching
-    parts = pattern.split("*")
-    if len(parts) == 2:
-        # Single wildcard: "SH*T" or "SH*" or "*T"
-        prefix, suffix = parts
-        return model.startswith(prefix) and model.endswith(suffix)
-    else:
-        # Multiple wildcards (len >= 3) - use fnmatch for complex patterns
-        import fnmatch
-
-        return fnmatch.fnmatch(model, pattern)
+    return _compile_pattern(pattern).match(model) is not None
 
 
 def get_model_overrides(model: str) -> dict[str, Any] | None:
@@ -186,18 +185,24 @@ def get_model_overrides(model: str) -> dict[str, Any] | None:
 
     for pattern, overrides in MODEL_OVERRIDES.items():
         if _match_model(model, pattern):
-            _LOGGER.debug(f"Model {model} matches override pattern {pattern}")
+            _LOGGER.debug("Model %s matches override pattern %s", model, pattern)
             # Deep merge the overrides
             _deep_merge(merged_overrides, overrides)
 
     return merged_overrides if merged_overrides else None
 
 
+# Leaf values that can be shared with MODEL_OVERRIDES without copying
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
 def _deep_merge(base: dict, overlay: dict) -> dict:
     """Deep merge overlay into base dict, modifying base in place."""
     for key, value in overlay.items():
         if key in base and isinstance(base[key], dict) and isinstance(value, dict):
             _deep_merge(base[key], value)
+        elif isinstance(value, _IMMUTABLE_TYPES):
+            base[key] = value
         else:
             base[key] = copy.deepcopy(value)
     return base
@@ -212,48 +217,54 @@ def apply_model_overrides(sensor_groups: list[dict[str, Any]], model: str) -> li
         model: The inverter model name
 
     Returns:
-        Modified sensor groups with overrides applied
+        Modified sensor groups with overrides applied. The input is never
+        modified: only overridden entities and the groups containing them are
+        copied (shallowly); everything else is shared with the input. The input
+        list itself is returned when the matching overrides change nothing.
     """
     overrides = get_model_overrides(model)
     if not overrides:
         return sensor_groups
 
-    _LOGGER.info(f"Applying model overrides for {model}")
-
-    # Deep copy to avoid modifying the original
-    modified_groups = copy.deepcopy(sensor_groups)
-
     # Get sensor-specific overrides
     sensor_overrides = overrides.get("sensors", {})
+    additional = overrides.get("additional_sensors", [])
+    if not sensor_overrides and not additional:
+        # Matched only placeholder entries (e.g. "SH*T")
+        return sensor_groups
+
+    _LOGGER.info("Applying model overrides for %s", model)
 
     # Apply overrides to each sensor
-    for group in modified_groups:
-        entities = group.get("entities", [])
+    modified_groups = []
+    for group in sensor_groups:
         filtered_entities = []
+        changed = False
 
-        for entity in entities:
+        for entity in group.get("entities", []):
             unique_id = entity.get("unique", "")
+            override = sensor_overrides.get(unique_id)
 
-            if unique_id in sensor_overrides:
-                override = sensor_overrides[unique_id]
+            if override is not None:
+                changed = True
 
                 # Check if sensor should be disabled
                 if override.get("disabled", False):
-                    _LOGGER.debug(f"Disabling sensor {unique_id} for model {model}")
+                    _LOGGER.debug("Disabling sensor %s for model %s", unique_id, model)
                     continue
 
-                # Apply property overrides
+                # Apply property overrides to a copy so the base definition stays intact
+                entity = entity.copy()
                 for key, value in override.items():
                     if key != "disabled":
-                        _LOGGER.debug(f"Overriding {unique_id}.{key} = {value}")
+                        _LOGGER.debug("Overriding %s.%s = %s", unique_id, key, value)
                         entity[key] = value
 
             filtered_entities.append(entity)
 
-        group["entities"] = filtered_entities
+        modified_groups.append({**group, "entities": filtered_entities} if changed else group)
 
     # Add model-specific additional sensors
-    additional = overrides.get("additional_sensors", [])
     if additional:
         # Add as a new sensor group
         modified_groups.append(
@@ -276,29 +287,31 @@ def apply_derived_overrides(derived_sensors: list[dict[str, Any]], model: str) -
         model: The inverter model name
 
     Returns:
-        Modified derived sensors with overrides applied
+        Modified derived sensors with overrides applied. The input is never
+        modified; only overridden sensors are copied (shallowly). The input
+        list itself is returned when the matching overrides change nothing.
     """
     overrides = get_model_overrides(model)
     if not overrides:
         return derived_sensors
 
-    # Deep copy to avoid modifying the original
-    modified = copy.deepcopy(derived_sensors)
-
     # Get derived sensor overrides
     derived_overrides = overrides.get("derived_sensors", {})
+    additional = overrides.get("additional_derived_sensors", [])
+    if not derived_overrides and not additional:
+        return derived_sensors
 
     filtered = []
-    for sensor in modified:
+    for sensor in derived_sensors:
         unique_id = sensor.get("unique", "")
+        override = derived_overrides.get(unique_id)
 
-        if unique_id in derived_overrides:
-            override = derived_overrides[unique_id]
-
+        if override is not None:
             if override.get("disabled", False):
-                _LOGGER.debug(f"Disabling derived sensor {unique_id} for model {model}")
+                _LOGGER.debug("Disabling derived sensor %s for model %s", unique_id, model)
                 continue
 
+            sensor = sensor.copy()
             for key, value in override.items():
                 if key != "disabled":
                     sensor[key] = value
@@ -306,7 +319,6 @@ def apply_derived_overrides(derived_sensors: list[dict[str, Any]], model: str) -
         filtered.append(sensor)
 
     # Add model-specific additional derived sensors
-    additional = overrides.get("additional_derived_sensors", [])
     filtered.extend(additional)
 
     return filtered
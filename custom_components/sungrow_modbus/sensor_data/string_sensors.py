@@ -10,6 +10,7 @@ from homeassistant.const import (
 )
 
 from custom_components.sungrow_modbus.data.enums import Category, InverterFeature, PollSpeed
+from custom_components.sungrow_modbus.helpers import freeze_definitions
 
 # Sungrow String Inverter Modbus Registers
 # Based on: SunGather registers-sungrow.yaml and Sungrow communication protocols
@@ -425,5 +426,7 @@ string_sensors = [
     },
 ]
 
+string_sensors = freeze_definitions(string_sensors)
+
 # Derived sensors (calculated from other sensor values)
 string_sensors_derived = []
@@ -1,5 +1,7 @@
 # sungrow_base.py
 import logging
+from itertools import pairwise
+from types import MappingProxyType
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.components.switch import SwitchDeviceClass
@@ -22,7 +24,7 @@ from custom_components.sungrow_modbus.data.alarm_codes import (
     get_system_state,
 )
 from custom_components.sungrow_modbus.data.enums import Category, InverterFeature, PollSpeed
-from custom_components.sungrow_modbus.helpers import _any_in, cache_get, extract_serial_number, split_s32
+from custom_components.sungrow_modbus.helpers import _any_in, cache_get_many, extract_serial_number, split_s32
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,21 +37,108 @@ VALUE_MAPPING_FUNCTIONS = {
 
 # Default validation bounds by unit of measurement
 # Used when sensor definitions don't specify explicit min/max values
-DEFAULT_BOUNDS_BY_UNIT = {
-    PERCENTAGE: (0, 100),
-    UnitOfTemperature.CELSIUS: (-40, 100),
-    UnitOfElectricPotential.VOLT: (0, 1000),
-    UnitOfElectricCurrent.AMPERE: (-100, 100),
-    UnitOfPower.WATT: (-50000, 50000),
-    UnitOfPower.KILO_WATT: (-50, 50),
-    UnitOfEnergy.KILO_WATT_HOUR: (0, 1000000),
-    UnitOfFrequency.HERTZ: (45, 65),
-}
+DEFAULT_BOUNDS_BY_UNIT = MappingProxyType(
+    {
+        PERCENTAGE: (0, 100),
+        UnitOfTemperature.CELSIUS: (-40, 100),
+        UnitOfElectricPotential.VOLT: (0, 1000),
+        UnitOfElectricCurrent.AMPERE: (-100, 100),
+        UnitOfPower.WATT: (-50000, 50000),
+        UnitOfPower.KILO_WATT: (-50, 50),
+        UnitOfEnergy.KILO_WATT_HOUR: (0, 1000000),
+        UnitOfFrequency.HERTZ: (45, 65),
+    }
+)
+
+# Registers whose limits/scaling depend on the inverter model or features (see dynamic_adjustments)
+HV_BATTERY_SENSITIVE_REGISTERS = frozenset({33205, 33206, 33207, 43013, 43117})
+RHI_MODELS = frozenset({"RHI-1P", "RHI-3P", "RAI-3K-48ES-5G"})
+S6_REGISTERS = frozenset({33142, 33161, 33162, 33163, 33164, 33165, 33166, 33167, 33168})
+
+
+# Register decoders, one per value layout. SungrowBaseSensor picks one at construction
+# so reads don't re-branch on the (fixed) layout every time. Each returns None when a
+# register it needs hasn't been read yet.
+# Sign extension (here and in split_s32) stays plain int arithmetic: values arrive one or
+# two words at a time, where a numpy scalar round-trip would cost more than it saves.
+def _decode_string(values: list[int], multiplier: float):
+    if None in values:
+        return None
+    return extract_serial_number(values)
+
+
+def _decode_s32(values: list[int], multiplier: float):
+    if values[0] is None or values[1] is None:
+        return None
+    return round(split_s32(values))
+
+
+def _decode_s32_scaled(values: list[int], multiplier: float):
+    if values[0] is None or values[1] is None:
+        return None
+    return split_s32(values) * multiplier
+
+
+def _decode_u16(values: list[int], multiplier: float):
+    raw_value = values[0]
+    if raw_value is None:
+        return None
+    return round(raw_value)
+
+
+def _decode_u16_scaled(values: list[int], multiplier: float):
+    raw_value = values[0]
+    if raw_value is None:
+        return None
+    return raw_value * multiplier
+
+
+def _decode_s16(values: list[int], multiplier: float):
+    raw_value = values[0]
+    if raw_value is None:
+        return None
+    return round(raw_value - 65536 if raw_value >= 32768 else raw_value)
+
+
+def _decode_s16_scaled(values: list[int], multiplier: float):
+    raw_value = values[0]
+    if raw_value is None:
+        return None
+    return (raw_value - 65536 if raw_value >= 32768 else raw_value) * multiplier
 
 
 class SungrowBaseSensor:
     """Base class for all Sungrow sensors."""
 
+    # One instance per register definition, so keep them free of a per-instance __dict__
+    __slots__ = (
+        "hass",
+        "unique_id",
+        "controller",
+        "name",
+        "default",
+        "registrars",
+        "write_register",
+        "editable",
+        "multiplier",
+        "device_class",
+        "unit_of_measurement",
+        "hidden",
+        "state_class",
+        "max_value",
+        "step",
+        "enabled",
+        "min_value",
+        "poll_speed",
+        "category",
+        "value_mapping",
+        "_map_value",
+        "signed",
+        "_last_raw_value",
+        "_decode",
+        "_check_bounds",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -92,7 +181,7 @@ class SungrowBaseSensor:
         self.default = default
         self.registrars = registrars
         self.write_register = write_register
-        _LOGGER.debug(f" self.registrars = {self.registrars} | self.write_register = {self.write_register}")
+        _LOGGER.debug(" self.registrars = %s | self.write_register = %s", self.registrars, self.write_register)
         self.editable = editable
         self.multiplier = multiplier
         self.device_class = device_class
@@ -104,35 +193,64 @@ class SungrowBaseSensor:
         self.step = self.get_step(step)
         self.enabled = enabled
         self.min_value = min_value
-        self._apply_default_bounds()
+        # Unit defaults only fill bounds the definition left open; explicit values always win
+        if self.min_value is None or self.max_value is None:
+            default_min, default_max = DEFAULT_BOUNDS_BY_UNIT.get(self.unit_of_measurement, (None, None))
+            if self.min_value is None:
+                self.min_value = default_min
+            if self.max_value is None:
+                self.max_value = default_max
         self.poll_speed = poll_speed
         self.category = category
         self.value_mapping = value_mapping
+        self._map_value = self._resolve_value_mapping(value_mapping)
         self.signed = signed
         self._last_raw_value = None  # Store raw value for attributes
 
         self.dynamic_adjustments()
+        self._select_decoder()
+        # Mapped, string and unbounded sensors have nothing to validate on read
+        self._check_bounds = (
+            self.value_mapping is None
+            and self._decode is not _decode_string
+            and (self.min_value is not None or self.max_value is not None)
+        )
+
+    def _select_decoder(self) -> None:
+        """Pick the register decoder for this sensor's layout.
+
+        Must run again if registrars, multiplier or signed change after construction.
+        """
+        unscaled = self.multiplier == 0 or self.multiplier == 1
+        if len(self.registrars) > 1:
+            # multiplier == 0 indicates string type (serial numbers, firmware versions, etc.)
+            if self.multiplier == 0:
+                self._decode = _decode_string
+            else:
+                self._decode = _decode_s32 if unscaled else _decode_s32_scaled
+        elif self.signed:
+            self._decode = _decode_s16 if unscaled else _decode_s16_scaled
+        else:
+            self._decode = _decode_u16 if unscaled else _decode_u16_scaled
 
     def dynamic_adjustments(self):
         inv_model = self.controller.inverter_config.model
         inv_features = self.controller.inverter_config.features
 
         # HV battery-specific adjustments
-        if InverterFeature.HV_BATTERY in inv_features:
-            hv_battery_sensitive_regs = {33205, 33206, 33207, 43013, 43117}
-            if _any_in(self.registrars, hv_battery_sensitive_regs):
-                self.min_value = 0
-                self.step = min(self.step, 0.1)
+        if InverterFeature.HV_BATTERY in inv_features and _any_in(self.registrars, HV_BATTERY_SENSITIVE_REGISTERS):
+            self.min_value = 0
+            self.step = min(self.step, 0.1)
 
         # RHI/RAI models: 1 <--> 1W (range: 0–30000)
-        if inv_model in {"RHI-1P", "RHI-3P", "RAI-3K-48ES-5G"} and 43074 in self.registrars:
+        if inv_model in RHI_MODELS and 43074 in self.registrars:
             self.multiplier = 1
 
         # S6-EH3P10K-H-ZP or ZONNEPLAN feature: apply 0.01 multiplier
-        elif inv_model == "S6-EH3P10K-H-ZP" or InverterFeature.ZONNEPLAN in inv_features:
-            s6_registers = {33142, 33161, 33162, 33163, 33164, 33165, 33166, 33167, 33168}
-            if _any_in(self.registrars, s6_registers):
-                self.multiplier = 0.01
+        elif (inv_model == "S6-EH3P10K-H-ZP" or InverterFeature.ZONNEPLAN in inv_features) and _any_in(
+            self.registrars, S6_REGISTERS
+        ):
+            self.multiplier = 0.01
 
     def adjust_max(self, max_default):
         try:
@@ -144,7 +262,11 @@ class SungrowBaseSensor:
             elif self.unit_of_measurement == UnitOfPower.KILO_WATT:
                 new_max = self.controller.inverter_config.wattage_chosen / 1000
             _LOGGER.debug(
-                f"max value for {self.registrars} with UOM {self.unit_of_measurement} set to {new_max} instead of {max_default}"
+                "max value for %s with UOM %s set to %s instead of %s",
+                self.registrars,
+                self.unit_of_measurement,
+                new_max,
+                max_default,
             )
             self.max_value = new_max
         except Exception as e:
@@ -164,7 +286,7 @@ class SungrowBaseSensor:
 
     @property
     def get_raw_values(self):
-        return [cache_get(self.hass, reg, self.controller.controller_key) for reg in self.registrars]
+        return cache_get_many(self.hass, self.registrars, self.controller.controller_key)
 
     @property
     def get_value(self):
@@ -174,35 +296,16 @@ class SungrowBaseSensor:
         return self._convert_raw_value(value)
 
     def _convert_raw_value(self, values: list[int]):
-        if None in values:
+        n_value = self._decode(values, self.multiplier)
+        if n_value is None:
             return None
 
-        # multiplier == 0 indicates string type (serial numbers, firmware versions, etc.)
-        if self.multiplier == 0 and len(self.registrars) > 1:
-            n_value = extract_serial_number(values)
-        elif len(self.registrars) > 1:
-            combined_value = split_s32(values)
-
-            if self.multiplier == 0 or self.multiplier == 1:
-                n_value = round(combined_value)
-            else:
-                n_value = combined_value * self.multiplier
-        else:
-            # Treat it as a single register (U16/S16)
-            raw_value = values[0]
-            # Convert from unsigned to signed 16-bit if needed
-            if self.signed and raw_value >= 32768:
-                raw_value = raw_value - 65536
-            if self.multiplier == 0 or self.multiplier == 1:
-                n_value = round(raw_value)
-            else:
-                n_value = raw_value * self.multiplier
-
         # Store raw value for attribute access
         self._last_raw_value = n_value
 
         # Validate converted value against bounds
-        self._validate_read_value(n_value)
+        if self._check_bounds:
+            self._validate_read_value(n_value)
 
         # Apply value mapping if configured
         if self.value_mapping is not None:
@@ -210,6 +313,18 @@ class SungrowBaseSensor:
 
         return n_value
 
+    @staticmethod
+    def _resolve_value_mapping(value_mapping):
+        """Resolve a value_mapping setting to a lookup callable, or None if there's nothing to look up."""
+        if isinstance(value_mapping, str):
+            lookup_func = VALUE_MAPPING_FUNCTIONS.get(value_mapping)
+            if lookup_func is None:
+                _LOGGER.warning("Unknown value mapping type: %s", value_mapping)
+            return lookup_func
+        if isinstance(value_mapping, dict):
+            return lambda value: value_mapping.get(value, f"Unknown ({value})")
+        return None
+
     def _apply_value_mapping(self, raw_value: int) -> str:
         """
         Convert a raw numeric value to a human-readable string using the configured mapping.
@@ -223,20 +338,10 @@ class SungrowBaseSensor:
         if raw_value is None:
             return None
 
-        # Handle string mapping type (predefined mappings)
-        if isinstance(self.value_mapping, str):
-            lookup_func = VALUE_MAPPING_FUNCTIONS.get(self.value_mapping)
-            if lookup_func:
-                return lookup_func(int(raw_value))
-            else:
-                _LOGGER.warning(f"Unknown value mapping type: {self.value_mapping}")
-                return str(raw_value)
-
-        # Handle dict mapping type (custom mapping)
-        elif isinstance(self.value_mapping, dict):
-            return self.value_mapping.get(int(raw_value), f"Unknown ({raw_value})")
-
-        return str(raw_value)
+        # Resolved once in __init__; unknown mapping names fall back to the plain value
+        if self._map_value is None:
+            return str(raw_value)
+        return self._map_value(int(raw_value))
 
     @property
     def raw_value(self) -> int | None:
@@ -252,30 +357,6 @@ class SungrowBaseSensor:
         """Return basic sensor information."""
         return {"name": self.name, "registrars": self.registrars}
 
-    @staticmethod
-    def _get_default_bounds(unit_of_measurement) -> tuple[int | None, int | None]:
-        """
-        Get default validation bounds based on unit of measurement.
-
-        Returns:
-            Tuple of (min_value, max_value) or (None, None) if no defaults defined
-        """
-        return DEFAULT_BOUNDS_BY_UNIT.get(unit_of_measurement, (None, None))
-
-    def _apply_default_bounds(self) -> None:
-        """
-        Apply default validation bounds based on unit of measurement.
-
-        Only applies defaults when min_value or max_value is None (not explicitly set).
-        Explicit values in sensor definitions always take precedence.
-        """
-        default_min, default_max = self._get_default_bounds(self.unit_of_measurement)
-
-        if self.min_value is None and default_min is not None:
-            self.min_value = default_min
-        if self.max_value is None and default_max is not None:
-            self.max_value = default_max
-
     def _validate_read_value(self, value) -> None:
         """
         Log warning if converted value is outside expected bounds.
@@ -316,35 +397,36 @@ class SungrowSensorGroup:
     sensors: list[SungrowBaseSensor]
 
     def __init__(self, hass, definition, controller):
-        self._sensors = list(
-            map(
-                lambda entity: SungrowBaseSensor(
-                    hass=hass,
-                    name=entity.get("name", "reserve"),
-                    controller=controller,
-                    registrars=[int(r) for r in entity["register"]],
-                    write_register=entity.get("write_register", None),
-                    state_class=entity.get("state_class", None),
-                    device_class=entity.get("device_class", None),
-                    unit_of_measurement=entity.get("unit_of_measurement", None),
-                    hidden=entity.get("hidden", False),
-                    editable=entity.get("editable", False),
-                    max_value=entity.get("max"),
-                    min_value=entity.get("min"),
-                    step=entity.get("step", None),
-                    category=entity.get("category", None),
-                    default=entity.get("default", 0),
-                    multiplier=entity.get("multiplier", 1),
-                    value_mapping=entity.get("value_mapping", None),
-                    signed=entity.get("signed", False),
-                    unique_id="{}_{}_{}".format(
-                        DOMAIN, controller.device_serial_number, entity.get("unique", "reserve")
-                    ),
-                    poll_speed=definition.get("poll_speed", PollSpeed.NORMAL),
-                ),
-                definition.get("entities", []),
+        sensor_poll_speed = definition.get("poll_speed", PollSpeed.NORMAL)
+        unique_id_prefix = f"{DOMAIN}_{controller.device_serial_number}_"
+        self._sensors = [
+            SungrowBaseSensor(
+                hass=hass,
+                name=entity.get("name", "reserve"),
+                controller=controller,
+                registrars=[int(r) for r in entity["register"]],
+                write_register=entity.get("write_register", None),
+                state_class=entity.get("state_class", None),
+                device_class=entity.get("device_class", None),
+                unit_of_measurement=entity.get("unit_of_measurement", None),
+                hidden=entity.get("hidden", False),
+                editable=entity.get("editable", False),
+                max_value=entity.get("max"),
+                min_value=entity.get("min"),
+                step=entity.get("step", None),
+                category=entity.get("category", None),
+                default=entity.get("default", 0),
+                multiplier=entity.get("multiplier", 1),
+                value_mapping=entity.get("value_mapping", None),
+                signed=entity.get("signed", False),
+                unique_id=unique_id_prefix + str(entity.get("unique", "reserve")),
+                poll_speed=sensor_poll_speed,
             )
-        )
+            for entity in definition.get("entities", [])
+        ]
+        # The read plan is fixed once the sensors exist; the poll loop asks for it every cycle
+        self._start_register: int = min(reg for sensor in self._sensors for reg in sensor.registrars)
+        self._registrar_count: int = sum(len(sensor.registrars) for sensor in self._sensors)
         self.poll_speed: PollSpeed = definition.get(
             "poll_speed", PollSpeed.NORMAL if self.start_register < 40000 else PollSpeed.SLOW
         )
@@ -352,18 +434,27 @@ class SungrowSensorGroup:
         self._cache_ttl: int | None = definition.get("cache_ttl", None)
 
         _LOGGER.debug(
-            f"Sensor group creation. start registrar = {self.start_register}, sensor count = {self.sensors_count}, registrar count = {self.registrar_count}"
+            "Sensor group creation. start registrar = %s, sensor count = %s, registrar count = %s",
+            self.start_register,
+            self.sensors_count,
+            self.registrar_count,
         )
         self.validate_sequential_registrars()
 
     def validate_sequential_registrars(self):
         """Ensure all registrars increase sequentially without skipping numbers."""
-        all_registrars = sorted(set(reg for sensor in self._sensors for reg in sensor.registrars))
+        all_registrars = sorted({reg for sensor in self._sensors for reg in sensor.registrars})
+
+        # Gap-free groups (the normal case) span exactly as many addresses as they hold
+        if not all_registrars or all_registrars[-1] - all_registrars[0] + 1 == len(all_registrars):
+            return
 
-        for i in range(len(all_registrars) - 1):
-            if all_registrars[i + 1] != all_registrars[i] + 1:
+        for previous, current in pairwise(all_registrars):
+            if current != previous + 1:
                 _LOGGER.error(
-                    f"Registrar sequence error! Found gap between {all_registrars[i]} and {all_registrars[i + 1]} in sensor group."
+                    "Registrar sequence error! Found gap between %s and %s in sensor group.",
+                    previous,
+                    current,
                 )
 
     @property
@@ -376,11 +467,11 @@ class SungrowSensorGroup:
 
     @property
     def registrar_count(self):
-        return sum(len(sensor.registrars) for sensor in self._sensors)
+        return self._registrar_count
 
     @property
     def start_register(self):
-        return min(reg for sensor in self._sensors for reg in sensor.registrars)
+        return self._start_register
 
     @property
     def is_holding(self) -> bool:
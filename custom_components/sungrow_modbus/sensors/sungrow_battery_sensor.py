@@ -4,6 +4,8 @@ Creates sensor entities for battery stacks connected via slave IDs 200-203.
 """
 
 import logging
+from collections.abc import Mapping
+from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.const import EntityCategory
@@ -18,6 +20,21 @@ from custom_components.sungrow_modbus.sensor_data.battery_sensors import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor unique -> key in the BatteryController.read_status() data
+_DATA_KEY_MAP = {
+    "battery_stack_voltage": "voltage",
+    "battery_stack_current": "current",
+    "battery_stack_temperature": "temperature",
+    "battery_stack_soc": "soc",
+    "battery_stack_soh": "soh",
+    "battery_stack_total_charge": "total_charge",
+    "battery_stack_total_discharge": "total_discharge",
+    "battery_stack_max_cell_voltage": "cell_voltage_max",
+    "battery_stack_max_cell_position": "cell_voltage_max_position",
+    "battery_stack_min_cell_voltage": "cell_voltage_min",
+    "battery_stack_min_cell_position": "cell_voltage_min_position",
+}
+
 
 class SungrowBatterySensor(SensorEntity):
     """Sensor entity for a battery stack measurement."""
@@ -26,7 +43,7 @@ class SungrowBatterySensor(SensorEntity):
         self,
         hass: HomeAssistant,
         battery_controller: BatteryController,
-        sensor_def: dict,
+        sensor_def: Mapping[str, Any],
     ):
         """Initialize the battery sensor.
 
@@ -56,6 +73,7 @@ class SungrowBatterySensor(SensorEntity):
         self._multiplier = sensor_def.get("multiplier", 1)
         self._signed = sensor_def.get("signed", False)
         self._register_count = sensor_def.get("register_count", 1)
+        self._data_key = _DATA_KEY_MAP.get(sensor_def.get("unique", ""))
 
         self._attr_native_value = None
         self._attr_available = battery_controller.battery.available
@@ -74,23 +92,7 @@ class SungrowBatterySensor(SensorEntity):
         if not data:
             return
 
-        # Map sensor unique to data key
-        unique = self._sensor_def.get("unique", "")
-        data_key_map = {
-            "battery_stack_voltage": "voltage",
-            "battery_stack_current": "current",
-            "battery_stack_temperature": "temperature",
-            "battery_stack_soc": "soc",
-            "battery_stack_soh": "soh",
-            "battery_stack_total_charge": "total_charge",
-            "battery_stack_total_discharge": "total_discharge",
-            "battery_stack_max_cell_voltage": "cell_voltage_max",
-            "battery_stack_max_cell_position": "cell_voltage_max_position",
-            "battery_stack_min_cell_voltage": "cell_voltage_min",
-            "battery_stack_min_cell_position": "cell_voltage_min_position",
-        }
-
-        data_key = data_key_map.get(unique)
+        data_key = self._data_key
         if data_key and data_key in data:
             self._attr_native_value = data[data_key]
             self._attr_available = True
@@ -114,7 +116,7 @@ class SungrowBatteryDiagnosticSensor(SensorEntity):
         self,
         hass: HomeAssistant,
         battery_controller: BatteryController,
-        sensor_def: dict,
+        sensor_def: Mapping[str, Any],
     ):
         """Initialize the diagnostic sensor.
 
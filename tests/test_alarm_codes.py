@@ -221,6 +221,27 @@ class TestValueMappingIntegration:
         result = sensor.convert_value([99])
         assert "Unknown" in result
 
+    def test_sensor_with_unknown_mapping_name(self, mock_hass, mock_controller, caplog):
+        """Test an unknown mapping name is reported once and falls back to the plain value."""
+        from custom_components.sungrow_modbus.sensors.sungrow_base_sensor import SungrowBaseSensor
+
+        sensor = SungrowBaseSensor(
+            hass=mock_hass,
+            controller=mock_controller,
+            unique_id="test_unknown_mapping",
+            name="Unknown Mapping",
+            registrars=[10000],
+            write_register=None,
+            multiplier=1,
+            value_mapping="no_such_mapping",
+        )
+        assert "Unknown value mapping type: no_such_mapping" in caplog.text
+
+        caplog.clear()
+        assert sensor.convert_value([7]) == "7"
+        assert sensor.convert_value([8]) == "8"
+        assert "Unknown value mapping type" not in caplog.text
+
     def test_sensor_without_mapping(self, mock_hass, mock_controller):
         """Test sensor without value mapping returns numeric value."""
         from custom_components.sungrow_modbus.sensors.sungrow_base_sensor import SungrowBaseSensor
@@ -368,7 +368,7 @@ class TestBatteryControllerReadSerial:
         # "1.2.3" as registers
         firmware_registers = [0x312E, 0x322E, 0x3300, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000]
 
-        call_count = 0
+        calls = []
 
         def create_result(registers):
             result = MagicMock()
@@ -377,12 +377,9 @@ class TestBatteryControllerReadSerial:
             return result
 
         async def mock_read(address, count, device_id):
-            nonlocal call_count
-            call_count += 1
-            if address == 10710:
-                return create_result(serial_registers)
-            elif address == 10720:
-                return create_result(firmware_registers)
+            calls.append((address, count))
+            if address == 10710 and count == 20:
+                return create_result(serial_registers + firmware_registers)
             return create_result([0] * count)
 
         self.mock_client.read_input_registers = mock_read
@@ -394,6 +391,30 @@ class TestBatteryControllerReadSerial:
         assert result is True
         assert controller.battery.serial_number == "BAT12345"
         assert controller.battery.firmware_version == "1.2.3"
+        # Both strings come from one contiguous read
+        assert calls == [(10710, 20)]
+
+    @pytest.mark.asyncio
+    async def test_read_serial_falls_back_when_combined_read_is_short(self):
+        """Test a short combined reply is not decoded as firmware and the serial is read on its own."""
+        serial_registers = [0x4241, 0x5431, 0x3233, 0x3435, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000]
+        calls = []
+
+        async def mock_read(address, count, device_id):
+            calls.append((address, count))
+            result = MagicMock()
+            result.isError.return_value = False
+            result.registers = (serial_registers + [0x312E, 0x322E])[:count]
+            return result
+
+        self.mock_client.read_input_registers = mock_read
+
+        controller = BatteryController(hass=self.hass, inverter_controller=self.inverter_controller, stack_index=0)
+
+        assert await controller.read_serial_and_firmware() is True
+        assert controller.battery.serial_number == "BAT12345"
+        assert controller.battery.firmware_version == ""
+        assert calls == [(10710, 20), (10710, 10)]
 
 
 class TestBatteryControllerReadModules:
@@ -17,6 +17,7 @@ from custom_components.sungrow_modbus.sensor_data.battery_sensors import (
     get_battery_sensor_unique_id,
 )
 from custom_components.sungrow_modbus.sensors.sungrow_battery_sensor import (
+    _DATA_KEY_MAP,
     SungrowBatteryDiagnosticSensor,
     SungrowBatterySensor,
     create_battery_sensors,
@@ -38,6 +39,12 @@ class TestBatterySensorHelpers:
         result = get_battery_sensor_unique_id(sensor_def, 1, "INV789")
         assert result == "sungrow_modbus_INV789_battery_1_battery_stack_soc"
 
+    def test_get_battery_sensor_unique_id_falls_back_to_name(self):
+        """Test unique ID generation for a definition without a unique key."""
+        sensor_def = {"name": "Battery Stack Cycle Count"}
+        result = get_battery_sensor_unique_id(sensor_def, 0, "INV123456")
+        assert result == "sungrow_modbus_INV123456_battery_0_battery_stack_cycle_count"
+
     def test_get_battery_sensor_name(self):
         """Test sensor name generation."""
         sensor_def = {"name": "Battery Stack Voltage"}
@@ -281,3 +288,14 @@ class TestBatterySensorDefinitions:
 
         assert "battery_stack_serial" in unique_ids
         assert "battery_stack_firmware" in unique_ids
+
+    def test_definitions_match_controller_register_map(self):
+        """Test each definition reads the same address and width the battery controller decodes."""
+        controller_registers = {(reg["address"], reg["count"]) for reg in BatteryController.REGISTERS.values()}
+        for sensor in (*battery_stack_sensors, *battery_stack_diagnostic_sensors):
+            assert (sensor["register"], sensor.get("register_count", 1)) in controller_registers, sensor["unique"]
+
+    def test_every_status_sensor_maps_to_battery_data(self):
+        """Test each status sensor resolves the read_status() key it updates from."""
+        for sensor in battery_stack_sensors:
+            assert sensor["unique"] in _DATA_KEY_MAP, f"No data key for {sensor['unique']}"
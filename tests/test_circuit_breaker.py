@@ -1,12 +1,12 @@
 """Tests for the CircuitBreaker class."""
 
+import time
 import unittest
-from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
 from custom_components.sungrow_modbus.modbus_controller import (
     CIRCUIT_BREAKER_FAILURE_THRESHOLD,
-    CIRCUIT_BREAKER_RECOVERY_MINUTES,
+    CIRCUIT_BREAKER_RECOVERY_SECONDS,
     CircuitBreaker,
     CircuitState,
 )
@@ -61,7 +61,7 @@ class TestCircuitBreaker(unittest.TestCase):
         self.assertEqual(CircuitState.OPEN, breaker.state)
 
         # Fast forward time to allow recovery
-        breaker.last_failure_time = datetime.now(UTC) - timedelta(minutes=10)
+        breaker.last_failure_time = time.monotonic() - 600
 
         # Now can_attempt should return True and set state to HALF_OPEN
         self.assertTrue(breaker.can_attempt())
@@ -89,7 +89,7 @@ class TestCircuitBreaker(unittest.TestCase):
         """Test that after recovery timeout, circuit moves to HALF_OPEN."""
         breaker = CircuitBreaker(
             failure_threshold=2,
-            recovery_timeout=timedelta(seconds=1),
+            recovery_timeout_s=1.0,
         )
 
         # Open the circuit
@@ -99,7 +99,7 @@ class TestCircuitBreaker(unittest.TestCase):
         self.assertFalse(breaker.can_attempt())
 
         # Simulate time passing
-        breaker.last_failure_time = datetime.now(UTC) - timedelta(seconds=2)
+        breaker.last_failure_time = time.monotonic() - 2
 
         # Now should allow attempt and move to HALF_OPEN
         self.assertTrue(breaker.can_attempt())
@@ -109,7 +109,7 @@ class TestCircuitBreaker(unittest.TestCase):
         """Test that failure in HALF_OPEN state returns to OPEN."""
         breaker = CircuitBreaker(
             failure_threshold=2,
-            recovery_timeout=timedelta(seconds=1),
+            recovery_timeout_s=1.0,
         )
 
         # Open the circuit
@@ -117,7 +117,7 @@ class TestCircuitBreaker(unittest.TestCase):
         breaker.record_failure()
 
         # Fast forward to allow recovery attempt
-        breaker.last_failure_time = datetime.now(UTC) - timedelta(seconds=2)
+        breaker.last_failure_time = time.monotonic() - 2
         breaker.can_attempt()  # Moves to HALF_OPEN
 
         self.assertEqual(CircuitState.HALF_OPEN, breaker.state)
@@ -132,7 +132,7 @@ class TestCircuitBreaker(unittest.TestCase):
         """Test that success in HALF_OPEN state closes the circuit."""
         breaker = CircuitBreaker(
             failure_threshold=2,
-            recovery_timeout=timedelta(seconds=1),
+            recovery_timeout_s=1.0,
         )
 
         # Open the circuit
@@ -140,7 +140,7 @@ class TestCircuitBreaker(unittest.TestCase):
         breaker.record_failure()
 
         # Fast forward to allow recovery attempt
-        breaker.last_failure_time = datetime.now(UTC) - timedelta(seconds=2)
+        breaker.last_failure_time = time.monotonic() - 2
         breaker.can_attempt()  # Moves to HALF_OPEN
 
         self.assertEqual(CircuitState.HALF_OPEN, breaker.state)
@@ -151,11 +151,44 @@ class TestCircuitBreaker(unittest.TestCase):
         self.assertEqual(CircuitState.CLOSED, breaker.state)
         self.assertEqual(0, breaker.failure_count)
 
+    def test_half_open_allows_one_probe_at_a_time(self):
+        """Test that only one attempt passes while a HALF_OPEN probe is in flight."""
+        breaker = CircuitBreaker(
+            failure_threshold=2,
+            recovery_timeout_s=1.0,
+        )
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.last_failure_time = time.monotonic() - 2
+
+        self.assertTrue(breaker.can_attempt())
+        breaker.record_attempt()
+        self.assertTrue(breaker.probe_in_flight)
+        self.assertFalse(breaker.can_attempt())
+        self.assertFalse(breaker.is_open)
+
+        # An abandoned probe frees the slot; an outcome clears it too
+        breaker.abort_attempt()
+        self.assertTrue(breaker.can_attempt())
+        breaker.record_attempt()
+        breaker.record_success()
+        self.assertFalse(breaker.probe_in_flight)
+        self.assertTrue(breaker.can_attempt())
+
+    def test_record_attempt_when_closed_does_not_block(self):
+        """Test that attempts in CLOSED state never mark a probe in flight."""
+        breaker = CircuitBreaker()
+
+        breaker.record_attempt()
+
+        self.assertFalse(breaker.probe_in_flight)
+        self.assertTrue(breaker.can_attempt())
+
     def test_time_until_retry_when_open(self):
         """Test time_until_retry returns correct value when open."""
         breaker = CircuitBreaker(
             failure_threshold=2,
-            recovery_timeout=timedelta(minutes=5),
+            recovery_timeout_s=300.0,
         )
 
         # Open the circuit
@@ -165,8 +198,8 @@ class TestCircuitBreaker(unittest.TestCase):
         # Should have time remaining
         remaining = breaker.time_until_retry
         self.assertIsNotNone(remaining)
-        self.assertGreater(remaining.total_seconds(), 0)
-        self.assertLessEqual(remaining.total_seconds(), 300)  # 5 minutes
+        self.assertGreater(remaining, 0)
+        self.assertLessEqual(remaining, 300)  # 5 minutes
 
     def test_time_until_retry_when_closed(self):
         """Test time_until_retry returns None when closed."""
@@ -178,7 +211,7 @@ class TestCircuitBreaker(unittest.TestCase):
         """Test time_until_retry returns None when timeout has passed."""
         breaker = CircuitBreaker(
             failure_threshold=2,
-            recovery_timeout=timedelta(seconds=1),
+            recovery_timeout_s=1.0,
         )
 
         # Open the circuit
@@ -186,7 +219,7 @@ class TestCircuitBreaker(unittest.TestCase):
         breaker.record_failure()
 
         # Fast forward past recovery timeout
-        breaker.last_failure_time = datetime.now(UTC) - timedelta(seconds=2)
+        breaker.last_failure_time = time.monotonic() - 2
 
         self.assertIsNone(breaker.time_until_retry)
 
@@ -194,7 +227,7 @@ class TestCircuitBreaker(unittest.TestCase):
         """Test is_open property correctly reflects state."""
         breaker = CircuitBreaker(
             failure_threshold=2,
-            recovery_timeout=timedelta(minutes=5),
+            recovery_timeout_s=300.0,
         )
 
         # Initially not open
@@ -208,7 +241,7 @@ class TestCircuitBreaker(unittest.TestCase):
         self.assertTrue(breaker.is_open)
 
         # Fast forward past recovery
-        breaker.last_failure_time = datetime.now(UTC) - timedelta(minutes=10)
+        breaker.last_failure_time = time.monotonic() - 600
 
         # Should no longer be "open" (ready to attempt)
         self.assertFalse(breaker.is_open)
@@ -218,10 +251,46 @@ class TestCircuitBreaker(unittest.TestCase):
         breaker = CircuitBreaker()
 
         self.assertEqual(CIRCUIT_BREAKER_FAILURE_THRESHOLD, breaker.failure_threshold)
-        self.assertEqual(
-            timedelta(minutes=CIRCUIT_BREAKER_RECOVERY_MINUTES),
-            breaker.recovery_timeout,
-        )
+        self.assertEqual(CIRCUIT_BREAKER_RECOVERY_SECONDS, breaker.recovery_timeout_s)
+
+    @patch("custom_components.sungrow_modbus.modbus_controller.random.uniform", return_value=1.0)
+    def test_recovery_timeout_backs_off_exponentially(self, _mock_uniform):
+        """Test that each failed recovery doubles the wait, up to the cap."""
+        breaker = CircuitBreaker(failure_threshold=1, base_recovery_s=5.0, recovery_timeout_s=30.0)
+
+        waits = []
+        for _ in range(5):
+            breaker.record_failure()  # CLOSED/HALF_OPEN -> OPEN
+            waits.append(breaker.current_recovery_s)
+            breaker.last_failure_time = time.monotonic() - breaker.current_recovery_s - 1
+            self.assertTrue(breaker.can_attempt())  # -> HALF_OPEN
+
+        self.assertEqual([5.0, 10.0, 20.0, 30.0, 30.0], waits)
+
+    @patch("custom_components.sungrow_modbus.modbus_controller.random.uniform", return_value=1.0)
+    def test_success_resets_backoff(self, _mock_uniform):
+        """Test that a successful connection restarts backoff from the base wait."""
+        breaker = CircuitBreaker(failure_threshold=1, base_recovery_s=5.0)
+
+        breaker.record_failure()
+        breaker.last_failure_time = time.monotonic() - 10
+        breaker.can_attempt()
+        breaker.record_failure()
+        self.assertEqual(10.0, breaker.current_recovery_s)
+
+        breaker.record_success()
+        self.assertEqual(0, breaker.open_cycles)
+
+        breaker.record_failure()
+        self.assertEqual(5.0, breaker.current_recovery_s)
+
+    def test_recovery_wait_is_jittered_within_bounds(self):
+        """Test that jitter keeps the wait within +/-20% of the backoff."""
+        for _ in range(20):
+            breaker = CircuitBreaker(failure_threshold=1, base_recovery_s=5.0)
+            breaker.record_failure()
+            self.assertGreaterEqual(breaker.current_recovery_s, 4.0)
+            self.assertLessEqual(breaker.current_recovery_s, 6.0)
 
     def test_logger_prefix_in_messages(self):
         """Test that logger prefix is used in log messages."""
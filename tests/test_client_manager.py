@@ -48,6 +48,18 @@ class TestModbusClientManager(unittest.TestCase):
         # Non-existent
         self.assertIsNone(self.manager.get_client_lock("9.9.9.9:502"))
 
+    @patch("custom_components.sungrow_modbus.client_manager.AsyncModbusTcpClient")
+    def test_get_bus_timing_is_shared_per_connection(self, mock_client_cls):
+        self.manager.get_tcp_client("1.2.3.4", 502)
+        self.manager.get_tcp_client("5.6.7.8", 502)
+
+        timing = self.manager.get_bus_timing("1.2.3.4:502")
+
+        self.assertIs(timing, self.manager.get_bus_timing("1.2.3.4:502"))
+        self.assertIsNot(timing, self.manager.get_bus_timing("5.6.7.8:502"))
+        self.assertEqual(timing.last_request, 0.0)
+        self.assertIsNone(self.manager.get_bus_timing("9.9.9.9:502"))
+
     @patch("custom_components.sungrow_modbus.client_manager.AsyncModbusTcpClient")
     def test_release_client(self, mock_client_cls):
         mock_client = MagicMock()
@@ -3,7 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from custom_components.sungrow_modbus.data.enums import PollSpeed
-from custom_components.sungrow_modbus.data_retrieval import DataRetrieval
+from custom_components.sungrow_modbus.data_retrieval import MERGED_READ_FAILURE_LIMIT, DataRetrieval, _plan_reads
 from custom_components.sungrow_modbus.sensors.sungrow_base_sensor import SungrowSensorGroup
 
 
@@ -294,6 +294,105 @@ class TestDataRetrieval:
         assert once_group in removed_groups
         assert normal_group not in removed_groups
 
+    def _group(self, start, count, poll_speed=PollSpeed.FAST):
+        group = MagicMock(spec=SungrowSensorGroup)
+        group.poll_speed = poll_speed
+        group.start_register = start
+        group.registrar_count = count
+        group.cache_ttl = None
+        group.is_holding = False
+        return group
+
+    @pytest.mark.asyncio
+    async def test_adjacent_groups_share_one_read(self):
+        """Test touching and overlapping groups are fetched with one request, gaps are not bridged."""
+        groups = [self._group(5019, 2), self._group(5011, 4), self._group(5015, 4), self._group(5018, 1)]
+        gap_group = self._group(5022, 1)
+        self.controller.async_read_input_register = AsyncMock(side_effect=lambda start, count: [0] * count)
+
+        await self.data_retrieval.get_modbus_updates([*groups, gap_group], PollSpeed.FAST)
+
+        calls = [c.args for c in self.controller.async_read_input_register.call_args_list]
+        assert calls == [(5011, 10), (5022, 1)]
+
+    @pytest.mark.asyncio
+    async def test_failed_coalesced_read_falls_back_to_single_groups(self):
+        """Test a failing merged read is retried per group so healthy groups still update."""
+        first, second = self._group(5011, 4), self._group(5015, 2)
+
+        async def read(start, count):
+            return None if count == 6 or start == 5015 else [7] * count
+
+        self.controller.async_read_input_register = AsyncMock(side_effect=read)
+
+        with patch("custom_components.sungrow_modbus.data_retrieval.cache_save") as mock_save:
+            await self.data_retrieval.get_modbus_updates([first, second], PollSpeed.FAST)
+
+        calls = [c.args for c in self.controller.async_read_input_register.call_args_list]
+        assert calls == [(5011, 6), (5011, 4), (5015, 2)]
+        assert sorted(c.args[1] for c in mock_save.call_args_list) == [5011, 5012, 5013, 5014]
+
+    @pytest.mark.asyncio
+    async def test_failed_coalesced_read_is_not_retried_next_poll(self):
+        """Test a block whose merged read keeps failing while its groups read fine alone is split from then on."""
+        first, second = self._group(5011, 4), self._group(5015, 2)
+
+        async def read(start, count):
+            return None if count == 6 or start == 5015 else [7] * count
+
+        self.controller.async_read_input_register = AsyncMock(side_effect=read)
+
+        for _ in range(MERGED_READ_FAILURE_LIMIT):
+            await self.data_retrieval.get_modbus_updates([first, second], PollSpeed.FAST)
+        self.controller.async_read_input_register.reset_mock()
+        await self.data_retrieval.get_modbus_updates([first, second], PollSpeed.FAST)
+
+        calls = [c.args for c in self.controller.async_read_input_register.call_args_list]
+        assert calls == [(5011, 4), (5015, 2)]
+
+    @pytest.mark.asyncio
+    async def test_single_failed_coalesced_read_merges_again(self):
+        """Test one timed out merged read doesn't stop the block from being merged on later polls."""
+        groups = [self._group(5011, 4), self._group(5015, 2)]
+        timed_out = False
+
+        async def read(start, count):
+            nonlocal timed_out
+            if count == 6 and not timed_out:
+                timed_out = True
+                return None
+            return [7] * count
+
+        self.controller.async_read_input_register = AsyncMock(side_effect=read)
+
+        await self.data_retrieval.get_modbus_updates(groups, PollSpeed.FAST)
+        for _ in range(MERGED_READ_FAILURE_LIMIT):
+            self.controller.async_read_input_register.reset_mock()
+            await self.data_retrieval.get_modbus_updates(groups, PollSpeed.FAST)
+
+            calls = [c.args for c in self.controller.async_read_input_register.call_args_list]
+            assert calls == [(5011, 6)]
+
+    @pytest.mark.asyncio
+    async def test_coalescing_kept_when_every_read_fails(self):
+        """Test an unreachable device doesn't permanently disable coalescing."""
+        groups = [self._group(5011, 4), self._group(5015, 2)]
+        self.controller.async_read_input_register = AsyncMock(return_value=None)
+
+        await self.data_retrieval.get_modbus_updates(groups, PollSpeed.FAST)
+
+        assert [start for start, _, _ in _plan_reads(groups, self.data_retrieval._read_alone)] == [5011]
+
+    def test_plan_reads_respects_block_limit_and_register_type(self):
+        """Test coalescing never exceeds the Modbus read limit or mixes holding and input registers."""
+        holding = self._group(1010, 5)
+        holding.is_holding = True
+        groups = [self._group(1000, 10), holding, self._group(1010, 100), self._group(1110, 20)]
+
+        plan = [(start, count) for start, count, _ in _plan_reads(groups)]
+
+        assert plan == [(1000, 110), (1010, 5), (1110, 20)]
+
 
 class TestDataRetrievalBatteryPolling:
     """Test battery polling in DataRetrieval."""
@@ -373,6 +472,35 @@ class TestDataRetrievalBatteryPolling:
         # Verify sensor was updated
         mock_sensor.update_from_battery_data.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_poll_battery_stacks_routes_data_by_stack(self):
+        """Test each stack's data only reaches that stack's sensors."""
+        from custom_components.sungrow_modbus.const import BATTERY_CONTROLLER, BATTERY_SENSORS, DOMAIN
+
+        controllers = []
+        sensors = []
+        for index in range(2):
+            controller = MagicMock()
+            controller.stack_index = index
+            controller.read_status = AsyncMock(return_value={"voltage": 50.0 + index})
+            controllers.append(controller)
+            sensor = MagicMock()
+            sensor._stack_index = index
+            sensors.append(sensor)
+
+        self.hass.data[DOMAIN] = {
+            BATTERY_CONTROLLER: {"test_entry": controllers},
+            BATTERY_SENSORS: {"test_entry": sensors},
+        }
+
+        with patch("custom_components.sungrow_modbus.data_retrieval.async_track_time_interval"):
+            data_retrieval = DataRetrieval(self.hass, self.controller, entry_id="test_entry")
+
+        await data_retrieval.poll_battery_stacks()
+
+        sensors[0].update_from_battery_data.assert_called_once_with({"voltage": 50.0})
+        sensors[1].update_from_battery_data.assert_called_once_with({"voltage": 51.0})
+
     @pytest.mark.asyncio
     async def test_poll_battery_stacks_exception_handling(self):
         """Test poll_battery_stacks handles exceptions gracefully."""
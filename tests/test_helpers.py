@@ -3,15 +3,24 @@
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from custom_components.sungrow_modbus.const import DOMAIN, DRIFT_COUNTER, VALUES
 from custom_components.sungrow_modbus.helpers import (
+    INVERTER_MODELS,
     _any_in,
     cache_get,
+    cache_get_many,
     cache_save,
+    cache_save_range,
     clock_drift_test,
     decode_inverter_model,
+    decode_inverter_model_hexstr,
     extract_serial_number,
+    freeze_definitions,
+    get_bit_bool,
     hex_to_ascii,
+    set_bit,
     split_s32,
 )
 
@@ -37,6 +46,10 @@ class TestHexToAscii:
         result = hex_to_ascii(0x4131)
         assert result == "A1"
 
+    def test_high_bytes_match_chr(self):
+        """Test that non-ASCII bytes map to the same characters as chr()."""
+        assert hex_to_ascii(0xFF00) == chr(0xFF) + chr(0x00)
+
 
 class TestExtractSerialNumber:
     """Test serial number extraction from register values."""
@@ -134,6 +147,37 @@ class TestClockDriftTest:
             assert result is True
             hass.create_task.assert_called_once()
 
+    def test_correction_cooldown_uses_monotonic_clock(self):
+        """Test a recent correction (monotonic timestamp) suppresses another one."""
+        controller_key = "10.0.0.1:502_1"
+        drift_key = f"{DRIFT_COUNTER}_{controller_key}"
+        correction_key = f"last_clock_correction_{controller_key}"
+
+        hass = MagicMock()
+        hass.data = {DOMAIN: {drift_key: 6, correction_key: 1000.0}}
+        hass.create_task = MagicMock()
+
+        controller = MagicMock()
+        controller.connected.return_value = True
+        controller.controller_key = controller_key
+
+        with (
+            patch("custom_components.sungrow_modbus.helpers.dt_utils") as mock_dt,
+            patch("custom_components.sungrow_modbus.helpers.time.monotonic") as mock_monotonic,
+        ):
+            mock_dt.now.return_value = datetime(2024, 1, 1, 12, 5, 0)
+
+            # 10 minutes after the last correction: still cooling down
+            mock_monotonic.return_value = 1600.0
+            assert clock_drift_test(hass, controller, 12, 0, 0) is False
+            hass.create_task.assert_not_called()
+
+            # Past the cooldown: correction goes ahead and records the monotonic time
+            mock_monotonic.return_value = 4700.0
+            assert clock_drift_test(hass, controller, 12, 0, 0) is True
+            hass.create_task.call_args[0][0].close()
+            assert hass.data[DOMAIN][correction_key] == 4700.0
+
     def test_drift_reset_on_good_time(self):
         """Test drift counter resets when time is good."""
         controller_key = "10.0.0.1:502_1"
@@ -156,6 +200,27 @@ class TestClockDriftTest:
             assert result is False
             assert hass.data[DOMAIN][drift_key] == 0
 
+    def test_midnight_wraparound_within_tolerance(self):
+        """Test device time just before midnight vs current time just after is a small drift."""
+        controller_key = "10.0.0.1:502_1"
+        drift_key = f"{DRIFT_COUNTER}_{controller_key}"
+
+        hass = MagicMock()
+        hass.data = {DOMAIN: {drift_key: 3}}
+
+        controller = MagicMock()
+        controller.connected.return_value = True
+        controller.controller_key = controller_key
+
+        with patch("custom_components.sungrow_modbus.helpers.dt_utils") as mock_dt:
+            mock_dt.now.return_value = datetime(2024, 1, 2, 0, 0, 10)
+
+            # Device still shows 23:59:50 (previous day) - actual drift is +20s
+            result = clock_drift_test(hass, controller, 23, 59, 50)
+
+            assert result is False
+            assert hass.data[DOMAIN][drift_key] == 0
+
     def test_no_correction_when_disconnected(self):
         """Test no correction attempted when controller disconnected."""
         controller_key = "10.0.0.1:502_1"
@@ -231,8 +296,9 @@ class TestDecodeInverterModel:
 
     def test_hex_string_input(self):
         """Test handling of hex string input."""
-        protocol, description = decode_inverter_model("0x3010")
+        protocol, description = decode_inverter_model_hexstr("0x3010")
         assert protocol == 0x30
+        assert "1-Phase Grid-Tied" in description
 
     def test_no_definition(self):
         """Test model code 0x00 returns 'No definition'."""
@@ -240,6 +306,12 @@ class TestDecodeInverterModel:
         assert protocol == 0x10
         assert "No definition" in description
 
+    def test_every_model_byte_matches_table(self):
+        """Test that every model byte decodes to its INVERTER_MODELS entry."""
+        for model in range(256):
+            _, description = decode_inverter_model(0x1000 | model)
+            assert description == INVERTER_MODELS.get(model, "Unknown Model")
+
 
 class TestCacheOperations:
     """Test cache save and get operations."""
@@ -271,6 +343,29 @@ class TestCacheOperations:
 
         assert hass.data[DOMAIN][VALUES]["192.168.1.100:502_1:33000"] == 100
 
+    def test_cache_save_range_with_controller(self):
+        """Test saving consecutive registers in one call matches per-register saves."""
+        hass = MagicMock()
+        hass.data = {}
+
+        cache_save_range(hass, 33000, [100, 101, 102], "192.168.1.100:502_1")
+
+        assert hass.data[DOMAIN][VALUES] == {
+            "192.168.1.100:502_1:33000": 100,
+            "192.168.1.100:502_1:33001": 101,
+            "192.168.1.100:502_1:33002": 102,
+        }
+        assert cache_get(hass, 33001, "192.168.1.100:502_1") == 101
+
+    def test_cache_save_range_without_controller(self):
+        """Test saving consecutive registers without a controller key."""
+        hass = MagicMock()
+        hass.data = {DOMAIN: {VALUES: {}}}
+
+        cache_save_range(hass, 33000, [100, 101])
+
+        assert hass.data[DOMAIN][VALUES] == {"33000": 100, "33001": 101}
+
     def test_cache_get_with_controller(self):
         """Test getting from cache with controller key."""
         hass = MagicMock()
@@ -300,6 +395,41 @@ class TestCacheOperations:
         assert cache_get(hass, 33000, "controller1") == 100
         assert cache_get(hass, 33000, "controller2") == 200
 
+    def test_cache_get_many_with_controller(self):
+        """Test fetching several registers at once matches per-register lookups."""
+        hass = MagicMock()
+        hass.data = {DOMAIN: {VALUES: {"controller1:33000": 100, "controller1:33001": 101, "33000": 7}}}
+
+        assert cache_get_many(hass, [33000, 33001, 33002], "controller1") == [100, 101, None]
+        assert cache_get_many(hass, [33000]) == [7]
+
+    def test_cache_get_many_without_cache(self):
+        """Test fetching before anything was cached returns a None per register."""
+        hass = MagicMock()
+        hass.data = {}
+
+        assert cache_get_many(hass, [33000, 33001], "controller1") == [None, None]
+
+
+class TestFreezeDefinitions:
+    """Test freezing shared sensor definition tables."""
+
+    def test_groups_and_entities_are_read_only(self):
+        """Both the groups and their nested entities reject in-place edits, and the source is left alone."""
+        source = [{"register_start": 100, "entities": [{"name": "A", "register": ["100"]}]}, {"name": "B"}]
+
+        frozen = freeze_definitions(source)
+
+        assert isinstance(frozen, tuple)
+        assert frozen[0]["entities"][0]["name"] == "A"
+        assert frozen[1] == {"name": "B"}
+        with pytest.raises(TypeError):
+            frozen[0]["register_start"] = 0
+        with pytest.raises(TypeError):
+            frozen[0]["entities"][0]["name"] = "changed"
+        source[1]["name"] = "changed"
+        assert frozen[1]["name"] == "B"
+
 
 class TestSplitS32:
     """Test signed 32-bit integer splitting."""
@@ -331,6 +461,17 @@ class TestSplitS32:
         result = split_s32(values)
         assert result == 2147483647
 
+    def test_min_negative(self):
+        """Test splitting the most negative 32-bit value."""
+        # 0x80000000 = -2147483648 (min signed 32-bit)
+        values = [0x8000, 0x0000]
+        result = split_s32(values)
+        assert result == -2147483648
+
+    def test_short_input_returns_zero(self):
+        """Test that fewer than two registers returns 0."""
+        assert split_s32([0x1234]) == 0
+
 
 class TestAnyIn:
     """Test _any_in helper function."""
@@ -364,3 +505,19 @@ class TestAnyIn:
         target = [1, 2, 3]
         collection = {1, 2, 3, 4, 5}
         assert _any_in(target, collection) is True
+
+
+class TestBitHelpers:
+    """Test get_bit_bool and set_bit helpers."""
+
+    def test_get_bit_bool(self):
+        """Test reading individual bits returns real booleans."""
+        assert get_bit_bool(0b1010, 1) is True
+        assert get_bit_bool(0b1010, 2) is False
+
+    def test_set_bit(self):
+        """Test setting and clearing bits leaves other bits untouched."""
+        assert set_bit(0b1010, 0, True) == 0b1011
+        assert set_bit(0b1010, 1, False) == 0b1000
+        assert set_bit(0b1010, 1, True) == 0b1010
+        assert set_bit(0b1010, 0, False) == 0b1010
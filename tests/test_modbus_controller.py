@@ -1,18 +1,25 @@
+import asyncio
+import contextlib
 import unittest
 from datetime import datetime
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from custom_components.sungrow_modbus.client_manager import BusTiming
 from custom_components.sungrow_modbus.const import (
     CONN_TYPE_SERIAL,
     CONN_TYPE_TCP,
+    CONTROLLER,
     DEFAULT_BAUDRATE,
     DEFAULT_BYTESIZE,
     DEFAULT_PARITY,
     DEFAULT_STOPBITS,
+    REGISTER,
+    SLAVE,
+    VALUE,
 )
 from custom_components.sungrow_modbus.data.enums import PollSpeed
-from custom_components.sungrow_modbus.modbus_controller import ModbusController
+from custom_components.sungrow_modbus.modbus_controller import CircuitState, ModbusController
 
 
 class TestModbusControllerTCP(IsolatedAsyncioTestCase):
@@ -42,6 +49,7 @@ class TestModbusControllerTCP(IsolatedAsyncioTestCase):
         self.mock_lock.__aenter__ = AsyncMock(return_value=None)
         self.mock_lock.__aexit__ = AsyncMock(return_value=None)
         self.mock_manager.get_client_lock.return_value = self.mock_lock
+        self.mock_manager.get_bus_timing.return_value = BusTiming()
 
         # Create the controller with TCP connection
         self.controller = ModbusController(
@@ -87,6 +95,22 @@ class TestModbusControllerTCP(IsolatedAsyncioTestCase):
         self.mock_client.connect.assert_called_once()
         self.assertEqual(1, self.controller.connect_failures)
 
+    async def test_connect_timeout_counts_as_failure(self):
+        """Test that a hanging connect is abandoned and recorded as a failure."""
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        self.mock_client.connected = False
+        self.mock_client.connect = AsyncMock(side_effect=hang)
+
+        with patch("custom_components.sungrow_modbus.modbus_controller.CONNECT_TIMEOUT_SECONDS", 0.01):
+            result = await self.controller.connect()
+
+        self.assertFalse(result)
+        self.assertEqual(self.controller.connect_failures, 1)
+        self.assertEqual(self.controller.circuit_breaker.failure_count, 1)
+
     async def test_connect_already_connected(self):
         """Test connection when already connected."""
         self.mock_client.connect = AsyncMock()
@@ -148,7 +172,7 @@ class TestModbusControllerTCP(IsolatedAsyncioTestCase):
         # Mock the write queue with a side effect that resolves the future
         mock_result = MagicMock()
 
-        async def mock_put(item):
+        def mock_put(item):
             register, value, multiple, future = item
             # Verify the queue item structure
             assert register == 100
@@ -158,11 +182,11 @@ class TestModbusControllerTCP(IsolatedAsyncioTestCase):
             future.set_result(mock_result)
 
         self.controller.write_queue = MagicMock()
-        self.controller.write_queue.put = AsyncMock(side_effect=mock_put)
+        self.controller.write_queue.put_nowait = MagicMock(side_effect=mock_put)
 
         result = await self.controller.async_write_holding_register(100, 42)
 
-        self.controller.write_queue.put.assert_called_once()
+        self.controller.write_queue.put_nowait.assert_called_once()
         self.assertEqual(result, mock_result)
 
     async def test_async_write_holding_registers(self):
@@ -170,7 +194,7 @@ class TestModbusControllerTCP(IsolatedAsyncioTestCase):
         # Mock the write queue with a side effect that resolves the future
         mock_result = MagicMock()
 
-        async def mock_put(item):
+        def mock_put(item):
             register, values, multiple, future = item
             # Verify the queue item structure
             assert register == 100
@@ -180,13 +204,48 @@ class TestModbusControllerTCP(IsolatedAsyncioTestCase):
             future.set_result(mock_result)
 
         self.controller.write_queue = MagicMock()
-        self.controller.write_queue.put = AsyncMock(side_effect=mock_put)
+        self.controller.write_queue.put_nowait = MagicMock(side_effect=mock_put)
 
         result = await self.controller.async_write_holding_registers(100, [42, 43])
 
-        self.controller.write_queue.put.assert_called_once()
+        self.controller.write_queue.put_nowait.assert_called_once()
         self.assertEqual(result, mock_result)
 
+    async def test_async_write_coerces_to_int_before_queueing(self):
+        """Test that registers and values are queued as ints."""
+        queued = []
+
+        def mock_put(item):
+            queued.append(item[:3])
+            item[3].set_result(MagicMock())
+
+        self.controller.write_queue = MagicMock()
+        self.controller.write_queue.put_nowait = MagicMock(side_effect=mock_put)
+
+        await self.controller.async_write_holding_register("100", 42.0)
+        await self.controller.async_write_holding_registers("200", ["1", 2.0])
+
+        self.assertEqual([(100, 42, False), (200, [1, 2], True)], queued)
+
+    async def test_async_write_invalid_value_is_not_queued(self):
+        """Test that a value that can't be converted fails without reaching the queue."""
+        self.controller.write_queue = MagicMock()
+        self.controller.write_queue.put_nowait = MagicMock()
+
+        self.assertIsNone(await self.controller.async_write_holding_register(100, "abc"))
+        self.assertIsNone(await self.controller.async_write_holding_registers(100, [1, None]))
+        self.controller.write_queue.put_nowait.assert_not_called()
+
+    async def test_async_write_rejected_when_queue_full(self):
+        """Test that writes are dropped instead of blocking when the queue is full."""
+        while not self.controller.write_queue.full():
+            self.controller.write_queue.put_nowait((1, 1, False, asyncio.get_running_loop().create_future()))
+
+        result = await asyncio.wait_for(self.controller.async_write_holding_register(100, 42), timeout=1)
+
+        self.assertIsNone(result)
+        self.assertEqual(self.controller.write_queue.qsize(), self.controller.write_queue.maxsize)
+
     def test_poll_speed(self):
         """Test the poll_speed property."""
         expected = {PollSpeed.FAST: 5, PollSpeed.NORMAL: 15, PollSpeed.SLOW: 30}
@@ -196,6 +255,17 @@ class TestModbusControllerTCP(IsolatedAsyncioTestCase):
         """Test the model property."""
         self.assertEqual("Test Model", self.controller.model)
 
+    def test_device_info_refreshes_after_model_change(self):
+        """Test device_info is cached and rebuilt by set_model/set_sw_version."""
+        info = self.controller.device_info
+        self.assertIs(info, self.controller.device_info)
+
+        self.controller.set_model("SH10RT")
+        self.controller.set_sw_version("V1.2")
+
+        self.assertEqual("SH10RT", self.controller.device_info["model"])
+        self.assertEqual("V1.2", self.controller.device_info["sw_version"])
+
     def test_connected(self):
         """Test the connected method."""
         self.mock_client.connected = True
@@ -214,6 +284,289 @@ class TestModbusControllerTCP(IsolatedAsyncioTestCase):
         self.controller.enable_connection()
         self.assertTrue(self.controller.enabled)
 
+    async def test_process_write_queue_waits_for_connection(self):
+        """Test that queued writes sleep until connect() signals a connection."""
+
+        async def connect_side_effect():
+            self.mock_client.connected = True
+            return True
+
+        self.mock_client.connected = False
+        self.mock_client.connect = AsyncMock(side_effect=connect_side_effect)
+        mock_result = MagicMock()
+        mock_result.isError = MagicMock(return_value=False)
+        mock_result.value = 42
+        self.mock_client.write_register = AsyncMock(return_value=mock_result)
+
+        processor = asyncio.create_task(self.controller.process_write_queue())
+        try:
+            write = asyncio.create_task(self.controller.async_write_holding_register(100, 42))
+            await asyncio.sleep(0.01)
+            self.mock_client.write_register.assert_not_called()
+
+            await self.controller.connect()
+            result = await asyncio.wait_for(write, timeout=1)
+
+            self.assertEqual(result, mock_result)
+            self.mock_client.write_register.assert_called_once_with(address=100, value=42, device_id=1)
+        finally:
+            processor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await processor
+
+    async def test_process_write_queue_drains_in_flight_request_on_cancel(self):
+        """Test that a dequeued request is still written when the processor is cancelled."""
+        self.mock_client.connected = False
+        self.mock_client.connect = AsyncMock(return_value=False)
+
+        processor = asyncio.create_task(self.controller.process_write_queue())
+        write = asyncio.create_task(self.controller.async_write_holding_register(100, 42))
+        await asyncio.sleep(0.01)
+
+        processor.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await processor
+
+        # Not connected, so the drained write resolves with None instead of hanging
+        self.assertIsNone(await asyncio.wait_for(write, timeout=1))
+        self.assertTrue(self.controller.write_queue.empty())
+
+    async def test_shutdown_drain_writes_without_inter_frame_delay(self):
+        """Test that writes drained on cancel skip the inter-frame delay."""
+        self.mock_client.connected = False
+        mock_result = MagicMock()
+        mock_result.isError = MagicMock(return_value=False)
+        mock_result.value = 42
+        self.mock_client.write_register = AsyncMock(return_value=mock_result)
+
+        processor = asyncio.create_task(self.controller.process_write_queue())
+        write = asyncio.create_task(self.controller.async_write_holding_register(100, 42))
+        await asyncio.sleep(0.01)
+        self.mock_client.connected = True
+
+        with patch.object(self.controller, "inter_frame_wait", AsyncMock()) as mock_wait:
+            processor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await processor
+
+        self.assertEqual(await asyncio.wait_for(write, timeout=1), mock_result)
+        mock_wait.assert_not_awaited()
+
+    async def test_shutdown_drain_rejects_writes_after_deadline(self):
+        """Test that writes still queued after the drain deadline resolve with None unwritten."""
+        self.mock_client.connected = False
+        self.mock_client.write_register = AsyncMock()
+
+        processor = asyncio.create_task(self.controller.process_write_queue())
+        writes = [
+            asyncio.create_task(self.controller.async_write_holding_register(register, 1)) for register in (100, 200)
+        ]
+        await asyncio.sleep(0.01)
+        self.mock_client.connected = True
+
+        with patch("custom_components.sungrow_modbus.modbus_controller.SHUTDOWN_DRAIN_SECONDS", -1):
+            processor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await processor
+
+        self.assertEqual(await asyncio.wait_for(asyncio.gather(*writes), timeout=1), [None, None])
+        self.mock_client.write_register.assert_not_called()
+        self.assertTrue(self.controller.write_queue.empty())
+
+    async def test_process_write_queue_coalesces_contiguous_writes(self):
+        """Test that back-to-back writes to contiguous registers share one block write."""
+        self.mock_client.connected = True
+        block_result = MagicMock()
+        block_result.isError = MagicMock(return_value=False)
+        self.mock_client.write_registers = AsyncMock(return_value=block_result)
+        single_result = MagicMock()
+        single_result.isError = MagicMock(return_value=False)
+        single_result.value = 7
+        self.mock_client.write_register = AsyncMock(return_value=single_result)
+
+        # Queue everything before the processor starts so it is drained as one batch
+        writes = [
+            asyncio.create_task(self.controller.async_write_holding_register(100, 1)),
+            asyncio.create_task(self.controller.async_write_holding_registers(101, [2, 3])),
+            asyncio.create_task(self.controller.async_write_holding_register(103, 4)),
+            asyncio.create_task(self.controller.async_write_holding_register(200, 7)),
+        ]
+        await asyncio.sleep(0)
+
+        processor = asyncio.create_task(self.controller.process_write_queue())
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*writes), timeout=1)
+        finally:
+            processor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await processor
+
+        self.mock_client.write_registers.assert_called_once_with(address=100, values=[1, 2, 3, 4], device_id=1)
+        self.mock_client.write_register.assert_called_once_with(address=200, value=7, device_id=1)
+        self.assertEqual(results, [block_result, block_result, block_result, single_result])
+
+    async def test_process_write_queue_replaces_repeated_writes_to_same_register(self):
+        """Test that repeated writes to one register while queued collapse to the newest value."""
+        self.mock_client.connected = True
+        mock_result = MagicMock()
+        mock_result.isError = MagicMock(return_value=False)
+        mock_result.value = 3
+        self.mock_client.write_register = AsyncMock(return_value=mock_result)
+
+        writes = [asyncio.create_task(self.controller.async_write_holding_register(100, value)) for value in (1, 2, 3)]
+        await asyncio.sleep(0)
+        self.assertEqual(self.controller.write_queue.qsize(), 1)
+
+        processor = asyncio.create_task(self.controller.process_write_queue())
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*writes), timeout=1)
+        finally:
+            processor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await processor
+
+        self.mock_client.write_register.assert_called_once_with(address=100, value=3, device_id=1)
+        self.assertEqual(results, [mock_result] * 3)
+
+    async def test_reads_fail_fast_when_circuit_open(self):
+        """Test that reads return None without touching the client while the breaker is open and the client is down."""
+        for _ in range(self.controller.circuit_breaker.failure_threshold):
+            self.controller.circuit_breaker.record_failure()
+        self.mock_client.connected = False
+        self.mock_client.read_input_registers = AsyncMock()
+        self.mock_client.read_holding_registers = AsyncMock()
+
+        self.assertIsNone(await self.controller.async_read_input_register(100, 1))
+        self.assertIsNone(await self.controller.async_read_holding_register(100, 1))
+        self.mock_client.connect.assert_not_called()
+        self.mock_client.read_input_registers.assert_not_called()
+        self.mock_client.read_holding_registers.assert_not_called()
+
+    async def test_reads_use_shared_client_reconnected_while_circuit_open(self):
+        """Test that a client reconnected by another controller is used and closes the breaker."""
+        for _ in range(self.controller.circuit_breaker.failure_threshold):
+            self.controller.circuit_breaker.record_failure()
+        self.mock_client.connected = True
+        response = MagicMock(registers=[7])
+        response.isError.return_value = False
+        self.mock_client.read_input_registers = AsyncMock(return_value=response)
+
+        self.assertEqual(await self.controller.async_read_input_register(100, 1), [7])
+        self.assertEqual(self.controller.circuit_breaker.state, CircuitState.CLOSED)
+
+    async def test_process_write_queue_rejects_writes_when_circuit_open(self):
+        """Test that queued writes resolve with None immediately while the breaker is open."""
+        for _ in range(self.controller.circuit_breaker.failure_threshold):
+            self.controller.circuit_breaker.record_failure()
+        self.mock_client.connected = False
+        self.mock_client.write_register = AsyncMock()
+
+        processor = asyncio.create_task(self.controller.process_write_queue())
+        try:
+            result = await asyncio.wait_for(self.controller.async_write_holding_register(100, 42), timeout=1)
+        finally:
+            processor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await processor
+
+        self.assertIsNone(result)
+        self.mock_client.write_register.assert_not_called()
+        self.assertTrue(self.controller.write_queue.empty())
+
+    async def test_process_write_queue_writes_when_shared_client_reconnected(self):
+        """Test that an open breaker doesn't reject writes once the shared client is back up."""
+        for _ in range(self.controller.circuit_breaker.failure_threshold):
+            self.controller.circuit_breaker.record_failure()
+        self.mock_client.connected = True
+        mock_result = MagicMock()
+        mock_result.isError.return_value = False
+        self.mock_client.write_register = AsyncMock(return_value=mock_result)
+
+        processor = asyncio.create_task(self.controller.process_write_queue())
+        try:
+            result = await asyncio.wait_for(self.controller.async_write_holding_register(100, 42), timeout=1)
+        finally:
+            processor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await processor
+
+        self.assertEqual(result, mock_result)
+        self.mock_client.write_register.assert_called_once_with(address=100, value=42, device_id=1)
+
+    async def test_inter_frame_wait_sleeps_only_for_remaining_gap(self):
+        """Test that inter_frame_wait sleeps just long enough to honour the frame gap."""
+        self.controller._bus_timing.last_request = 100.0
+        with (
+            patch("custom_components.sungrow_modbus.modbus_controller.time.monotonic", side_effect=[100.02, 100.05]),
+            patch("custom_components.sungrow_modbus.modbus_controller.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        ):
+            await self.controller.inter_frame_wait()
+
+        self.assertAlmostEqual(0.03, mock_sleep.await_args.args[0])
+        self.assertEqual(100.05, self.controller.last_modbus_request)
+
+    async def test_inter_frame_wait_skips_sleep_when_idle(self):
+        """Test that no sleep happens once the gap has already passed, with a single clock read."""
+        self.controller._bus_timing.last_request = 100.0
+        with (
+            patch("custom_components.sungrow_modbus.modbus_controller.time.monotonic", side_effect=[200.0]),
+            patch("custom_components.sungrow_modbus.modbus_controller.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        ):
+            await self.controller.inter_frame_wait(is_write=True)
+
+        mock_sleep.assert_not_awaited()
+        self.assertEqual(200.0, self.controller.last_modbus_request)
+
+    async def test_block_write_fires_one_event_per_register(self):
+        """Test that a block write fires a separate, complete payload per register."""
+        self.mock_client.connected = True
+        mock_result = MagicMock()
+        mock_result.isError = MagicMock(return_value=False)
+        self.mock_client.write_registers = AsyncMock(return_value=mock_result)
+
+        await self.controller._execute_write_holding_registers(100, [1, 2])
+
+        payloads = [call.args[1] for call in self.hass.bus.async_fire.call_args_list]
+        self.assertEqual(
+            [
+                {REGISTER: 100, VALUE: 1, CONTROLLER: "192.168.1.100:502", SLAVE: 1},
+                {REGISTER: 101, VALUE: 2, CONTROLLER: "192.168.1.100:502", SLAVE: 1},
+            ],
+            payloads,
+        )
+        self.assertIsNot(payloads[0], payloads[1])
+
+    async def test_block_write_splits_at_fc16_limit(self):
+        """Test that blocks longer than one FC16 request are written in consecutive chunks."""
+        self.mock_client.connected = True
+        mock_result = MagicMock()
+        mock_result.isError = MagicMock(return_value=False)
+        self.mock_client.write_registers = AsyncMock(return_value=mock_result)
+        values = list(range(130))
+
+        with patch.object(self.controller, "inter_frame_wait", AsyncMock()):
+            result = await self.controller._execute_write_holding_registers(100, values)
+
+        self.assertEqual(result, mock_result)
+        self.assertEqual(
+            [call.kwargs for call in self.mock_client.write_registers.call_args_list],
+            [
+                {"address": 100, "values": values[:123], "device_id": 1},
+                {"address": 223, "values": values[123:], "device_id": 1},
+            ],
+        )
+        self.assertEqual(self.hass.bus.async_fire.call_count, 130)
+
+    def test_contiguous_write_run_length(self):
+        """Test which queued writes are grouped into one block."""
+        future = MagicMock()
+        requests = [(10, 1, False, future), (11, [2, 3], True, future), (14, 4, False, future)]
+        self.assertEqual(2, ModbusController._contiguous_write_run_length(requests))
+
+        # Non-integer registers and values are never merged
+        self.assertEqual(1, ModbusController._contiguous_write_run_length([("10", 1, False, future)] + requests))
+        self.assertEqual(1, ModbusController._contiguous_write_run_length([(9, "1", False, future)] + requests))
+
 
 class TestModbusControllerSerial(IsolatedAsyncioTestCase):
     """Test the ModbusController class with Serial connection."""
@@ -242,6 +595,7 @@ class TestModbusControllerSerial(IsolatedAsyncioTestCase):
         self.mock_lock.__aenter__ = AsyncMock(return_value=None)
         self.mock_lock.__aexit__ = AsyncMock(return_value=None)
         self.mock_manager.get_client_lock.return_value = self.mock_lock
+        self.mock_manager.get_bus_timing.return_value = BusTiming()
 
         # Create the controller with Serial connection
         self.controller = ModbusController(
@@ -368,7 +722,7 @@ class TestModbusControllerSerial(IsolatedAsyncioTestCase):
         # Mock the write queue with a side effect that resolves the future
         mock_result = MagicMock()
 
-        async def mock_put(item):
+        def mock_put(item):
             register, value, multiple, future = item
             # Verify the queue item structure
             assert register == 100
@@ -378,11 +732,11 @@ class TestModbusControllerSerial(IsolatedAsyncioTestCase):
             future.set_result(mock_result)
 
         self.controller.write_queue = MagicMock()
-        self.controller.write_queue.put = AsyncMock(side_effect=mock_put)
+        self.controller.write_queue.put_nowait = MagicMock(side_effect=mock_put)
 
         result = await self.controller.async_write_holding_register(100, 42)
 
-        self.controller.write_queue.put.assert_called_once()
+        self.controller.write_queue.put_nowait.assert_called_once()
         self.assertEqual(result, mock_result)
 
     async def test_async_write_holding_registers(self):
@@ -390,7 +744,7 @@ class TestModbusControllerSerial(IsolatedAsyncioTestCase):
         # Mock the write queue with a side effect that resolves the future
         mock_result = MagicMock()
 
-        async def mock_put(item):
+        def mock_put(item):
             register, values, multiple, future = item
             # Verify the queue item structure
             assert register == 100
@@ -400,11 +754,11 @@ class TestModbusControllerSerial(IsolatedAsyncioTestCase):
             future.set_result(mock_result)
 
         self.controller.write_queue = MagicMock()
-        self.controller.write_queue.put = AsyncMock(side_effect=mock_put)
+        self.controller.write_queue.put_nowait = MagicMock(side_effect=mock_put)
 
         result = await self.controller.async_write_holding_registers(100, [42, 43])
 
-        self.controller.write_queue.put.assert_called_once()
+        self.controller.write_queue.put_nowait.assert_called_once()
         self.assertEqual(result, mock_result)
 
     def test_poll_speed(self):
@@ -456,6 +810,7 @@ class TestModbusControllerInitialization(unittest.TestCase):
         self.mock_manager.get_tcp_client.return_value = self.mock_tcp_client
         self.mock_manager.get_serial_client.return_value = self.mock_serial_client
         self.mock_manager.get_client_lock.return_value = MagicMock()
+        self.mock_manager.get_bus_timing.return_value = BusTiming()
 
     def tearDown(self):
         """Tear down test fixtures."""
@@ -530,6 +885,7 @@ class TestModbusControllerProperties(unittest.TestCase):
 
         self.mock_manager.get_tcp_client.return_value = MagicMock()
         self.mock_manager.get_client_lock.return_value = MagicMock()
+        self.mock_manager.get_bus_timing.return_value = BusTiming()
 
         self.sensor_groups = [MagicMock()]
         self.derived_sensors = [MagicMock()]
@@ -556,6 +912,13 @@ class TestModbusControllerProperties(unittest.TestCase):
         """Test sensor_groups property."""
         self.assertEqual(self.sensor_groups, self.controller.sensor_groups)
 
+    def test_remove_sensor_groups_preserves_order(self):
+        """Removing groups keeps the remaining groups in their original order."""
+        groups = [MagicMock() for _ in range(5)]
+        self.controller._sensor_groups = list(groups)
+        self.controller.remove_sensor_groups([groups[3], groups[1]])
+        self.assertEqual([groups[0], groups[2], groups[4]], self.controller.sensor_groups)
+
     def test_derived_sensors(self):
         """Test derived_sensors property."""
         self.assertEqual(self.derived_sensors, self.controller.derived_sensors)
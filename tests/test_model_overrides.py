@@ -5,6 +5,7 @@ from copy import deepcopy
 
 from custom_components.sungrow_modbus.sensor_data.model_overrides import (
     MODEL_OVERRIDES,
+    _deep_merge,
     _match_model,
     apply_derived_overrides,
     apply_model_overrides,
@@ -41,6 +42,15 @@ class TestModelMatching(unittest.TestCase):
         self.assertTrue(_match_model("SH10RT-V112", "SH*RT*"))
         self.assertTrue(_match_model("SH5.0RT", "SH*RT*"))
 
+    def test_wildcard_prefix_and_suffix_do_not_overlap(self):
+        """Test that the text around a wildcard must not overlap in the model name."""
+        self.assertFalse(_match_model("SH", "SH*H"))
+        self.assertTrue(_match_model("SHH", "SH*H"))
+
+    def test_wildcard_is_case_sensitive(self):
+        """Test that wildcard matching does not fold case."""
+        self.assertFalse(_match_model("sh25t", "SH*T"))
+
 
 class TestModelOverrides(unittest.TestCase):
     """Test applying model overrides."""
@@ -98,6 +108,25 @@ class TestModelOverrides(unittest.TestCase):
         # Cleanup
         del MODEL_OVERRIDES["TEST_MODEL"]
 
+    def test_apply_overrides_copies_only_changed_definitions(self):
+        """Test that overrides leave the input untouched and share unchanged definitions."""
+        MODEL_OVERRIDES["TEST_MODEL"] = {"sensors": {"test_sensor_override": {"register": ["9999"]}}}
+        overridden = {"unique": "test_sensor_override", "register": ["1000"]}
+        untouched = {"unique": "test_sensor_untouched", "register": ["1001"]}
+        other_group = {"register_start": 2000, "entities": [{"unique": "test_other", "register": ["2000"]}]}
+        sensor_groups = [{"register_start": 1000, "entities": [overridden, untouched]}, other_group]
+
+        try:
+            modified = apply_model_overrides(sensor_groups, "TEST_MODEL")
+        finally:
+            del MODEL_OVERRIDES["TEST_MODEL"]
+
+        self.assertEqual(overridden["register"], ["1000"])
+        self.assertEqual(modified[0]["entities"][0]["register"], ["9999"])
+        self.assertIsNot(modified[0], sensor_groups[0])
+        self.assertIs(modified[0]["entities"][1], untouched)
+        self.assertIs(modified[1], other_group)
+
     def test_apply_disabled_sensor(self):
         """Test that disabled sensors are removed."""
         # Temporarily add a disabled sensor to overrides
@@ -165,6 +194,16 @@ class TestModelOverrides(unittest.TestCase):
         # The sensor should be unchanged
         self.assertEqual(modified[0]["entities"][0]["register"], original[0]["entities"][0]["register"])
 
+    def test_placeholder_overrides_return_input_unchanged(self):
+        """Test that a model matching only empty override entries gets the input list back."""
+        sensor_groups = [{"register_start": 1000, "entities": [{"unique": "test_sensor", "register": ["1000"]}]}]
+        derived_sensors = [{"unique": "test_derived", "sources": ["sensor1"]}]
+
+        # SH10T matches only the empty "SH*T" entry
+        self.assertIsNotNone(get_model_overrides("SH10T"))
+        self.assertIs(apply_model_overrides(sensor_groups, "SH10T"), sensor_groups)
+        self.assertIs(apply_derived_overrides(derived_sensors, "SH10T"), derived_sensors)
+
     def test_apply_derived_overrides(self):
         """Test applying overrides to derived sensors."""
         derived_sensors = [
@@ -193,5 +232,24 @@ class TestWildcardPriority(unittest.TestCase):
         self.assertIsNotNone(overrides)
 
 
+class TestDeepMerge(unittest.TestCase):
+    """Test merging of override dictionaries."""
+
+    def test_merge_copies_containers_and_shares_scalars(self):
+        """Nested overlay containers are copied so merged results never alias the source."""
+        overlay = {"sensor": {"register": ["5000"], "multiplier": 0.1, "name": "Power"}}
+        base = {"sensor": {"enabled": True}}
+
+        _deep_merge(base, overlay)
+
+        self.assertEqual(
+            {"sensor": {"enabled": True, "register": ["5000"], "multiplier": 0.1, "name": "Power"}},
+            base,
+        )
+        self.assertIsNot(overlay["sensor"]["register"], base["sensor"]["register"])
+        base["sensor"]["register"].append("5001")
+        self.assertEqual(["5000"], overlay["sensor"]["register"])
+
+
 if __name__ == "__main__":
     unittest.main()
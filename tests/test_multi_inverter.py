@@ -20,6 +20,7 @@ from custom_components.sungrow_modbus.helpers import (
     get_controller_key,
     get_controller_key_from_config,
     is_correct_controller,
+    remove_controller,
     set_controller,
 )
 
@@ -46,19 +47,19 @@ class TestControllerKeyGeneration:
         """Test key generation for TCP connection."""
         controller = create_mock_controller(host="192.168.1.100", port=502, slave=1)
         key = get_controller_key(controller)
-        assert key == "192.168.1.100:502_1"
+        assert key == ("192.168.1.100:502", 1)
 
     def test_get_controller_key_tcp_different_port(self):
         """Test key generation with non-default port."""
         controller = create_mock_controller(host="192.168.1.100", port=8502, slave=1)
         key = get_controller_key(controller)
-        assert key == "192.168.1.100:8502_1"
+        assert key == ("192.168.1.100:8502", 1)
 
     def test_get_controller_key_tcp_different_slave(self):
         """Test key generation with different slave ID."""
         controller = create_mock_controller(host="192.168.1.100", port=502, slave=2)
         key = get_controller_key(controller)
-        assert key == "192.168.1.100:502_2"
+        assert key == ("192.168.1.100:502", 2)
 
     def test_get_controller_key_serial(self):
         """Test key generation for serial connection."""
@@ -66,31 +67,31 @@ class TestControllerKeyGeneration:
         controller.connection_id = "/dev/ttyUSB0"
         controller.device_id = 1
         key = get_controller_key(controller)
-        assert key == "/dev/ttyUSB0_1"
+        assert key == ("/dev/ttyUSB0", 1)
 
     def test_get_controller_key_from_config_tcp(self):
         """Test key from config dict for TCP."""
         config = {"host": "192.168.1.100", "port": 502, "slave": 1, CONF_CONNECTION_TYPE: CONN_TYPE_TCP}
         key = get_controller_key_from_config(config)
-        assert key == "192.168.1.100:502_1"
+        assert key == ("192.168.1.100:502", 1)
 
     def test_get_controller_key_from_config_tcp_default_port(self):
         """Test key from config uses default port 502."""
         config = {"host": "192.168.1.100", "slave": 1, CONF_CONNECTION_TYPE: CONN_TYPE_TCP}
         key = get_controller_key_from_config(config)
-        assert key == "192.168.1.100:502_1"
+        assert key == ("192.168.1.100:502", 1)
 
     def test_get_controller_key_from_config_serial(self):
         """Test key from config for serial connection."""
         config = {CONF_SERIAL_PORT: "/dev/ttyUSB0", "slave": 1, CONF_CONNECTION_TYPE: CONN_TYPE_SERIAL}
         key = get_controller_key_from_config(config)
-        assert key == "/dev/ttyUSB0_1"
+        assert key == ("/dev/ttyUSB0", 1)
 
     def test_get_controller_key_from_config_default_slave(self):
         """Test key from config uses default slave 1."""
         config = {"host": "192.168.1.100", CONF_CONNECTION_TYPE: CONN_TYPE_TCP}
         key = get_controller_key_from_config(config)
-        assert key == "192.168.1.100:502_1"
+        assert key == ("192.168.1.100:502", 1)
 
 
 class TestControllerRegistry:
@@ -104,15 +105,15 @@ class TestControllerRegistry:
         controller = create_mock_controller(host="192.168.1.100", port=502, slave=1)
         set_controller(hass, controller)
 
-        assert "192.168.1.100:502_1" in hass.data[DOMAIN][CONTROLLER]
-        assert hass.data[DOMAIN][CONTROLLER]["192.168.1.100:502_1"] is controller
+        assert ("192.168.1.100:502", 1) in hass.data[DOMAIN][CONTROLLER]
+        assert hass.data[DOMAIN][CONTROLLER][("192.168.1.100:502", 1)] is controller
 
     def test_get_controller_from_entry_tcp(self):
         """Test retrieving controller from config entry."""
         controller = create_mock_controller(host="192.168.1.100", port=502, slave=1)
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"192.168.1.100:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("192.168.1.100:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "192.168.1.100", "port": 502, "slave": 1}
@@ -126,11 +127,50 @@ class TestControllerRegistry:
         controller = create_mock_controller(host="192.168.1.100", port=502, slave=1)
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"192.168.1.100:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("192.168.1.100:502", 1): controller}}}
 
         result = get_controller(hass, "192.168.1.100", 1)
         assert result is controller
 
+    def test_get_controller_non_default_port_uses_host_index(self):
+        """Test get_controller resolves a bare host on a non-default port via the (host, slave) index."""
+        hass = MagicMock()
+        hass.data = {DOMAIN: {CONTROLLER: {}}}
+
+        controller = create_mock_controller(host="192.168.1.100", port=8502, slave=1)
+        set_controller(hass, controller)
+
+        assert get_controller(hass, "192.168.1.100", 1) is controller
+        assert get_controller(hass, "192.168.1.100", 2) is None
+
+    def test_remove_controller_clears_registry_and_index(self):
+        """Test remove_controller drops both the registry entry and the host index entry."""
+        hass = MagicMock()
+        hass.data = {DOMAIN: {CONTROLLER: {}}}
+
+        controller = create_mock_controller(host="192.168.1.100", port=8502, slave=1)
+        set_controller(hass, controller)
+        remove_controller(hass, controller)
+
+        assert hass.data[DOMAIN][CONTROLLER] == {}
+        assert get_controller(hass, "192.168.1.100", 1) is None
+
+    def test_host_index_keeps_controllers_on_other_ports(self):
+        """Test two entries on one host and slave but different ports don't evict each other from the index."""
+        hass = MagicMock()
+        hass.data = {DOMAIN: {CONTROLLER: {}}}
+
+        first = create_mock_controller(host="192.168.1.100", port=8502, slave=1)
+        second = create_mock_controller(host="192.168.1.100", port=8503, slave=1)
+        set_controller(hass, first)
+        set_controller(hass, second)
+
+        assert get_controller(hass, "192.168.1.100", 1) is first
+        remove_controller(hass, first)
+        assert get_controller(hass, "192.168.1.100", 1) is second
+        remove_controller(hass, second)
+        assert get_controller(hass, "192.168.1.100", 1) is None
+
     def test_get_controller_not_found(self):
         """Test get_controller returns None for missing controller."""
         hass = MagicMock()
@@ -215,9 +255,9 @@ class TestMultiInverterSetup:
         set_controller(hass, controller3)
 
         assert len(hass.data[DOMAIN][CONTROLLER]) == 3
-        assert "192.168.1.100:502_1" in hass.data[DOMAIN][CONTROLLER]
-        assert "192.168.1.101:502_1" in hass.data[DOMAIN][CONTROLLER]
-        assert "192.168.1.100:502_2" in hass.data[DOMAIN][CONTROLLER]
+        assert ("192.168.1.100:502", 1) in hass.data[DOMAIN][CONTROLLER]
+        assert ("192.168.1.101:502", 1) in hass.data[DOMAIN][CONTROLLER]
+        assert ("192.168.1.100:502", 2) in hass.data[DOMAIN][CONTROLLER]
 
     def test_controller_lookup_by_host_slave(self):
         """Test finding controller by host and slave when multiple exist."""
@@ -225,7 +265,9 @@ class TestMultiInverterSetup:
         controller2 = create_mock_controller(host="192.168.1.100", slave=2)
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"192.168.1.100:502_1": controller1, "192.168.1.100:502_2": controller2}}}
+        hass.data = {
+            DOMAIN: {CONTROLLER: {("192.168.1.100:502", 1): controller1, ("192.168.1.100:502", 2): controller2}}
+        }
 
         result1 = get_controller(hass, "192.168.1.100", 1)
         result2 = get_controller(hass, "192.168.1.100", 2)
@@ -248,16 +290,16 @@ class TestConnectionTypes:
         controller.connection_id = "/dev/ttyUSB0"
         controller.device_id = 1
         key = get_controller_key(controller)
-        assert key == "/dev/ttyUSB0_1"
+        assert key == ("/dev/ttyUSB0", 1)
 
     def test_config_auto_detects_connection_type(self):
         """Test connection type is auto-detected from config."""
         # TCP config (has host)
         tcp_config = {"host": "192.168.1.100", "slave": 1}
         tcp_key = get_controller_key_from_config(tcp_config)
-        assert "192.168.1.100" in tcp_key
+        assert tcp_key == ("192.168.1.100:502", 1)
 
         # Serial config (no host, has serial_port)
         serial_config = {CONF_SERIAL_PORT: "/dev/ttyUSB0", "slave": 1, CONF_CONNECTION_TYPE: CONN_TYPE_SERIAL}
         serial_key = get_controller_key_from_config(serial_config)
-        assert "/dev/ttyUSB0" in serial_key
+        assert serial_key == ("/dev/ttyUSB0", 1)
@@ -104,7 +104,7 @@ class TestNumberPlatformSetup:
         controller.sensor_groups = [sensor_group]
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -133,7 +133,7 @@ class TestNumberPlatformSetup:
         controller.sensor_groups = [sensor_group]
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -160,7 +160,7 @@ class TestNumberPlatformSetup:
         controller.sensor_groups = [sensor_group]
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
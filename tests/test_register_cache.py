@@ -1,24 +1,14 @@
 """Tests for the RegisterCache TTL-based caching system."""
 
-import time
 from unittest.mock import MagicMock, patch
 
 from custom_components.sungrow_modbus.helpers import (
-    CachedValue,
     RegisterCache,
     get_register_cache,
 )
 
-
-class TestCachedValue:
-    """Tests for the CachedValue dataclass."""
-
-    def test_cached_value_creation(self):
-        """Test creating a CachedValue."""
-        now = time.monotonic()
-        cached = CachedValue(value=42, expires_at=now + 100)
-        assert cached.value == 42
-        assert cached.expires_at > now
+# Nanoseconds per second, for driving the mocked time.monotonic_ns()
+NS = 1_000_000_000
 
 
 class TestRegisterCache:
@@ -43,28 +33,28 @@ class TestRegisterCache:
     def test_get_expired_returns_none(self):
         """Test that getting an expired value returns None."""
         # Use a mock to simulate time passing
-        with patch("custom_components.sungrow_modbus.helpers.time.monotonic") as mock_time:
+        with patch("custom_components.sungrow_modbus.helpers.time.monotonic_ns") as mock_time:
             # Set value at time 0
             mock_time.return_value = 0
             self.cache.set(self.controller_key, 5000, 1234, ttl_seconds=60)
 
             # Get value at time 30 (not expired)
-            mock_time.return_value = 30
+            mock_time.return_value = 30 * NS
             assert self.cache.get(self.controller_key, 5000) == 1234
 
             # Get value at time 61 (expired)
-            mock_time.return_value = 61
+            mock_time.return_value = 61 * NS
             assert self.cache.get(self.controller_key, 5000) is None
 
     def test_expired_value_is_removed(self):
         """Test that expired values are removed from cache on access."""
-        with patch("custom_components.sungrow_modbus.helpers.time.monotonic") as mock_time:
+        with patch("custom_components.sungrow_modbus.helpers.time.monotonic_ns") as mock_time:
             mock_time.return_value = 0
             self.cache.set(self.controller_key, 5000, 1234, ttl_seconds=60)
             assert len(self.cache._cache) == 1
 
             # Access after expiry should remove from cache
-            mock_time.return_value = 61
+            mock_time.return_value = 61 * NS
             self.cache.get(self.controller_key, 5000)
             assert len(self.cache._cache) == 0
 
@@ -87,22 +77,39 @@ class TestRegisterCache:
 
     def test_get_range_partial_expired_returns_none(self):
         """Test that get_range returns None if any value is expired."""
-        with patch("custom_components.sungrow_modbus.helpers.time.monotonic") as mock_time:
+        with patch("custom_components.sungrow_modbus.helpers.time.monotonic_ns") as mock_time:
             mock_time.return_value = 0
 
             # Set first 3 registers
             self.cache.set_range(self.controller_key, 5000, [100, 200, 300], ttl_seconds=60)
 
             # Set register 5003 with shorter TTL
-            mock_time.return_value = 10
+            mock_time.return_value = 10 * NS
             self.cache.set(self.controller_key, 5003, 400, ttl_seconds=30)
             self.cache.set(self.controller_key, 5004, 500, ttl_seconds=60)
 
             # At time 50, register 5003 is expired (set at 10 with 30s TTL)
-            mock_time.return_value = 50
+            mock_time.return_value = 50 * NS
             result = self.cache.get_range(self.controller_key, 5000, 5)
             assert result is None
 
+    def test_get_range_leaves_expired_entries_for_sweep(self):
+        """Test that range lookups don't delete, and set() sweeps expired entries in bulk."""
+        with patch("custom_components.sungrow_modbus.helpers.time.monotonic_ns") as mock_time:
+            mock_time.return_value = 0
+            self.cache.set_range(self.controller_key, 5000, [100, 200], ttl_seconds=30)
+
+            # Expired range miss does not mutate the cache
+            mock_time.return_value = 40 * NS
+            assert self.cache.get_range(self.controller_key, 5000, 2) is None
+            assert self.cache.is_range_cached(self.controller_key, 5000, 2) is False
+            assert len(self.cache._cache) == 2
+
+            # Once the sweep interval has elapsed, the next set() purges them
+            mock_time.return_value = 61 * NS
+            self.cache.set(self.controller_key, 6000, 300, ttl_seconds=30)
+            assert list(self.cache._cache) == [f"{self.controller_key}:6000"]
+
     def test_is_range_cached(self):
         """Test checking if a range is cached."""
         values = [100, 200, 300]
@@ -164,7 +171,7 @@ class TestRegisterCache:
 
     def test_stats(self):
         """Test getting cache statistics."""
-        with patch("custom_components.sungrow_modbus.helpers.time.monotonic") as mock_time:
+        with patch("custom_components.sungrow_modbus.helpers.time.monotonic_ns") as mock_time:
             mock_time.return_value = 0
 
             # Add 3 entries
@@ -177,7 +184,7 @@ class TestRegisterCache:
             assert stats["expired_entries"] == 0
 
             # At time 40, one entry is expired
-            mock_time.return_value = 40
+            mock_time.return_value = 40 * NS
             stats = self.cache.stats()
             assert stats["total_entries"] == 3
             assert stats["expired_entries"] == 1
@@ -190,6 +197,14 @@ class TestRegisterCache:
         assert self.cache.get("controller_a", 5000) == 100
         assert self.cache.get("controller_b", 5000) == 200
 
+    def test_entries_stored_as_value_expiry_tuples(self):
+        """Test that entries are stored as (value, expires_at_ns) tuples."""
+        with patch("custom_components.sungrow_modbus.helpers.time.monotonic_ns") as mock_time:
+            mock_time.return_value = 5 * NS
+            self.cache.set(self.controller_key, 5000, 1234, ttl_seconds=1.5)
+
+        assert self.cache._cache[f"{self.controller_key}:5000"] == (1234, 5 * NS + 1_500_000_000)
+
     def test_overwrite_value(self):
         """Test that setting a value overwrites the previous one."""
         self.cache.set(self.controller_key, 5000, 100, ttl_seconds=60)
@@ -198,6 +213,31 @@ class TestRegisterCache:
         self.cache.set(self.controller_key, 5000, 200, ttl_seconds=60)
         assert self.cache.get(self.controller_key, 5000) == 200
 
+    def test_size_cap_evicts_least_recently_written(self):
+        """Test that the oldest written entries are evicted past max_entries."""
+        cache = RegisterCache(max_entries=3)
+        cache.set_range(self.controller_key, 5000, [100, 101], ttl_seconds=60)
+        cache.set("other_controller", 5000, 200, ttl_seconds=60)
+
+        # Re-writing 5000 makes 5001 the least recently written entry
+        cache.set(self.controller_key, 5000, 110, ttl_seconds=60)
+        cache.set("other_controller", 5001, 201, ttl_seconds=60)
+
+        assert len(cache._cache) == 3
+        assert cache.get(self.controller_key, 5001) is None
+        assert cache.get(self.controller_key, 5000) == 110
+        assert cache._keys_by_controller[self.controller_key] == {f"{self.controller_key}:5000"}
+
+    def test_clear_by_controller_drops_key_index(self):
+        """Test that clearing a controller also drops its key index entry."""
+        self.cache.set_range(self.controller_key, 5000, [1, 2, 3], ttl_seconds=60)
+        self.cache.set("other_controller", 5000, 200, ttl_seconds=60)
+
+        self.cache.clear(self.controller_key)
+
+        assert self.controller_key not in self.cache._keys_by_controller
+        assert self.cache._keys_by_controller == {"other_controller": {"other_controller:5000"}}
+
 
 class TestGetRegisterCache:
     """Tests for the get_register_cache helper function."""
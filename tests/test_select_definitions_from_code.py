@@ -25,7 +25,7 @@ async def test_select_bit_position_requires_combinations_are_unique():
     hass.data = {
         DOMAIN: {
             CONTROLLER: {
-                "10.0.0.1:502_1": controller  # Key format: host:port_slave
+                ("10.0.0.1:502", 1): controller  # Key format: (host:port, slave)
             }
         }
     }
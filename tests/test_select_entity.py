@@ -99,7 +99,7 @@ class TestSelectPlatformSetup:
         controller = create_mock_controller(inverter_type=InverterType.HYBRID)
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -121,7 +121,7 @@ class TestSelectPlatformSetup:
         controller = create_mock_controller(inverter_type=InverterType.HYBRID)
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -149,7 +149,7 @@ class TestSelectPlatformSetup:
         controller = create_mock_controller(inverter_type=InverterType.HYBRID)
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -177,7 +177,7 @@ class TestSelectPlatformSetup:
         controller = create_mock_controller(inverter_type=InverterType.HYBRID, features={InverterFeature.BATTERY})
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -205,7 +205,7 @@ class TestSelectPlatformSetup:
         controller = create_mock_controller(inverter_type=InverterType.STRING)
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
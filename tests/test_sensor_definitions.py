@@ -28,7 +28,7 @@ class TestSensorDefinitions(unittest.TestCase):
                 f"{name}: Group starting at {group['register_start']} != first entity register {first_register}",
             )
 
-            # 4. Ensure register sequence is contiguous
+            # 2. Ensure register sequence is contiguous
             all_regs = []
             for entity in entities:
                 all_regs.extend(int(r) for r in entity["register"])
@@ -40,7 +40,15 @@ class TestSensorDefinitions(unittest.TestCase):
                 f"{name}: Registers in group starting at {group['register_start']} are not sequential: {all_regs_sorted}",
             )
 
-        # 2. all unique fields must be unique
+            # 3. Entities are declared in register order
+            first_registers = [int(entity["register"][0]) for entity in entities]
+            self.assertEqual(
+                first_registers,
+                sorted(first_registers),
+                f"{name}: Entities in group starting at {group['register_start']} are not in register order",
+            )
+
+        # 4. all unique fields must be unique
         seen_uniques = set()
         for _, entity in extract_all_entities(sensor_groups):
             uid = entity.get("unique")
@@ -53,7 +61,7 @@ class TestSensorDefinitions(unittest.TestCase):
                 self.assertNotIn(uid, seen_uniques, f"{name}: Duplicate unique '{uid}' in derived sensors")
                 seen_uniques.add(uid)
 
-        # 3. no duplicate entity name + register
+        # 5. no duplicate entity name + register
         seen_keys = set()
         for _, entity in extract_all_entities(sensor_groups):
             key = (entity.get("name", ""), tuple(entity["register"]))
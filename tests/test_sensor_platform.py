@@ -89,7 +89,7 @@ class TestSensorPlatformSetup:
         controller.derived_sensors = []
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -119,7 +119,7 @@ class TestSensorPlatformSetup:
         controller.derived_sensors = [mock_derived]
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -135,6 +135,34 @@ class TestSensorPlatformSetup:
         assert SENSOR_DERIVED_ENTITIES in hass.data[DOMAIN]
         assert len(hass.data[DOMAIN][SENSOR_DERIVED_ENTITIES]) == 1
 
+    @pytest.mark.asyncio
+    async def test_async_setup_entry_adds_entities_in_one_batch(self):
+        """Test that regular and derived sensors are registered with a single call."""
+        controller = create_mock_controller()
+        mock_sensor = create_mock_base_sensor(name="Sensor 1", registrars=[33000], controller=controller)
+        mock_group = MagicMock()
+        mock_group.sensors = [mock_sensor]
+        controller.sensor_groups = [mock_group]
+        controller.derived_sensors = [
+            create_mock_base_sensor(name="Derived Sensor", registrars=[33100, 33101], controller=controller)
+        ]
+
+        hass = MagicMock()
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
+
+        config_entry = MagicMock()
+        config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
+        config_entry.options = {}
+
+        async_add_entities = MagicMock()
+
+        await async_setup_entry(hass, config_entry, async_add_entities)
+
+        async_add_entities.assert_called_once()
+        entities, update_before_add = async_add_entities.call_args[0]
+        assert len(entities) == 2
+        assert update_before_add is True
+
 
 class TestSungrowSensor:
     """Test SungrowSensor entity behavior."""
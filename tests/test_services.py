@@ -23,7 +23,7 @@ async def test_service_write_holding_register(hass: HomeAssistant, mock_controll
 
     # Store controller
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][CONTROLLER] = {"1.2.3.4_1": mock_controller}
+    hass.data[DOMAIN][CONTROLLER] = {("1.2.3.4", 1): mock_controller}
 
     with patch("custom_components.sungrow_modbus.get_controller", return_value=mock_controller):
         # Register the services (requires setting up the integration or manually registering)
@@ -45,7 +45,7 @@ async def test_service_write_holding_register_no_host(hass: HomeAssistant, mock_
     from custom_components.sungrow_modbus.const import CONTROLLER
 
     # Store controller in hass.data
-    hass.data[DOMAIN] = {CONTROLLER: {"1.2.3.4_1": mock_controller}}
+    hass.data[DOMAIN] = {CONTROLLER: {("1.2.3.4", 1): mock_controller}}
 
     from custom_components.sungrow_modbus import async_setup
 
@@ -77,7 +77,7 @@ async def test_service_set_time(hass: HomeAssistant):
 
     hass.data.setdefault(DOMAIN, {})
     # TIME_ENTITIES is now a dict keyed by controller_key for multi-inverter support
-    hass.data[DOMAIN][TIME_ENTITIES] = {"1.2.3.4:502_1": [mock_entity]}
+    hass.data[DOMAIN][TIME_ENTITIES] = {("1.2.3.4:502", 1): [mock_entity]}
 
     from custom_components.sungrow_modbus import async_setup
 
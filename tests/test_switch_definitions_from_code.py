@@ -23,7 +23,7 @@ async def test_switch_bit_position_requires_combinations_are_unique():
 
     hass = MagicMock()
     hass.create_task = MagicMock()
-    hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+    hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
     config_entry = MagicMock()
     config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -67,7 +67,7 @@ async def test_hybrid_switch_entities_created():
 
     hass = MagicMock()
     hass.create_task = MagicMock()
-    hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+    hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
     config_entry = MagicMock()
     config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -106,7 +106,7 @@ async def test_string_inverter_switch_entities():
 
     hass = MagicMock()
     hass.create_task = MagicMock()
-    hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+    hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
     config_entry = MagicMock()
     config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
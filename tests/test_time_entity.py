@@ -47,7 +47,7 @@ class TestTimeEntityPlatformSetup:
         controller = create_mock_controller(inverter_type=InverterType.HYBRID, features={InverterFeature.BATTERY})
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -85,7 +85,7 @@ class TestTimeEntityPlatformSetup:
         )
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -110,7 +110,7 @@ class TestTimeEntityPlatformSetup:
         )
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
@@ -132,7 +132,7 @@ class TestTimeEntityPlatformSetup:
         controller = create_mock_controller(inverter_type=InverterType.HYBRID, features={InverterFeature.BATTERY})
 
         hass = MagicMock()
-        hass.data = {DOMAIN: {CONTROLLER: {"10.0.0.1:502_1": controller}}}
+        hass.data = {DOMAIN: {CONTROLLER: {("10.0.0.1:502", 1): controller}}}
 
         config_entry = MagicMock()
         config_entry.data = {"host": "10.0.0.1", "port": 502, "slave": 1}
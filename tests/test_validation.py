@@ -21,6 +21,7 @@ from custom_components.sungrow_modbus.data.enums import Category, PollSpeed
 from custom_components.sungrow_modbus.sensors.sungrow_base_sensor import (
     DEFAULT_BOUNDS_BY_UNIT,
     SungrowBaseSensor,
+    SungrowSensorGroup,
 )
 from custom_components.sungrow_modbus.sensors.sungrow_number_sensor import SungrowNumberEntity
 from custom_components.sungrow_modbus.sensors.sungrow_select_entity import SungrowSelectEntity
@@ -127,6 +128,11 @@ class TestDefaultBounds:
         assert UnitOfEnergy.KILO_WATT_HOUR in DEFAULT_BOUNDS_BY_UNIT
         assert UnitOfFrequency.HERTZ in DEFAULT_BOUNDS_BY_UNIT
 
+    def test_default_bounds_are_read_only(self):
+        """The shared defaults table can't be modified by a sensor."""
+        with pytest.raises(TypeError):
+            DEFAULT_BOUNDS_BY_UNIT[PERCENTAGE] = (0, 1)
+
     def test_percentage_defaults_to_0_100(self):
         """Percentage sensors should default to 0-100 range."""
         sensor = create_sensor(unit_of_measurement=PERCENTAGE)
@@ -311,6 +317,71 @@ class TestReadValidation:
         assert result == 65000
         assert "above maximum" not in caplog.text
 
+    def test_bounds_check_only_bound_when_needed(self):
+        """Unbounded, mapped and string sensors skip the bounds check on every read."""
+        assert create_sensor(min_value=0)._check_bounds
+        assert create_sensor(max_value=100)._check_bounds
+        assert not create_sensor()._check_bounds
+        assert not create_sensor(min_value=0, max_value=10, value_mapping="running_state")._check_bounds
+        assert not create_sensor(registers=[5000, 5001], multiplier=0, min_value=0)._check_bounds
+
+
+class TestSequentialRegistrars:
+    """Test the register gap check run when a sensor group is built."""
+
+    @staticmethod
+    def build_group(registers):
+        definition = {"entities": [{"name": f"R{r}", "register": [str(r)], "unique": f"r{r}"} for r in registers]}
+        return SungrowSensorGroup(create_mock_hass(), definition, create_mock_controller())
+
+    def test_contiguous_group_logs_nothing(self, caplog):
+        """A gap-free group takes the fast path and logs no error."""
+        with caplog.at_level(logging.ERROR):
+            self.build_group([5000, 5001, 5002])
+        assert "Registrar sequence error" not in caplog.text
+
+    def test_gap_is_reported_with_both_sides(self, caplog):
+        """Each gap is logged with the registers on either side of it."""
+        with caplog.at_level(logging.ERROR):
+            self.build_group([5000, 5001, 5004, 5005])
+        assert "Found gap between 5001 and 5004" in caplog.text
+        assert caplog.text.count("Registrar sequence error") == 1
+
+
+class TestRegisterDecoding:
+    """Test the decoder picked for each register layout."""
+
+    @pytest.mark.parametrize(
+        ("registers", "multiplier", "signed", "raw", "expected"),
+        [
+            ([5000], 1, False, [65535], 65535),
+            ([5000], 0.1, False, [505], pytest.approx(50.5)),
+            ([5000], 1, True, [65535], -1),
+            ([5000], 0.1, True, [65526], pytest.approx(-1.0)),
+            ([5000, 5001], 1, False, [0xFFFF, 0xFFFE], -2),
+            ([5000, 5001], 0.01, False, [0x0001, 0x0000], pytest.approx(655.36)),
+            ([5000, 5001], 0, False, [0x4142, 0x4300], "ABC"),
+        ],
+    )
+    def test_layouts(self, registers, multiplier, signed, raw, expected):
+        """Each layout decodes the same way the generic conversion did."""
+        sensor = create_sensor(registers=registers, multiplier=multiplier, signed=signed)
+        assert sensor._convert_raw_value(raw) == expected
+
+    def test_missing_register_returns_none(self):
+        """A register that hasn't been read yet yields no value."""
+        sensor = create_sensor(registers=[5000, 5001], multiplier=0.1)
+        assert sensor._convert_raw_value([1, None]) is None
+        assert create_sensor(signed=True)._convert_raw_value([None]) is None
+        assert create_sensor(registers=[5000, 5001], multiplier=0)._convert_raw_value([0x4142, None]) is None
+
+    def test_sensor_is_slotted(self):
+        """Base sensors carry no per-instance __dict__."""
+        sensor = create_sensor()
+        assert not hasattr(sensor, "__dict__")
+        with pytest.raises(AttributeError):
+            sensor.unexpected = 1
+
 
 class TestNumberEntityWriteValidation:
     """Test number entity write validation (blocking invalid writes)."""